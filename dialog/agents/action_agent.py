@@ -1,8 +1,11 @@
 import requests
 import time
 import json
+import logging
 from typing import Dict, List, Optional
 
+logger = logging.getLogger(f"rescue.{__name__}")
+
 class ActionAgent:
     """
     LLM-powered agent responsible for deciding the robot's next action.
@@ -16,7 +19,8 @@ class ActionAgent:
     - Escalate priority levels
     """
 
-    def __init__(self, model_name: str, ollama_base_url: str = "http://localhost:11434", verbose: bool = True):
+    def __init__(self, model_name: str, ollama_base_url: str = "http://localhost:11434", verbose: bool = True,
+                 session: requests.Session = None):
         """
         Initialize the Action Agent with Ollama model.
         
@@ -24,17 +28,21 @@ class ActionAgent:
             model_name: Name of the model in Ollama
             ollama_base_url: Base URL for Ollama API
             verbose: Whether to print detailed logging
+            session: HTTP session for the Ollama calls; share one between agents to reuse its connections
         """
         self.model_name = model_name
         self.ollama_url = f"{ollama_base_url}/api/generate"
         self.verbose = verbose
+        self.session = session or requests.Session()
 
-    def decide_next_action(self, prompt: str) -> dict:
+    def decide_next_action(self, prompt: str, prefix: str = "") -> dict:
         """
         Use LLM to determine the robot's next action based on context and conversation history.
 
         Args:
             prompt: String containing context and conversation history
+            prefix: Turn-invariant instructions sent ahead of ``prompt``; keeping it
+                byte-identical between calls lets Ollama reuse its cached prefix
 
         Returns:
             Dictionary with keys:
@@ -52,7 +60,7 @@ class ActionAgent:
         
         payload = {
             "model": self.model_name,
-            "prompt": prompt,
+            "prompt": prefix + prompt,
             "stream": False,
             "temperature": 0.1,
             "max_tokens": 200,  # Increased for more detailed output
@@ -61,14 +69,14 @@ class ActionAgent:
 
         try:
             start_time = time.time()
-            response = requests.post(self.ollama_url, json=payload, timeout=180)
+            response = self.session.post(self.ollama_url, json=payload, timeout=180)
             response.raise_for_status()
             response_data = response.json()
             llm_output = response_data.get("response", "").strip()
             elapsed = time.time() - start_time
             
             if self.verbose:
-                print(f"[LLM] ActionAgent latency: {elapsed:.2f}s")
+                logger.info("[LLM] ActionAgent latency: %.2fs", elapsed)
 
             # Try to parse JSON from LLM output (robust to markdown fences and extra text)
             parsed = self._parse_action_json(llm_output)
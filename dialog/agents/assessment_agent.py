@@ -1,8 +1,25 @@
+import hashlib
 import json
-from typing import Dict, List, Any
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Tuple
 import requests
 import time
 
+logger = logging.getLogger(f"rescue.{__name__}")
+
+# Extractions shared by every AssessmentAgent in the process: for a given model
+# and extraction prompt the request only depends on the question and the reply,
+# so a reply seen before (ignoring case and spacing) is not sent to the LLM again
+EXTRACTION_CACHE_SIZE = 256
+_extraction_cache: "OrderedDict[Tuple[str, str, str, str], dict]" = OrderedDict()
+_extraction_cache_lock = threading.Lock()
+
+
+def _normalize_text(text: str) -> str:
+    return " ".join(text.lower().split())
+
 class AssessmentAgent:
     """
     LLM-powered agent responsible for analyzing victim responses during Phase 1 (initial assessment).
@@ -16,7 +33,8 @@ class AssessmentAgent:
     - People in surroundings
     """
     
-    def __init__(self, model_name: str, assessment_prompt_path: str, ollama_base_url: str = "http://localhost:11434"):
+    def __init__(self, model_name: str, assessment_prompt_path: str, ollama_base_url: str = "http://localhost:11434",
+                 session: requests.Session = None):
         """
         Initialize the Assessment Agent with Ollama model.
         
@@ -24,12 +42,16 @@ class AssessmentAgent:
             model_name: Name of the model in Ollama (e.g., "gemma3:12b")
             assessment_prompt_path: Path to the assessment prompt file
             ollama_base_url: Base URL for Ollama API (default: http://localhost:11434)
+            session: HTTP session for the Ollama calls; share one between agents to reuse its connections
         """
         self.model_name = model_name
+        self.session = session or requests.Session()
         self.ollama_url = f"{ollama_base_url}/api/generate"
         
         with open(assessment_prompt_path, 'r') as f:
             self.assessment_prompt = f.read()
+        # Agents loaded with different prompt files (e.g. per language) never share extractions
+        self._prompt_digest = hashlib.sha1(self.assessment_prompt.encode('utf-8')).hexdigest()
             
         # Initialize with "unknown" instead of empty strings
         self.assessment = {
@@ -44,6 +66,10 @@ class AssessmentAgent:
         
         # Track which categories have been explicitly assessed
         self.assessed_categories = set()
+        # Bumped by update_assessment(); the next priority field is only
+        # recomputed when it changed
+        self._version = 0
+        self._next_field = (-1, "")
         
         self.assessment_priority = [
             "injuries",               # 1. Most critical
@@ -69,6 +95,17 @@ class AssessmentAgent:
         Returns:
             Dictionary of updates to the assessment form (validated and cleaned)
         """
+        # Raw extractions are cached; validation always runs against the current form
+        cache_key = (self.model_name, self._prompt_digest,
+                     _normalize_text(robot_question), _normalize_text(victim_response))
+        with _extraction_cache_lock:
+            updates = _extraction_cache.get(cache_key)
+            if updates is not None:
+                _extraction_cache.move_to_end(cache_key)
+        if updates is not None:
+            logger.info("[LLM] AssessmentAgent: reusing extraction for an identical reply")
+            return self._validate_updates(dict(updates))
+        
         prompt = self._build_assessment_prompt(robot_question, victim_response)
         
         try:
@@ -84,19 +121,24 @@ class AssessmentAgent:
             }
             
             start_time = time.time()
-            response = requests.post(self.ollama_url, json=payload, timeout=180)  # Added timeout
+            response = self.session.post(self.ollama_url, json=payload, timeout=180)  # Added timeout
             
             if response.status_code == 200:
                 response_data = response.json()
                 response_text = response_data.get("response", "").strip()
                 elapsed = time.time() - start_time
-                print(f"[LLM] AssessmentAgent latency: {elapsed:.2f}s")
+                logger.info("[LLM] AssessmentAgent latency: %.2fs", elapsed)
                 
                 # Extract and validate JSON
                 updates = self._extract_json(response_text)
+                if updates:  # {} may be a parse failure, so it is retried next time
+                    with _extraction_cache_lock:
+                        _extraction_cache[cache_key] = dict(updates)
+                        if len(_extraction_cache) > EXTRACTION_CACHE_SIZE:
+                            _extraction_cache.popitem(last=False)
                 validated_updates = self._validate_updates(updates)
 
-                print("This is the validated updates: ",validated_updates)
+                logger.debug("Validated updates: %s", validated_updates)
                 
                 return validated_updates
             else:
@@ -182,7 +224,7 @@ class AssessmentAgent:
             # Skip if trying to update with the same value
             current_value = self.assessment[field]
             if current_value == value:
-                print(f"[INFO] Field '{field}' already has value '{value}', skipping")
+                logger.debug("Field '%s' already has value '%s', skipping", field, value)
                 continue
             
             # Valid update
@@ -231,7 +273,7 @@ If no information can be extracted, return: {{}}
             if current_value == "unknown":
                 self.assessment[key] = value
                 self.assessed_categories.add(key)
-                print(f"[ASSESSMENT UPDATE] {key}: unknown → {value}")
+                logger.info("[ASSESSMENT UPDATE] %s: unknown → %s", key, value)
             
             # Update existing value (append if it's additional info)
             elif value != current_value:
@@ -240,12 +282,12 @@ If no information can be extracted, return: {{}}
                     # Check if this is genuinely new information
                     if not self._is_duplicate_info(current_value, value):
                         self.assessment[key] = f"{current_value}; {value.replace('yes - ', '')}"
-                        print(f"[ASSESSMENT UPDATE] {key}: Added new injury info")
+                        logger.info("[ASSESSMENT UPDATE] %s: Added new injury info", key)
                 else:
                     # For other fields, replace if we have better/new information
                     self.assessment[key] = value
                     self.assessed_categories.add(key)
-                    print(f"[ASSESSMENT UPDATE] {key}: {current_value} → {value}")
+                    logger.info("[ASSESSMENT UPDATE] %s: %s → %s", key, current_value, value)
             
             # Mark as assessed
             self.assessed_categories.add(key)
@@ -256,7 +298,11 @@ If no information can be extracted, return: {{}}
             if "yes" in stuck_status and self.assessment["can_walk"] == "unknown":
                 self.assessment["can_walk"] = "No - victim is stuck/trapped"
                 self.assessed_categories.add("can_walk")
-                print(f"[ASSESSMENT UPDATE] can_walk: Automatically set to 'No' (victim is trapped)")
+                logger.info("[ASSESSMENT UPDATE] can_walk: Automatically set to 'No' (victim is trapped)")
+        
+        # Bumped only once the form is complete: a reader racing this update
+        # caches its result under the old version, which this invalidates
+        self._version += 1
     
     def _is_duplicate_info(self, existing: str, new: str) -> bool:
         """
@@ -288,10 +334,7 @@ If no information can be extracted, return: {{}}
     
     def is_assessment_complete(self) -> bool:
         """Check if assessment is complete (all priority fields assessed)"""
-        for field in self.assessment_priority:
-            if field not in self.assessed_categories:
-                return False
-        return True
+        return not self.get_next_priority_field()
         
     def get_next_priority_field(self) -> str:
         """
@@ -300,10 +343,15 @@ If no information can be extracted, return: {{}}
         Returns:
             Name of the next field to assess, or empty string if all are complete
         """
-        for field in self.assessment_priority:
-            if field not in self.assessed_categories:
-                return field
-        return ""
+        version, next_field = self._next_field
+        if version != self._version:
+            next_field = ""
+            for field in self.assessment_priority:
+                if field not in self.assessed_categories:
+                    next_field = field
+                    break
+            self._next_field = (self._version, next_field)
+        return next_field
     
     def get_assessment_status(self) -> Dict[str, Any]:
         """
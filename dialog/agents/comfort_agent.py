@@ -1,15 +1,19 @@
 import requests
 import time
 import json
+import logging
 from typing import Dict, List, Optional
 
+logger = logging.getLogger(f"rescue.{__name__}")
+
 class ComfortAgent:
     """
     LLM-powered agent responsible for calming victims through empathetic small talk
     and gathering additional context-sensitive information (medical needs, special conditions, etc.)
     """
     
-    def __init__(self, model_name: str, comfort_prompt_path: str, ollama_base_url: str = "http://localhost:11434",language: str = 'en'):
+    def __init__(self, model_name: str, comfort_prompt_path: str, ollama_base_url: str = "http://localhost:11434",language: str = 'en',
+                 session: requests.Session = None):
         """
         Initialize the Comfort Agent with Ollama model.
         
@@ -17,10 +21,12 @@ class ComfortAgent:
             model_name: Name of the model in Ollama
             comfort_prompt_path: Path to the comfort prompt file
             ollama_base_url: Base URL for Ollama API
+            session: HTTP session for the Ollama calls; share one between agents to reuse its connections
         """
         self.model_name = model_name
         self.ollama_url = f"{ollama_base_url}/api/generate"
         self.language = language
+        self.session = session or requests.Session()
         
         with open(comfort_prompt_path, 'r') as f:
             self.comfort_prompt = f.read()
@@ -94,13 +100,13 @@ class ComfortAgent:
             }
             
             start_time = time.time()
-            response = requests.post(self.ollama_url, json=payload, timeout=180)
+            response = self.session.post(self.ollama_url, json=payload, timeout=180)
             
             if response.status_code == 200:
                 response_data = response.json()
                 response_text = response_data.get("response", "").strip()
                 elapsed = time.time() - start_time
-                print(f"[LLM] ComfortAgent latency: {elapsed:.2f}s")
+                logger.info("[LLM] ComfortAgent latency: %.2fs", elapsed)
                 
                 # Clean up response
                 if response_text.startswith("Robot:"):
@@ -153,13 +159,13 @@ class ComfortAgent:
             }
             
             start_time = time.time()
-            response = requests.post(self.ollama_url, json=payload, timeout=180)
+            response = self.session.post(self.ollama_url, json=payload, timeout=180)
             
             if response.status_code == 200:
                 response_data = response.json()
                 response_text = response_data.get("response", "").strip()
                 elapsed = time.time() - start_time
-                print(f"[LLM] ComfortAgent needs analysis latency: {elapsed:.2f}s")
+                logger.info("[LLM] ComfortAgent needs analysis latency: %.2fs", elapsed)
                 
                 # Extract and validate JSON
                 updates = self._extract_json(response_text)
@@ -377,13 +383,13 @@ If no information is found, return an empty object: {}
             if current_value == "unknown":
                 self.special_needs[key] = value
                 self.assessed_needs.add(key)
-                print(f"[COMFORT AGENT UPDATE] {key}: unknown → {value}")
+                logger.info("[COMFORT AGENT UPDATE] %s: unknown → %s", key, value)
             
             # Update existing value (append if it's additional info)
             elif value != current_value:
                 self.special_needs[key] = value
                 self.assessed_needs.add(key)
-                print(f"[COMFORT AGENT UPDATE] {key}: {current_value} → {value}")
+                logger.info("[COMFORT AGENT UPDATE] %s: %s → %s", key, current_value, value)
     
     def get_next_priority_need(self) -> str:
         """
@@ -24,7 +24,8 @@ class ComfortAssessmentAgent:
     and conditions during the comfort phase.
     """
     
-    def __init__(self, model_name: str, assessment_prompt_path: str, ollama_base_url: str = "http://localhost:11434"):
+    def __init__(self, model_name: str, assessment_prompt_path: str, ollama_base_url: str = "http://localhost:11434",
+                 session: requests.Session = None):
         """
         Initialize the ComfortAssessmentAgent
         
@@ -32,9 +33,11 @@ class ComfortAssessmentAgent:
             model_name: Name of the LLM model to use
             assessment_prompt_path: Path to the assessment prompt file
             ollama_base_url: Base URL for Ollama API
+            session: HTTP session for the Ollama calls; share one between agents to reuse its connections
         """
         self.model_name = model_name
         self.ollama_base_url = ollama_base_url
+        self.session = session or requests.Session()
         
         # Load assessment prompt
         with open(assessment_prompt_path, 'r') as f:
@@ -68,6 +71,10 @@ class ComfortAssessmentAgent:
         
         # Track what's been assessed
         self.assessed_fields = set()
+        # Bumped whenever special_needs or assessed_fields change; the progress
+        # checks below are only recomputed when it changed
+        self._version = 0
+        self._progress = (-1, None, False)
     
     def analyze_victim_response(self, robot_question: str, victim_response: str) -> dict:
         """
@@ -120,7 +127,7 @@ If NO new information is found, return an empty JSON object: {{}}
 JSON OUTPUT:"""
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.ollama_base_url}/api/generate",
                 json={
                     "model": self.model_name,
@@ -142,6 +149,7 @@ JSON OUTPUT:"""
                 for field in updates.keys():
                     if field in self.special_needs:
                         self.assessed_fields.add(field)
+                self._version += 1
                 
                 return updates
             else:
@@ -193,6 +201,8 @@ JSON OUTPUT:"""
                     self.special_needs[key] = f"{current}; {value}"
                 else:
                     self.special_needs[key] = value
+        # After the mutation, so a racing reader's cached progress is invalidated
+        self._version += 1
     
     def get_special_needs(self) -> dict:
         """
@@ -210,10 +220,7 @@ JSON OUTPUT:"""
         Returns:
             Field name or None if all assessed
         """
-        for field in self.priority_fields:
-            if field not in self.assessed_fields and self.special_needs[field] == "unknown":
-                return field
-        return None
+        return self._current_progress()[1]
     
     def is_assessment_complete(self) -> bool:
         """
@@ -222,10 +229,21 @@ JSON OUTPUT:"""
         Returns:
             True if all priority fields have been assessed
         """
-        # Consider complete if top 5 priority fields are assessed
-        top_priority = self.priority_fields[:5]
-        assessed_count = sum(1 for field in top_priority if field in self.assessed_fields)
-        return assessed_count >= 4  # At least 4 of top 5
+        return self._current_progress()[2]
+    
+    def _current_progress(self) -> tuple:
+        """(version, next priority field, complete) for the current assessment"""
+        if self._progress[0] != self._version:
+            next_field = None
+            for field in self.priority_fields:
+                if field not in self.assessed_fields and self.special_needs[field] == "unknown":
+                    next_field = field
+                    break
+            # Consider complete if top 5 priority fields are assessed
+            top_priority = self.priority_fields[:5]
+            assessed_count = sum(1 for field in top_priority if field in self.assessed_fields)
+            self._progress = (self._version, next_field, assessed_count >= 4)  # At least 4 of top 5
+        return self._progress
     
     def get_assessment_status(self) -> dict:
         """
@@ -1,7 +1,12 @@
 from typing import Dict, List, Optional
+import json
+import logging
+import threading
 import requests
 import time
 
+logger = logging.getLogger(f"rescue.{__name__}")
+
 
 class DialogueAgent:
     """
@@ -31,7 +36,8 @@ class DialogueAgent:
         dialogue_prompt_path: str,
         empathy_level: str = "medium",
         ollama_base_url: str = "http://localhost:11434",
-        language: str = 'en'
+        language: str = 'en',
+        session: requests.Session = None
     ):
         """
         Initialize the Dialogue Agent with Ollama Gemma model.
@@ -41,10 +47,12 @@ class DialogueAgent:
             dialogue_prompt_path: Path to the base dialogue prompt file
             empathy_level: Communication style - "low", "medium", or "high"
             ollama_base_url: Base URL for Ollama API (default: localhost:11434)
+            session: HTTP session for the Ollama calls; share one between agents to reuse its connections
         """
 
         self.model_name = model_name
         self.ollama_url = f"{ollama_base_url}/api/generate"
+        self.session = session or requests.Session()
         self.empathy_level = empathy_level
         self.language = language
         self.all_final_messages = self._define_messages()
@@ -131,9 +139,7 @@ class DialogueAgent:
             Opening message adapted to empathy level
         """
 
-        print("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx")
-        print(f"THIS IS THE MODEL NAME: {self.model_name}")
-        print("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx")
+        logger.debug("DialogueAgent model: %s", self.model_name)
         if self.language == 'en':
             greetings = {
                 "low": "Hello. Are you injured?",
@@ -182,16 +188,9 @@ class DialogueAgent:
         if self.situation_context:
             prompt_parts.append(f"\nSITUATION CONTEXT:\n{self.situation_context}")
         
-        # 3. Current assessment state
-        prompt_parts.append("\nCURRENT ASSESSMENT:")
-        if assessment:
-            for key, value in assessment.items():
-                if value and value != "unknown":
-                    prompt_parts.append(f"- {key}: {value}")
-        else:
-            prompt_parts.append("- No information collected yet")
-        
-        # 4. Conversation history
+        # 3. Conversation history
+        # Kept ahead of the assessment so instructions + context + history only
+        # ever grow at the tail, letting Ollama reuse the cached prompt prefix
         prompt_parts.append("\nCONVERSATION HISTORY:")
         if self.conversation_history:
             for entry in self.conversation_history:
@@ -200,6 +199,15 @@ class DialogueAgent:
         else:
             prompt_parts.append("(This is the start of the conversation)")
         
+        # 4. Current assessment state
+        prompt_parts.append("\nCURRENT ASSESSMENT:")
+        if assessment:
+            for key, value in assessment.items():
+                if value and value != "unknown":
+                    prompt_parts.append(f"- {key}: {value}")
+        else:
+            prompt_parts.append("- No information collected yet")
+        
         # 5. Instructions for next response
         prompt_parts.append("\nINSTRUCTIONS FOR NEXT RESPONSE:")
         if next_field:
@@ -264,12 +272,14 @@ class DialogueAgent:
     
     # ===== LLM Response Generation =====
     
-    def get_llm_response(self, prompt: str) -> str:
+    def get_llm_response(self, prompt: str, cancel: Optional[threading.Event] = None) -> str:
         """
         Generate a response from the Ollama LLM with proper error handling
         
         Args:
             prompt: Complete prompt to send to the LLM
+            cancel: If given, the reply is streamed and abandoned as soon as this
+                is set; closing the connection stops Ollama generating it
             
         Returns:
             Generated response text, or fallback message if error occurs
@@ -278,7 +288,7 @@ class DialogueAgent:
             payload = {
                 "model": self.model_name,
                 "prompt": prompt,
-                "stream": False,
+                "stream": cancel is not None,
                 "options": {
                     "temperature": 0.4,  # Lower temperature for more consistent responses
                     "top_p": 0.9,
@@ -288,13 +298,20 @@ class DialogueAgent:
             }
             
             start_time = time.time()
-            response = requests.post(self.ollama_url, json=payload, timeout=180)  # Added timeout
+            response = self.session.post(self.ollama_url, json=payload, timeout=180,  # Added timeout
+                                         stream=cancel is not None)
             
             if response.status_code == 200:
-                response_data = response.json()
-                response_text = response_data.get("response", "").strip()
+                if cancel is None:
+                    response_data = response.json()
+                    response_text = response_data.get("response", "").strip()
+                else:
+                    response_text = self._read_streamed_response(response, cancel)
+                    if response_text is None:
+                        logger.info("[LLM] DialogueAgent request cancelled after %.2fs", time.time() - start_time)
+                        return False
                 elapsed = time.time() - start_time
-                print(f"[LLM] DialogueAgent latency: {elapsed:.2f}s")
+                logger.info("[LLM] DialogueAgent latency: %.2fs", elapsed)
                 
                 # Clean response
                 response_text = self._clean_response(response_text)
@@ -323,6 +340,26 @@ class DialogueAgent:
             print(f"[ERROR] DialogueAgent: Unexpected error - {type(e).__name__}: {e}")
             return False
     
+    def _read_streamed_response(self, response: requests.Response, cancel: threading.Event) -> Optional[str]:
+        """
+        Join a streamed Ollama reply, checking cancel between chunks
+        
+        Returns:
+            The full response text, or None if cancel was set before it completed
+        """
+        parts = []
+        with response:
+            for line in response.iter_lines():
+                if cancel.is_set():
+                    return None
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                parts.append(chunk.get("response", ""))
+                if chunk.get("done"):
+                    break
+        return "".join(parts).strip()
+    
     def _clean_response(self, text: str) -> str:
         """
         Clean LLM response by removing unwanted prefixes and formatting
@@ -34,7 +34,8 @@ class TriageAgent:
         self,
         model_name: str,
         triage_prompt_path: str,
-        ollama_base_url: str = "http://localhost:11434"
+        ollama_base_url: str = "http://localhost:11434",
+        session: requests.Session = None
     ):
         """
         Initialize the Triage Agent with Ollama model.
@@ -43,9 +44,11 @@ class TriageAgent:
             model_name: Name of the model in Ollama (e.g., "gemma3:12b")
             triage_prompt_path: Path to the triage prompt file
             ollama_base_url: Base URL for Ollama API (default: localhost:11434)
+            session: HTTP session for the Ollama calls; share one between agents to reuse its connections
         """
         self.model_name = model_name
         self.ollama_url = f"{ollama_base_url}/api/generate"
+        self.session = session or requests.Session()
         
         # Load triage prompt
         try:
@@ -115,7 +118,7 @@ class TriageAgent:
             }
             
             start_time = time.time()
-            response = requests.post(self.ollama_url, json=payload, timeout=180)  # Added timeout
+            response = self.session.post(self.ollama_url, json=payload, timeout=180)  # Added timeout
             
             if response.status_code == 200:
                 response_data = response.json()
@@ -6,7 +6,8 @@ class VictimAgent:
     LLM-powered agent responsible for simulating victim responses in a disaster scenario.
     """
 
-    def __init__(self, model_name: str, victim_prompt_path: str, victim_info_path: str, ollama_base_url: str = "http://localhost:11434"):
+    def __init__(self, model_name: str, victim_prompt_path: str, victim_info_path: str, ollama_base_url: str = "http://localhost:11434",
+                 session: requests.Session = None):
         """
         Initialize the Victim Agent with Ollama model.
         
@@ -15,9 +16,11 @@ class VictimAgent:
             victim_prompt_path: Path to the victim system prompt file
             victim_info_path: Path to the victim info JSON file
             ollama_base_url: Base URL for Ollama API
+            session: HTTP session for the Ollama calls; share one between agents to reuse its connections
         """
         self.model_name = model_name
         self.ollama_url = f"{ollama_base_url}/api/generate"
+        self.session = session or requests.Session()
         
         with open(victim_prompt_path, 'r') as f:
             self.victim_prompt = f.read().strip()
@@ -47,7 +50,7 @@ class VictimAgent:
                 "max_tokens": 150
             }
             
-            response = requests.post(self.ollama_url, json=payload, timeout=180)
+            response = self.session.post(self.ollama_url, json=payload, timeout=180)
             if response.status_code == 200:
                 response_data = response.json()
                 victim_response = response_data.get("response", "").strip()
@@ -6,9 +6,26 @@ about the robot's next action based on current assessment state, conversation co
 and phase-specific criteria.
 """
 
+from functools import lru_cache
 from typing import Dict, Optional, List
 
 
+# Output contract for the Action Agent. Part of the static prefix, so it sits
+# ahead of the per-turn state rather than after it.
+_DECISION_FORMAT = """
+You MUST respond with ONLY a valid JSON object (no markdown fences, no explanation):
+
+{
+  "primary_action": "continue_conversation" | "transition_to_phase_2" | "evacuate_immediately" | "abort_and_alert" | "complete",
+  "alert_command_center": true | false,
+  "urgency_level": "routine" | "priority" | "critical" | "emergency",
+  "reasoning": "Brief justification for your decision (1-2 sentences)",
+  "next_phase": 2 | null,
+  "specialized_equipment_needed": [] | ["stretcher", "cutting_tools", "medical_supplies", etc.]
+}
+"""
+
+
 def build_action_decision_prompt(
     phase: int,
     assessment: Dict[str, str],
@@ -33,7 +50,27 @@ def build_action_decision_prompt(
     Returns:
         Complete prompt string for Action Agent
     """
+    return build_static_prefix(phase, situation_context) + build_dynamic_suffix(
+        phase, assessment, comfort_assessment, conversation_history, turn_number, phase_turn_number
+    )
+
+
+@lru_cache(maxsize=8)
+def build_static_prefix(phase: int, situation_context: str = "") -> str:
+    """
+    Build the part of the prompt that is identical on every turn of a phase.
     
+    The result is byte-for-byte stable for a given (phase, situation_context),
+    so Ollama can reuse the prompt's cached KV prefix between turns instead of
+    re-evaluating the instructions each time.
+    
+    Args:
+        phase: Current phase (1 or 2)
+        situation_context: Disaster situation description
+        
+    Returns:
+        Prompt prefix, ending with a newline
+    """
     # Load base action prompt
     try:
         with open('prompts/action_prompt.txt', 'r', encoding='utf-8') as f:
@@ -50,11 +87,42 @@ def build_action_decision_prompt(
         prompt_parts.append(f"{'='*80}")
         prompt_parts.append(situation_context)
     
-    # Add current state information
+    # Add output format instructions
     prompt_parts.append(f"\n{'='*80}")
-    prompt_parts.append("CURRENT STATE:")
+    prompt_parts.append("YOUR DECISION (JSON FORMAT):")
     prompt_parts.append(f"{'='*80}")
+    prompt_parts.append(_DECISION_FORMAT)
+    
+    prompt_parts.append(f"\n{'='*80}")
     prompt_parts.append(f"Phase: {phase} ({'Assessment' if phase == 1 else 'Comfort & Special Needs'})")
+    
+    return "\n".join(prompt_parts) + "\n"
+
+
+def build_dynamic_suffix(
+    phase: int,
+    assessment: Dict[str, str],
+    comfort_assessment: Optional[Dict[str, str]],
+    conversation_history: List[Dict],
+    turn_number: int,
+    phase_turn_number: int
+) -> str:
+    """
+    Build the per-turn part of the prompt: turn counters, assessments,
+    recent conversation and the decision criteria they trigger.
+    
+    Assessment fields are listed in sorted order so identical states always
+    serialize to identical text.
+    
+    Returns:
+        Prompt suffix to append to build_static_prefix()
+    """
+    prompt_parts = []
+    
+    # Add current state information
+    prompt_parts.append(f"{'='*80}")
+    prompt_parts.append("CURRENT STATE:")
+    prompt_parts.append(f"{'='*80}")
     prompt_parts.append(f"Total Turn Number: {turn_number}")
     prompt_parts.append(f"Phase Turn Number: {phase_turn_number}")
     
@@ -64,7 +132,7 @@ def build_action_decision_prompt(
     prompt_parts.append(f"{'='*80}")
     
     if assessment:
-        for key, value in assessment.items():
+        for key, value in sorted(assessment.items()):
             if key not in ['priority', 'gps_location']:  # Exclude internal fields
                 status_indicator = "✓" if value and value != "unknown" else "?"
                 prompt_parts.append(f"{status_indicator} {key}: {value}")
@@ -83,7 +151,7 @@ def build_action_decision_prompt(
         prompt_parts.append("PHASE 2 ASSESSMENT (Medical & Special Needs):")
         prompt_parts.append(f"{'='*80}")
         
-        for key, value in comfort_assessment.items():
+        for key, value in sorted(comfort_assessment.items()):
             status_indicator = "✓" if value and value != "unknown" else "?"
             prompt_parts.append(f"{status_indicator} {key}: {value}")
     
@@ -106,24 +174,7 @@ def build_action_decision_prompt(
     else:
         prompt_parts.append(_get_phase_2_decision_criteria(assessment, comfort_assessment))
     
-    # Add output format instructions
-    prompt_parts.append(f"\n{'='*80}")
-    prompt_parts.append("YOUR DECISION (JSON FORMAT):")
-    prompt_parts.append(f"{'='*80}")
-    prompt_parts.append("""
-You MUST respond with ONLY a valid JSON object (no markdown fences, no explanation):
-
-{
-  "primary_action": "continue_conversation" | "transition_to_phase_2" | "evacuate_immediately" | "abort_and_alert" | "complete",
-  "alert_command_center": true | false,
-  "urgency_level": "routine" | "priority" | "critical" | "emergency",
-  "reasoning": "Brief justification for your decision (1-2 sentences)",
-  "next_phase": 2 | null,
-  "specialized_equipment_needed": [] | ["stretcher", "cutting_tools", "medical_supplies", etc.]
-}
-
-Respond with ONLY the JSON object. Do not include any other text.
-""")
+    prompt_parts.append("\nRespond with ONLY the JSON object described above. Do not include any other text.\n")
     
     return "\n".join(prompt_parts)
 
@@ -2,9 +2,16 @@
 Audio Manager Module
 Handles all audio-related functionality including TTS and STT
 """
+import os
 import numpy as np
+import numba
 import pyaudio
 import whisper
+try:
+    from faster_whisper import WhisperModel
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+except ImportError:  # Optional: openai-whisper is the fallback backend
+    WhisperModel = None
 import platform
 import pyttsx3
 import threading
@@ -14,16 +21,122 @@ import time
 import subprocess
 
 
+# Weight/compute precisions selectable for faster-whisper, smallest footprint first
+WHISPER_COMPUTE_TYPES = ("int8", "int8_float16", "int8_float32", "float16", "float32")
+
+
+def load_whisper_model(name: str, device: str, download_root: str = None, compute_type: str = None):
+    """
+    Load a Whisper model, on faster-whisper (CTranslate2) when it is installed
+    
+    faster-whisper runs the model with fused attention kernels, by default in
+    float16 on CUDA and with int8 weights on every CPU core otherwise;
+    compute_type (one of WHISPER_COMPUTE_TYPES) overrides that. Without
+    faster-whisper the openai-whisper PyTorch model is used and compute_type
+    is ignored.
+    """
+    if WhisperModel is not None:
+        if device == "cuda":
+            return WhisperModel(name, device=device, compute_type=compute_type or "float16",
+                                download_root=download_root)
+        return WhisperModel(name, device=device, compute_type=compute_type or "int8",
+                            cpu_threads=os.cpu_count() or 0, download_root=download_root)
+    return whisper.load_model(name, device=device, download_root=download_root)
+
+
+def transcribe_audio(model, audio, language: str = None, fp16: bool = False,
+                     vad_filter: bool = True) -> str:
+    """
+    Transcribe a file path or 16 kHz float32 samples with a model from load_whisper_model()
+    
+    fp16 only applies to the openai-whisper backend; faster-whisper's precision
+    is fixed when the model is loaded. vad_filter=False skips faster-whisper's
+    VAD pass, for audio already reduced to speech by extract_speech().
+    """
+    # Victim replies are short: a single greedy pass at temperature 0, with no
+    # sampled fallbacks, no conditioning on earlier windows and no timestamp tokens
+    if WhisperModel is not None and isinstance(model, WhisperModel):
+        # The VAD skips silent stretches
+        segments, _ = model.transcribe(audio, language=language, beam_size=1, best_of=1, temperature=0.0,
+                                       condition_on_previous_text=False, without_timestamps=True,
+                                       vad_filter=vad_filter)
+        return " ".join(segment.text.strip() for segment in segments).strip()
+    result = model.transcribe(audio, language=language, fp16=fp16, verbose=False, temperature=0.0,
+                              condition_on_previous_text=False, without_timestamps=True)
+    return str(result.get("text", "")).strip()
+
+
+def extract_speech(audio: np.ndarray, sample_rate: int = 16000) -> np.ndarray:
+    """
+    The stretches of ``audio`` that Silero VAD classifies as speech, joined;
+    empty when there are none
+    
+    Uses the ONNX Silero model bundled with faster-whisper (loaded once per
+    process); without faster-whisper the audio is returned unchanged.
+    """
+    if WhisperModel is None:
+        return audio
+    timestamps = get_speech_timestamps(audio, VadOptions(threshold=0.5), sampling_rate=sample_rate)
+    if not timestamps:
+        return audio[:0]
+    return np.concatenate([audio[t["start"]:t["end"]] for t in timestamps])
+
+
+@numba.njit(cache=True, fastmath=True)
+def _frame_rms(samples: np.ndarray) -> float:
+    """Normalized RMS level of 16-bit PCM samples, in a single pass without temporaries"""
+    n = samples.shape[0]
+    if n == 0:
+        return 0.0
+    total = 0.0
+    for i in range(n):
+        x = float(samples[i])
+        total += x * x
+    return np.sqrt(total / n) / 32767.0
+
+
+class AudioBuffer:
+    """
+    Preallocated buffer for one recording of 16-bit mono PCM
+    
+    Sized for the maximum recording duration up front, so every chunk is
+    copied once into place instead of being kept as a separate bytes object
+    and joined at the end.
+    """
+    
+    def __init__(self, seconds: float, sample_rate: int = 16000):
+        self._buf = np.empty(round(seconds * sample_rate), dtype=np.int16)
+        self._w = 0
+    
+    def __len__(self) -> int:
+        return self._w
+    
+    def put(self, data: bytes) -> np.ndarray:
+        """Append a chunk of raw PCM (a trailing odd byte is dropped); returns the samples written"""
+        samples = np.frombuffer(data, dtype=np.int16, count=len(data) // 2)
+        n = min(len(samples), len(self._buf) - self._w)
+        written = self._buf[self._w:self._w + n]
+        written[:] = samples[:n]
+        self._w += n
+        return written
+    
+    def get_all(self) -> np.ndarray:
+        """Recorded audio as float32 in [-1, 1], as Whisper expects"""
+        return self._buf[:self._w].astype(np.float32) / 32768.0
+
+
 class AudioManager:
     """Manages audio recording, speech-to-text, and text-to-speech functionality"""
     
-    def __init__(self, empathy_level: str = "medium", whisper_model: str = "base", language: str = "en",local: bool = True):
+    def __init__(self, empathy_level: str = "medium", whisper_model: str = "base", language: str = "en",local: bool = True,
+                 compute_type: str = None):
         """
         Initialize audio manager with offline capabilities.
         
         Args:
             empathy_level: Level of empathy affecting TTS speed (low, medium, high)
             whisper_model: Whisper model size (tiny, base, small, medium, large)
+            compute_type: faster-whisper precision (see WHISPER_COMPUTE_TYPES); None picks per device
         """
         self.empathy_level = empathy_level
         self.language = language
@@ -42,9 +155,10 @@ class AudioManager:
         # Load Whisper model
         print(f"Loading Whisper model '{whisper_model}' on {device.upper()} for offline speech recognition...")
         if self.local:
-            self.whisper_model = whisper.load_model(whisper_model, device=device)
+            self.whisper_model = load_whisper_model(whisper_model, device, compute_type=compute_type)
         else:
-            self.whisper_model = whisper.load_model(whisper_model,download_root="/models/whisper", device=device)
+            self.whisper_model = load_whisper_model(whisper_model, device, download_root="/models/whisper",
+                                                    compute_type=compute_type)
         print("Whisper model loaded successfully")
         
         # Initialize text-to-speech
@@ -53,6 +167,9 @@ class AudioManager:
         
         # Initialize audio recording
         self.setup_audio_recording()
+        
+        # Microphone stream connected ahead of the next recording (see prepare_stt_stream)
+        self._prepared_stream = None
     
     def setup_tts_voice(self):
         """
@@ -106,6 +223,9 @@ class AudioManager:
         self.channels = 1
         
         self.audio = pyaudio.PyAudio()
+        # Compile (or load from numba's on-disk cache) the silence detector now
+        # rather than on the first chunk of the first recording
+        _frame_rms(np.zeros(self.chunk_size, dtype=np.int16))
         print("Audio recording configured for Whisper (16kHz, mono)")
     
     def record_audio(self, duration: int = 10, silence_threshold: float = 0.01,
@@ -132,32 +252,25 @@ class AudioManager:
                 frames_per_buffer=self.chunk_size
             )
             
-            frames = []
             silence_frames = 0
             silence_threshold_frames = int(silence_duration * self.sample_rate / self.chunk_size)
             max_frames = int(duration * self.sample_rate / self.chunk_size)
+            buffer = AudioBuffer(max_frames * self.chunk_size / self.sample_rate, self.sample_rate)
+            recorded_frames = 0
         
         
             try:
                 for i in range(max_frames):
                     try:
                         data = stream.read(self.chunk_size, exception_on_overflow=False)
-                        frames.append(data)
-                        
-                        audio_data = np.frombuffer(data, dtype=np.int16)
+                        samples = buffer.put(data)
+                        recorded_frames += 1
                         
-                        if len(audio_data) == 0:
-                            rms = 0.0
-                        else:
-                            audio_float = audio_data.astype(np.float32)
-                            mean_square = np.mean(np.square(audio_float))
-                            
-                            rms = np.sqrt(mean_square) if np.isfinite(mean_square) and mean_square >= 0 else 0.0
-                            rms = rms / 32767.0
+                        rms = self._chunk_rms(samples)
                         
                         if rms < silence_threshold:
                             silence_frames += 1
-                            if silence_frames >= silence_threshold_frames and len(frames) > 10:
+                            if silence_frames >= silence_threshold_frames and recorded_frames > 10:
                                 print("Silence detected, stopping recording")
                                 break
                         else:
@@ -173,16 +286,12 @@ class AudioManager:
                 stream.stop_stream()
                 stream.close()
             
-            if not frames:
+            if not len(buffer):
                 print("No audio data recorded")
                 return np.array([])
             
             try:
-                audio_data = b''.join(frames)
-                if len(audio_data) == 0:
-                    return np.array([])
-                    
-                audio_np = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
+                audio_np = buffer.get_all()
                 
                 if not np.isfinite(audio_np).all():
                     print("WARNING: Audio contains invalid values, cleaning...")
@@ -195,43 +304,109 @@ class AudioManager:
                 print(f"Audio conversion error: {conversion_error}")
                 return np.array([])
         else:
-            print(f"Connecting to stream: {self.microphone}")
-        
-            command = [
-                'ffmpeg',
-                '-nostdin',                 # Prevents FFmpeg from trying to read terminal input
-                '-rtsp_transport', 'tcp', 
-                '-i', self.microphone,      # Use the direct IP URL
-                '-t', str(duration),
-                '-f', 's16le',
-                '-acodec', 'pcm_s16le',
-                '-ar', '16000',
-                '-ac', '1',
-                '-'
-            ]
-                        
+            chunk_bytes = self.chunk_size * 2  # s16le mono
+            silence_threshold_frames = int(silence_duration * self.sample_rate / self.chunk_size)
+            max_frames = int(duration * self.sample_rate / self.chunk_size)
+            buffer = AudioBuffer(max_frames * self.chunk_size / self.sample_rate, self.sample_rate)
+            silence_frames = 0
+            heard_speech = False
             try:
-                process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
-                raw_audio, error = process.communicate()
+                prepared, self._prepared_stream = self._prepared_stream, None
+                if prepared is not None:
+                    # Already connected while the robot was speaking; stop discarding
+                    process, recording, drain = prepared
+                    recording.set()
+                    drain.join()
+                else:
+                    print(f"Connecting to stream: {self.microphone}")
+                    process = subprocess.Popen(self._microphone_command(duration),
+                                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+                try:
+                    # The recording is cut short once the victim stops speaking
+                    for _ in range(max_frames):
+                        data = process.stdout.read(chunk_bytes)
+                        if not data:  # Duration cap reached or stream dropped
+                            break
+                        samples = buffer.put(data)
+                        
+                        # Silence only ends the recording once the victim has started
+                        # talking, so a pause before answering is not cut off
+                        if self._chunk_rms(samples) < silence_threshold:
+                            silence_frames += 1
+                            if heard_speech and silence_frames >= silence_threshold_frames:
+                                print("Silence detected, stopping recording")
+                                break
+                        else:
+                            heard_speech = True
+                            silence_frames = 0
+                finally:
+                    if process.poll() is None:
+                        process.terminate()
+                    process.wait()
                 
                 #if process.returncode != 0:
                  #   print(f"STREAM ERROR: Could not connect to {self.microphone}")
                   #  print(f"FFmpeg says: {error.decode()}")
                    # return np.array([])
                 
-                if not raw_audio:
-                    print(f"STDOUT: {raw_audio}")
+                if not len(buffer):
                     print(f"STREAM ERROR: Could not connect to {self.microphone}")
                     return np.array([])
 
                 # Convert to numpy for Whisper
                 print("No problem what so ever")
-                audio_np = np.frombuffer(raw_audio, dtype=np.int16).astype(np.float32) / 32768.0
-                return audio_np
+                return buffer.get_all()
             except Exception as e:
                 print(f"Streaming record error: {e}")
                 return np.array([])   
     
+    def _microphone_command(self, duration: int = None) -> list:
+        """ffmpeg command decoding the microphone stream to 16 kHz mono PCM on stdout"""
+        command = [
+            'ffmpeg',
+            '-nostdin',                 # Prevents FFmpeg from trying to read terminal input
+            '-rtsp_transport', 'tcp', 
+            '-i', self.microphone,      # Use the direct IP URL
+        ]
+        if duration is not None:
+            command += ['-t', str(duration)]
+        return command + [
+            '-f', 's16le',
+            '-acodec', 'pcm_s16le',
+            '-ar', '16000',
+            '-ac', '1',
+            '-'
+        ]
+    
+    def prepare_stt_stream(self):
+        """
+        Connect to the microphone stream ahead of the next recording
+        
+        Call before the robot speaks: the RTSP connection is set up during
+        playback instead of after it, and the audio received until recording
+        starts (the robot's own voice) is discarded. No-op for the local microphone.
+        """
+        if self.local or self._prepared_stream is not None:
+            return
+        print(f"Connecting to stream: {self.microphone}")
+        process = subprocess.Popen(self._microphone_command(),
+                                   stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        recording = threading.Event()
+        
+        def discard():
+            chunk_bytes = self.chunk_size * 2
+            while not recording.is_set():
+                if not process.stdout.read(chunk_bytes):
+                    break
+        
+        drain = threading.Thread(target=discard, name="mic-drain", daemon=True)
+        drain.start()
+        self._prepared_stream = (process, recording, drain)
+    
+    def _chunk_rms(self, audio_data: np.ndarray) -> float:
+        """Normalized RMS level of a chunk of 16-bit PCM samples"""
+        return _frame_rms(audio_data)
+    
     def whisper_speech_to_text(self, audio_data: np.ndarray, language: str = "en") -> str:
         """
         Convert speech to text using Whisper (offline)
@@ -247,16 +422,15 @@ class AudioManager:
             return ""
         
         try:
+            # Whisper only sees the speech; a recording without any is not transcribed
+            speech = extract_speech(audio_data, self.sample_rate)
+            if len(speech) == 0:
+                print("VAD: No speech detected")
+                return ""
+            
             print("Processing speech with Whisper...")
 
-            result = self.whisper_model.transcribe(
-                audio_data,
-                language=language,
-                fp16=False,
-                verbose=False
-            )
-            
-            text = str(result.get("text", "")).strip()
+            text = transcribe_audio(self.whisper_model, speech, language=language, vad_filter=False)
             
             if text:
                 print(f"Whisper transcription: '{text}'")
@@ -269,6 +443,17 @@ class AudioManager:
             print(f"Whisper error: {e}")
             return ""
     
+    def warm_up(self):
+        """
+        Run one transcription of a second of silence, so lazy model, allocator
+        and kernel initialization happens now rather than on the first victim turn
+        """
+        try:
+            transcribe_audio(self.whisper_model, np.zeros(self.sample_rate, dtype=np.float32),
+                             language=self.language, vad_filter=False)
+        except Exception as e:
+            print(f"Whisper warm-up failed: {e}")
+    
     def speech_to_text(self, max_duration: int = 10, retries: int = 1) -> str:
         """
         Convert speech to text using Whisper with retry mechanism
@@ -350,24 +535,37 @@ class AudioManager:
             try:
                 piper_proc = subprocess.Popen(
                     ['piper', '--model', model_path, '--output-raw'],
-                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
                 )
-                audio_bytes, _ = piper_proc.communicate(input=text.encode('utf-8'))
+                piper_proc.stdin.write(text.encode('utf-8'))
+                piper_proc.stdin.close()
 
-                if audio_bytes:
-                    # 2. Get our long-running ffmpeg process
-                    rtsp_pipe = self._get_persistent_ffmpeg()
+                # Piper emits audio sentence by sentence; each piece is streamed as
+                # soon as it is synthesized, so playback overlaps synthesis of the rest
+                rtsp_pipe = None
+                sent = 0
+                while True:
+                    audio_bytes = piper_proc.stdout.read1(65536)
+                    if not audio_bytes:
+                        break
+                    if rtsp_pipe is None:
+                        # 2. Get our long-running ffmpeg process
+                        rtsp_pipe = self._get_persistent_ffmpeg()
+                        started = time.time()
                     
                     # 3. Write the bytes to the server stream
                     rtsp_pipe.stdin.write(audio_bytes)
                     rtsp_pipe.stdin.flush()
-                    
-                    print(f"Sent {len(audio_bytes)} bytes to RTSP stream.")
+                    sent += len(audio_bytes)
+                piper_proc.wait()
 
+                if sent:
+                    print(f"Sent {sent} bytes to RTSP stream.")
                     
-                    # Approximate duration (2 bytes per sample @ 22050Hz)
-                    duration = (len(audio_bytes) / 2) / 22050
-                    time.sleep(duration)
+                    # Approximate duration (2 bytes per sample @ 22050Hz); ffmpeg plays
+                    # in real time (-re), so only what is left since the first write remains
+                    duration = (sent / 2) / 22050
+                    time.sleep(max(0.0, duration - (time.time() - started)))
 
             except Exception as e:
                 print(f"TTS Error: {e}")
@@ -395,5 +593,10 @@ class AudioManager:
     
     def cleanup(self):
         """Clean up audio resources"""
+        if self._prepared_stream is not None:
+            process, recording, _ = self._prepared_stream
+            self._prepared_stream = None
+            recording.set()
+            process.terminate()
         if hasattr(self, 'audio'):
             self.audio.terminate()
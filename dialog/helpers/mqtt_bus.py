@@ -0,0 +1,156 @@
+"""
+MQTT Bus Module
+Single process-wide broker connection shared by every PhaseController
+"""
+import logging
+import os
+import threading
+from typing import Callable, Dict, List, Optional
+import paho.mqtt.client as mqtt
+from paho.mqtt.packettypes import PacketTypes
+from paho.mqtt.properties import Properties
+
+
+BROKER = os.getenv('MQTT_BROKER', 'mosquitto')
+PORT = int(os.getenv('MQTT_PORT', 1883))
+USERNAME = os.getenv('USERNAME', 'inesc')
+PASSWORD = os.getenv('PASSWORD', 'inesc')
+
+LWT_TOPIC = "victim/dialogmanager2/lwt"
+SPEECH_LWT_TOPIC = "victim/text2speech2text/lwt"
+
+MessageHandler = Callable[[mqtt.MQTTMessage], None]
+
+logger = logging.getLogger(f"rescue.{__name__}")
+
+
+class MQTTBus:
+    """
+    One paho client, connection and network thread for all rescues in this process.
+
+    Controllers register a handler per topic; incoming messages are fanned out
+    to the handlers of their topic on paho's network thread, so handlers must
+    only hand the message off (e.g. put it on a queue). Subscriptions are
+    replayed on every (re)connect.
+
+    The connection speaks MQTT 5 so hot topics (the per-turn TTS messages) can
+    be published under a topic alias: the full topic string goes out once per
+    connection, later publishes carry only the 2-byte alias.
+    """
+
+    _instance: Optional['MQTTBus'] = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> 'MQTTBus':
+        """Return the shared bus, connecting it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, broker: str = BROKER, port: int = PORT):
+        self._handlers: Dict[str, List[MessageHandler]] = {}
+        self._handlers_lock = threading.Lock()
+        self._connected = False
+        # Topic aliases are per connection and bounded by the broker's CONNACK
+        self._topic_aliases: Dict[str, int] = {}
+        self._alias_max = 0
+        self._alias_lock = threading.Lock()
+
+        self.client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, protocol=mqtt.MQTTv5)
+        self.client.will_set(LWT_TOPIC, "offline")
+        self.client.on_connect = self._on_connect
+        self.client.on_disconnect = self._on_disconnect
+        self.client.on_message = self._on_message
+        self.client.username_pw_set(USERNAME, PASSWORD)
+        self.client.connect(broker, port)
+        self.client.loop_start()
+
+    def subscribe(self, topic: str, handler: MessageHandler):
+        """Route messages on ``topic`` to ``handler``"""
+        with self._handlers_lock:
+            handlers = self._handlers.setdefault(topic, [])
+            first = not handlers
+            handlers.append(handler)
+        if first and self._connected:
+            self.client.subscribe(topic)
+
+    def unsubscribe(self, topic: str, handler: MessageHandler):
+        """Stop routing ``topic`` to ``handler``; drops the broker subscription with the last one"""
+        with self._handlers_lock:
+            handlers = self._handlers.get(topic, [])
+            if handler in handlers:
+                handlers.remove(handler)
+            last = not handlers
+            if last:
+                self._handlers.pop(topic, None)
+        if last and self._connected:
+            self.client.unsubscribe(topic)
+
+    def publish(self, topic: str, payload, qos: int = 0, retain: bool = False,
+                alias: bool = False) -> mqtt.MQTTMessageInfo:
+        """
+        Publish on the shared connection.
+
+        With ``alias`` the topic is mapped to an MQTT 5 topic alias while the
+        broker allows more; once registered, only the alias is sent.
+        """
+        if not alias:
+            return self.client.publish(topic, payload, qos=qos, retain=retain)
+        # Held across the publish so the registering message is queued ahead
+        # of any alias-only one
+        with self._alias_lock:
+            alias_id = self._topic_aliases.get(topic)
+            if alias_id is None:
+                if len(self._topic_aliases) >= self._alias_max:
+                    return self.client.publish(topic, payload, qos=qos, retain=retain)
+                alias_id = len(self._topic_aliases) + 1
+                self._topic_aliases[topic] = alias_id
+                wire_topic = topic
+            else:
+                wire_topic = ""
+            properties = Properties(PacketTypes.PUBLISH)
+            properties.TopicAlias = alias_id
+            return self.client.publish(wire_topic, payload, qos=qos, retain=retain, properties=properties)
+
+    def _reset_topic_aliases(self, alias_max: int):
+        with self._alias_lock:
+            self._topic_aliases.clear()
+            self._alias_max = alias_max
+
+    def _on_connect(self, client: mqtt.Client, userdata, flags: mqtt.ConnectFlags,
+                    reason_code: mqtt.ReasonCode, properties: Optional[Properties]):
+        if not reason_code.is_failure:
+            logger.info("✅ Connected to broker")
+            self._reset_topic_aliases(getattr(properties, 'TopicAliasMaximum', 0))
+            self._connected = True
+            with self._handlers_lock:
+                topics = list(self._handlers)
+            for topic in [SPEECH_LWT_TOPIC] + topics:
+                client.subscribe(topic)
+            client.publish(LWT_TOPIC, "online")
+        else:
+            logger.error("❌ Bad connection. Returned code= %s", reason_code)
+
+    def _on_disconnect(self, client: mqtt.Client, userdata, flags: mqtt.DisconnectFlags,
+                       reason_code: mqtt.ReasonCode, properties: Optional[Properties]):
+        self._connected = False
+        self._reset_topic_aliases(0)
+        if reason_code.is_failure:
+            logger.warning("⚠️  Disconnected from broker: %s", reason_code)
+
+    def _on_message(self, client: mqtt.Client, userdata, msg: mqtt.MQTTMessage):
+        if msg.topic == SPEECH_LWT_TOPIC:
+            logger.info("Text2speech2Text status update: %s", msg.payload.decode())
+            return
+        with self._handlers_lock:
+            handlers = tuple(self._handlers.get(msg.topic, ()))
+        for handler in handlers:
+            # An exception here would end paho's network thread, and with it
+            # MQTT for every controller in the process
+            try:
+                handler(msg)
+            except Exception:
+                logger.exception("❌ Handler for %s failed", msg.topic)
@@ -2,18 +2,207 @@
 MQTT Manager Module
 Handles MQTT communication between Robot Client and Dialog Manager
 """
+import os
+import re
+import sys
 import json
+import mmap
 import time
+import struct
+import queue
+import asyncio
+import functools
+import socket
+import atexit
+import logging
+import logging.handlers
 import threading
-from typing import Callable, Dict, Any, Optional
+import concurrent.futures
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, Any, List, Optional, Pattern, Tuple, Union
+import msgpack
 import paho.mqtt.client as mqtt
 
 
+# Log records are only enqueued on the MQTT hot paths; the actual console I/O
+# happens on the QueueListener's background thread.
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+
+_console_handler = logging.StreamHandler()
+_console_handler.setFormatter(logging.Formatter("MQTT: %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _console_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+
+ENCODINGS = ("json", "msgpack")
+
+# Kernel send/receive buffer size requested for the broker socket
+SOCKET_BUFFER_SIZE = 256 * 1024
+
+# Queued messages published between socket flushes when draining the offline queue
+QUEUE_FLUSH_BATCH = 64
+
+# Backoff between reconnect attempts of a client driven by connect_async(), in seconds
+RECONNECT_DELAY_MIN = 1
+RECONNECT_DELAY_MAX = 30
+
+
+def _encode(data: Dict[str, Any], encoding: str) -> Union[str, bytes]:
+    """Serialize a dict in the given wire format"""
+    if encoding == "msgpack":
+        return msgpack.packb(data, use_bin_type=True)
+    return json.dumps(data, ensure_ascii=False)
+
+
+@functools.lru_cache(maxsize=128)
+def _encode_items(items: Tuple[Tuple[str, Any], ...], encoding: str) -> Union[str, bytes]:
+    """Cached encoding for payloads passed as a tuple of (key, value) pairs"""
+    return _encode(dict(items), encoding)
+
+
+class DiskMessageQueue:
+    """
+    Bounded FIFO of offline MQTT messages stored in a memory-mapped ring file.
+    
+    The file holds a small header (head slot, item count) followed by
+    ``capacity`` fixed-size slots, so queued messages survive a crash or restart
+    of the dialog manager. Like ``deque(maxlen=capacity)``, appending to a full
+    queue drops the oldest message. Payloads are returned as bytes.
+    
+    publish() appends from caller threads while paho's network thread pops, and
+    each operation updates the slots and the head/count in several steps, so
+    they are serialized by a lock.
+    """
+    
+    MAGIC = b'MQRQ'
+    # magic, slot_size, capacity, head, count
+    _HEADER = struct.Struct('<4sIIII')
+    # payload length, qos, timestamp, topic length
+    _SLOT_HEADER = struct.Struct('<IBdH')
+    
+    def __init__(self, path: str, capacity: int, slot_size: int = 4096):
+        """
+        Open (or create) the ring file
+        
+        Args:
+            path: Location of the backing file
+            capacity: Maximum number of queued messages
+            slot_size: Bytes reserved per message, including its header
+        """
+        self.path = path
+        self.capacity = capacity
+        self.slot_size = slot_size
+        # Reentrant: popleft() reads the head slot through __getitem__
+        self._lock = threading.RLock()
+        
+        size = self._HEADER.size + capacity * slot_size
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        if os.fstat(self._fd).st_size != size:
+            os.ftruncate(self._fd, size)
+        self._mm = mmap.mmap(self._fd, size)
+        
+        magic, stored_slot_size, stored_capacity, self._head, self._count = self._HEADER.unpack_from(self._mm, 0)
+        if (magic, stored_slot_size, stored_capacity) != (self.MAGIC, slot_size, capacity):
+            # New file or layout changed - start with an empty ring
+            self._head = 0
+            self._count = 0
+            self._write_header()
+    
+    def _write_header(self):
+        self._HEADER.pack_into(self._mm, 0, self.MAGIC, self.slot_size, self.capacity, self._head, self._count)
+    
+    def _slot_offset(self, index: int) -> int:
+        return self._HEADER.size + ((self._head + index) % self.capacity) * self.slot_size
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        with self._lock:
+            if not 0 <= index < self._count:
+                raise IndexError("DiskMessageQueue index out of range")
+            offset = self._slot_offset(index)
+            payload_len, qos, timestamp, topic_len = self._SLOT_HEADER.unpack_from(self._mm, offset)
+            start = offset + self._SLOT_HEADER.size
+            topic = self._mm[start:start + topic_len].decode('utf-8')
+            payload = self._mm[start + topic_len:start + topic_len + payload_len]
+        return {'topic': topic, 'payload': payload, 'qos': qos, 'timestamp': timestamp}
+    
+    def append(self, msg: Dict[str, Any]):
+        """Write a message to the tail slot, evicting the oldest one when full"""
+        topic = msg['topic'].encode('utf-8')
+        payload = msg['payload']
+        if isinstance(payload, str):
+            payload = payload.encode('utf-8')
+        if self._SLOT_HEADER.size + len(topic) + len(payload) > self.slot_size:
+            raise ValueError(f"Message for {msg['topic']} exceeds the {self.slot_size} byte queue slot")
+        
+        with self._lock:
+            if self._count == self.capacity:
+                self._head = (self._head + 1) % self.capacity
+                self._count -= 1
+            
+            offset = self._slot_offset(self._count)
+            self._SLOT_HEADER.pack_into(self._mm, offset, len(payload), msg['qos'], msg['timestamp'], len(topic))
+            start = offset + self._SLOT_HEADER.size
+            self._mm[start:start + len(topic)] = topic
+            self._mm[start + len(topic):start + len(topic) + len(payload)] = payload
+            # Header last, so a crash mid-write never exposes a half-written slot
+            self._count += 1
+            self._write_header()
+    
+    def popleft(self) -> Dict[str, Any]:
+        """Remove and return the oldest message"""
+        with self._lock:
+            msg = self[0]
+            self._head = (self._head + 1) % self.capacity
+            self._count -= 1
+            self._write_header()
+        return msg
+    
+    def close(self):
+        """Flush the ring to disk and release the file"""
+        with self._lock:
+            self._mm.flush()
+            os.fdatasync(self._fd)
+            self._mm.close()
+            os.close(self._fd)
+
+
+@dataclass(slots=True)
+class MQTTStatus:
+    """Connection and queue status of an MQTTManager, updated in place by get_status()"""
+    connected: bool
+    broker_host: str
+    broker_port: int
+    client_id: str
+    queued_messages: int
+    broker_available: bool
+
+
 class MQTTManager:
-    """Manages MQTT communication for the rescue robot system"""
+    """
+    Manages MQTT communication for the rescue robot system
+    
+    Payloads are encoded as JSON or msgpack depending on the ``encoding``
+    parameter. Incoming payloads are sniffed, so a msgpack manager still accepts
+    JSON objects from peers that have not migrated yet. While both formats are
+    in use on the same broker, keep binary traffic under a ``.../bin/...`` topic
+    and JSON traffic under ``.../json/...`` so peers that only speak JSON are
+    never handed msgpack frames.
+    """
     
     def __init__(self, broker_host: str = "localhost", broker_port: int = 1883, 
-                 client_id: Optional[str] = None, username: Optional[str] = None, password: Optional[str] = None):
+                 client_id: Optional[str] = None, username: Optional[str] = None, password: Optional[str] = None,
+                 encoding: str = "json", handler_workers: int = 4,
+                 queue_path: Optional[str] = None, max_queue_size: int = 100):
         """
         Initialize MQTT manager
         
@@ -23,12 +212,20 @@ class MQTTManager:
             client_id: Unique client identifier
             username: MQTT username (if authentication required)
             password: MQTT password (if authentication required)
+            encoding: Outgoing payload format, "json" or "msgpack"
+            handler_workers: Number of threads running message handlers
+            queue_path: File backing the offline message queue (in-memory if None)
+            max_queue_size: Maximum number of messages kept while offline
         """
+        if encoding not in ENCODINGS:
+            raise ValueError(f"Unsupported MQTT payload encoding: {encoding}")
+        
         self.broker_host = broker_host
         self.broker_port = broker_port
         self.client_id = client_id or f"rescue_robot_{int(time.time())}"
         self.username = username
         self.password = password
+        self.encoding = encoding
         
         # MQTT client
         self.client = mqtt.Client(client_id=self.client_id, clean_session=True)
@@ -37,35 +234,61 @@ class MQTTManager:
         if self.username and self.password:
             self.client.username_pw_set(self.username, self.password)
         
-        # Set up callbacks
-        self.client.on_connect = self._on_connect
-        self.client.on_disconnect = self._on_disconnect
-        self.client.on_message = self._on_message
-        
-        # Message handlers
+        # Message handlers run on a bounded pool so a slow handler never
+        # blocks paho's network thread
         self.message_handlers: Dict[str, Callable] = {}
+        self._wildcard_handlers: List[Tuple[Pattern[str], Callable]] = []
+        self._handler_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=handler_workers, thread_name_prefix="mqtt-handler"
+        )
         
         # Connection status
-        self.is_connected = False
-        self.connection_lock = threading.Lock()
+        self._connected = threading.Event()
+        
+        # asyncio integration (see connect_async)
+        self._aio_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._connect_waiter: Optional[asyncio.Future] = None
+        self._misc_task: Optional[asyncio.Task] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        
+        # Message queue for offline scenarios; both variants drop the oldest
+        # message once max_queue_size is reached
+        self.max_queue_size = max_queue_size
+        if queue_path:
+            self.message_queue = DiskMessageQueue(queue_path, max_queue_size)
+        else:
+            self.message_queue = deque(maxlen=max_queue_size)
+        
+        # Reused by get_status() so polling it does not allocate
+        self._status = MQTTStatus(
+            connected=False,
+            broker_host=self.broker_host,
+            broker_port=self.broker_port,
+            client_id=self.client_id,
+            queued_messages=0,
+            broker_available=False
+        )
         
-        # Message queue for offline scenarios
-        self.message_queue = []
-        self.max_queue_size = 100
+        # Set up callbacks
+        self._bind_callbacks()
         
-    def _on_connect(self, client, userdata, flags, rc):
+    @property
+    def is_connected(self) -> bool:
+        """Whether the client currently holds a broker connection"""
+        return self._connected.is_set()
+    
+    def _on_connect(self, client: mqtt.Client, userdata: Any, flags: Dict[str, Any], rc: int) -> None:
         """Callback when connected to MQTT broker"""
         if rc == 0:
-            with self.connection_lock:
-                self.is_connected = True
-            print(f"MQTT: Connected to {self.broker_host}:{self.broker_port}")
+            self._tune_socket()
+            self._connected.set()
+            logger.info("Connected to %s:%s", self.broker_host, self.broker_port)
             # Process any queued messages
             self._process_message_queue()
         else:
-            print(f"MQTT: Connection failed with code {rc}")
+            logger.warning("Connection failed with code %s", rc)
             # Set connection status to False on failure
-            with self.connection_lock:
-                self.is_connected = False
+            self._connected.clear()
             
             # Provide more detailed error information
             error_messages = {
@@ -76,46 +299,139 @@ class MQTTManager:
                 5: "Connection refused - not authorized"
             }
             if rc in error_messages:
-                print(f"MQTT: {error_messages[rc]}")
+                logger.warning(error_messages[rc])
             else:
-                print(f"MQTT: Unknown connection error code {rc}")
+                logger.warning("Unknown connection error code %s", rc)
+        
+        if self._connect_waiter is not None and not self._connect_waiter.done():
+            self._connect_waiter.set_result(rc == 0)
     
-    def _on_disconnect(self, client, userdata, rc):
+    def _tune_socket(self) -> None:
+        """Disable Nagle and enlarge buffers so small PUBLISH packets go out immediately"""
+        sock = self.client.socket()
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+        except (OSError, AttributeError) as e:
+            # Websocket/unix transports do not expose these TCP options
+            logger.debug("Could not tune broker socket: %s", e)
+    
+    def _on_disconnect(self, client: mqtt.Client, userdata: Any, rc: int) -> None:
         """Callback when disconnected from MQTT broker"""
-        with self.connection_lock:
-            self.is_connected = False
+        self._connected.clear()
         
         if rc != 0:
-            print(f"MQTT: Unexpected disconnection (code {rc})")
+            logger.warning("Unexpected disconnection (code %s)", rc)
+            if self._aio_loop is not None and not self._aio_loop.is_closed():
+                # No paho thread reconnects a client driven by connect_async()
+                self._aio_loop.call_soon_threadsafe(self._start_async_reconnect)
         else:
-            print("MQTT: Disconnected")
+            logger.info("Disconnected")
     
-    def _on_message(self, client, userdata, msg):
-        """Callback when message received"""
-        try:
-            topic = msg.topic
-            payload = msg.payload.decode('utf-8')
+    def _encode_payload(self, data: Union[Dict[str, Any], Tuple, bytes, bytearray, memoryview]) -> Union[str, bytes, bytearray]:
+        """Serialize outgoing data in the configured wire format"""
+        if isinstance(data, (bytes, bytearray)):
+            return data
+        if isinstance(data, memoryview):
+            return data.tobytes()
+        if isinstance(data, tuple):
+            return _encode_items(data, self.encoding)
+        return _encode(data, self.encoding)
+    
+    def _decode_payload(self, payload: bytes) -> Any:
+        """Deserialize an incoming payload, accepting JSON objects from any peer"""
+        if self.encoding == "json" or payload[:1] == b'{':
+            return json.loads(payload)
+        return msgpack.unpackb(payload, raw=False)
+    
+    def _bind_callbacks(self) -> None:
+        """Attach the connection and message callbacks to the current paho client"""
+        self.client.on_connect = self._on_connect
+        self.client.on_disconnect = self._on_disconnect
+        self.client.on_message = self._make_message_callback()
+    
+    def _make_message_callback(self) -> Callable[[mqtt.Client, Any, mqtt.MQTTMessage], None]:
+        """
+        Build the on_message callback
+        
+        Everything the callback touches per message is bound as a default
+        argument, so the hot path only does local-variable loads instead of
+        attribute lookups on self. The handler dict and wildcard list are
+        mutated in place by subscribe(), never reassigned.
+        """
+        def _on_message(client: mqtt.Client, userdata: Any, msg: mqtt.MQTTMessage,
+                        handlers: Dict[str, Callable] = self.message_handlers,
+                        match_wildcard: Callable[[str], Optional[Callable]] = self._match_wildcard,
+                        decode: Callable[[bytes], Any] = self._decode_payload,
+                        submit: Callable[..., Any] = self._handler_pool.submit,
+                        run_handler: Callable[[str, Callable, Any], None] = self._run_handler,
+                        encoding: str = self.encoding,
+                        intern: Callable[[str], str] = sys.intern,
+                        log: logging.Logger = logger) -> None:
+            """Callback when message received"""
+            # Interned so the handler lookup hits the cached hash of the subscribed key
+            topic = intern(msg.topic)
+            payload = msg.payload
             
-            print(f"MQTT: Received message on {topic}: {payload}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Received message on %s: %r", topic, payload)
             
-            # Parse JSON payload
+            # Parse JSON / msgpack payload (both raise ValueError subclasses)
             try:
-                data = json.loads(payload)
-            except json.JSONDecodeError:
-                print(f"MQTT: Invalid JSON payload: {payload}")
+                data = decode(payload)
+            except ValueError:
+                log.warning("Invalid %s payload: %r", encoding, payload)
                 return
             
-            # Call registered handler
-            if topic in self.message_handlers:
-                try:
-                    self.message_handlers[topic](data)
-                except Exception as e:
-                    print(f"MQTT: Error in message handler for {topic}: {e}")
+            # Hand the registered handler off to the worker pool; only the
+            # handler itself runs under a broad except, in _run_handler
+            handler = handlers.get(topic)
+            if handler is None:
+                handler = match_wildcard(topic)
+            if handler is None:
+                log.debug("No handler registered for topic %s", topic)
+                return
+            try:
+                submit(run_handler, topic, handler, data)
+            except RuntimeError:
+                # Pool already shut down by cleanup()
+                log.debug("Dropped message on %s after shutdown", topic)
+        
+        return _on_message
+    
+    def _match_wildcard(self, topic: str) -> Optional[Callable]:
+        """Find the handler of a wildcard subscription matching the topic"""
+        for pattern, handler in self._wildcard_handlers:
+            if pattern.match(topic):
+                return handler
+        return None
+    
+    @staticmethod
+    def _compile_wildcard(topic: str) -> Pattern[str]:
+        """Translate an MQTT subscription filter using + / # into a regex"""
+        parts = []
+        for level in topic.split('/'):
+            if level == '+':
+                parts.append('[^/]*')
+            elif level == '#':
+                parts.append('.*')
             else:
-                print(f"MQTT: No handler registered for topic {topic}")
-                
+                parts.append(re.escape(level))
+        pattern = '/'.join(parts)
+        # 'a/#' also matches the parent level 'a'
+        if topic.endswith('/#'):
+            pattern = pattern[:-len('/.*')] + '(?:/.*)?'
+        return re.compile(pattern + r'\Z')
+    
+    def _run_handler(self, topic: str, handler: Callable, data: Any) -> None:
+        """Invoke a message handler on a pool thread, logging any failure"""
+        try:
+            handler(data)
         except Exception as e:
-            print(f"MQTT: Error processing message: {e}")
+            logger.error("Error in message handler for %s: %s", topic, e)
     
     def connect(self) -> bool:
         """
@@ -125,16 +441,15 @@ class MQTTManager:
             True if connection successful
         """
         try:
-            print(f"MQTT: Connecting to {self.broker_host}:{self.broker_port}...")
+            logger.info("Connecting to %s:%s...", self.broker_host, self.broker_port)
             
             # Reset connection status
-            with self.connection_lock:
-                self.is_connected = False
+            self._connected.clear()
             
             # Stop any existing loop
             try:
                 self.client.loop_stop()
-            except:
+            except OSError:
                 pass
             
             # Start the loop first
@@ -143,52 +458,150 @@ class MQTTManager:
             # Then connect
             result = self.client.connect(self.broker_host, self.broker_port, 60)
             if result != mqtt.MQTT_ERR_SUCCESS:
-                print(f"MQTT: Connect call failed with result {result}")
+                logger.error("Connect call failed with result %s", result)
                 return False
             
             # Wait for connection callback to be called
             timeout = 10
-            start_time = time.time()
-            while not self.is_connected and (time.time() - start_time) < timeout:
-                time.sleep(0.1)
-            
-            if self.is_connected:
-                print(f"MQTT: Successfully connected to {self.broker_host}:{self.broker_port}")
+            if self._connected.wait(timeout=timeout):
+                logger.info("Successfully connected to %s:%s", self.broker_host, self.broker_port)
                 return True
             else:
-                print(f"MQTT: Connection timeout after {timeout} seconds")
+                logger.error("Connection timeout after %s seconds", timeout)
                 return False
             
-        except Exception as e:
-            print(f"MQTT: Connection error: {e}")
+        except (OSError, ValueError) as e:
+            # OSError covers socket/DNS failures and paho's WebsocketConnectionError;
+            # ValueError an invalid host or port
+            logger.error("Connection error: %s", e)
             return False
     
-    def _recreate_client(self):
-        """Recreate the MQTT client for reconnection"""
+    async def connect_async(self, timeout: float = 10) -> bool:
+        """
+        Connect to MQTT broker driving paho from the running asyncio event loop
+        
+        Instead of paho's background thread, socket reads/writes are registered
+        with the event loop via add_reader/add_writer and keepalive housekeeping
+        runs as a task, so the caller awaits CONNACK instead of blocking.
+        After an unexpected disconnection the client reconnects on the same loop,
+        backing off from RECONNECT_DELAY_MIN to RECONNECT_DELAY_MAX seconds.
+        
+        Args:
+            timeout: Seconds to wait for the broker to acknowledge the connection
+            
+        Returns:
+            True if connection successful
+        """
         try:
-            # Stop and cleanup old client
-            try:
-                self.client.loop_stop()
-                self.client.disconnect()
-            except:
-                pass
+            logger.info("Connecting to %s:%s (asyncio)...", self.broker_host, self.broker_port)
             
-            # Create new client
-            self.client = mqtt.Client(client_id=self.client_id, clean_session=True)
+            self._connected.clear()
+            self._aio_loop = asyncio.get_running_loop()
+            self._connect_waiter = self._aio_loop.create_future()
             
-            # Set up authentication if provided
-            if self.username and self.password:
-                self.client.username_pw_set(self.username, self.password)
+            self.client.on_socket_open = self._on_socket_open
+            self.client.on_socket_close = self._on_socket_close
+            self.client.on_socket_register_write = self._on_socket_register_write
+            self.client.on_socket_unregister_write = self._on_socket_unregister_write
             
-            # Set up callbacks
-            self.client.on_connect = self._on_connect
-            self.client.on_disconnect = self._on_disconnect
-            self.client.on_message = self._on_message
+            result = self.client.connect(self.broker_host, self.broker_port, 60)
+            if result != mqtt.MQTT_ERR_SUCCESS:
+                logger.error("Connect call failed with result %s", result)
+                return False
             
-            print("MQTT: Client recreated for reconnection")
+            try:
+                connected = await asyncio.wait_for(self._connect_waiter, timeout)
+            except asyncio.TimeoutError:
+                logger.error("Connection timeout after %s seconds", timeout)
+                return False
             
-        except Exception as e:
-            print(f"MQTT: Error recreating client: {e}")
+            if connected:
+                logger.info("Successfully connected to %s:%s", self.broker_host, self.broker_port)
+            return connected
+            
+        except (OSError, ValueError) as e:
+            logger.error("Connection error: %s", e)
+            return False
+        finally:
+            self._connect_waiter = None
+    
+    def _on_socket_open(self, client: mqtt.Client, userdata: Any, sock: socket.socket) -> None:
+        """Register the broker socket for reads on the asyncio loop"""
+        self._aio_loop.add_reader(sock, client.loop_read)
+        self._misc_task = self._aio_loop.create_task(self._misc_loop())
+    
+    def _on_socket_close(self, client: mqtt.Client, userdata: Any, sock: socket.socket) -> None:
+        """Unregister the broker socket from the asyncio loop"""
+        self._aio_loop.remove_reader(sock)
+        if self._misc_task is not None:
+            self._misc_task.cancel()
+            self._misc_task = None
+    
+    def _on_socket_register_write(self, client: mqtt.Client, userdata: Any, sock: socket.socket) -> None:
+        """
+        Let the asyncio loop flush paho's outgoing packets
+        
+        paho calls this from whichever thread publishes, so the registration is
+        handed to the loop thread.
+        """
+        self._aio_loop.call_soon_threadsafe(self._aio_loop.add_writer, sock, client.loop_write)
+    
+    def _on_socket_unregister_write(self, client: mqtt.Client, userdata: Any, sock: socket.socket) -> None:
+        """Stop watching the broker socket for writability (on the loop thread, like the registration)"""
+        self._aio_loop.call_soon_threadsafe(self._aio_loop.remove_writer, sock)
+    
+    async def _misc_loop(self) -> None:
+        """Run paho keepalive/retry housekeeping once per second"""
+        while self.client.loop_misc() == mqtt.MQTT_ERR_SUCCESS:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                break
+    
+    def _start_async_reconnect(self) -> None:
+        """Start the reconnect task on the asyncio loop unless one is already running"""
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = self._aio_loop.create_task(self._reconnect_with_backoff())
+    
+    async def _reconnect_with_backoff(self) -> None:
+        """Retry reconnect_async() with exponential backoff until the broker is back"""
+        delay = RECONNECT_DELAY_MIN
+        while not await self.reconnect_async():
+            logger.info("Retrying in %ss", delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_DELAY_MAX)
+    
+    async def reconnect_async(self, timeout: float = 10) -> bool:
+        """
+        Reconnect to MQTT broker, keeping the client on the running asyncio loop
+        
+        Returns:
+            True if reconnection successful
+        """
+        logger.info("Attempting reconnection (asyncio)...")
+        self._recreate_client()
+        return await self.connect_async(timeout)
+    
+    def _recreate_client(self) -> None:
+        """Recreate the MQTT client for reconnection"""
+        # Stop and cleanup old client
+        try:
+            self.client.loop_stop()
+            self.client.disconnect()
+        except OSError as e:
+            logger.debug("Error stopping old client: %s", e)
+        
+        # Create new client
+        self.client = mqtt.Client(client_id=self.client_id, clean_session=True)
+        
+        # Set up authentication if provided
+        if self.username and self.password:
+            self.client.username_pw_set(self.username, self.password)
+        
+        # Set up callbacks
+        self._bind_callbacks()
+        
+        logger.info("Client recreated for reconnection")
     
     def reconnect(self) -> bool:
         """
@@ -197,32 +610,40 @@ class MQTTManager:
         Returns:
             True if reconnection successful
         """
-        try:
-            print("MQTT: Attempting reconnection...")
-            
-            # Recreate client
-            self._recreate_client()
-            
-            # Try to connect
-            return self.connect()
-            
-        except Exception as e:
-            print(f"MQTT: Reconnection error: {e}")
-            return False
+        if self._aio_loop is not None:
+            # A client driven by connect_async() stays on its event loop
+            try:
+                running_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                running_loop = None
+            if running_loop is self._aio_loop:
+                raise RuntimeError("reconnect() would block the event loop driving MQTT; await reconnect_async()")
+            return asyncio.run_coroutine_threadsafe(self.reconnect_async(), self._aio_loop).result()
+        
+        logger.info("Attempting reconnection...")
+        
+        # Recreate client
+        self._recreate_client()
+        
+        # Try to connect (logs and returns False on failure)
+        return self.connect()
     
-    def disconnect(self):
+    def disconnect(self) -> None:
         """Disconnect from MQTT broker"""
         try:
+            if self._reconnect_task is not None:
+                self._aio_loop.call_soon_threadsafe(self._reconnect_task.cancel)
+                self._reconnect_task = None
             if self.is_connected:
                 self.client.loop_stop()
                 self.client.disconnect()
-                with self.connection_lock:
-                    self.is_connected = False
-                print("MQTT: Disconnected")
-        except Exception as e:
-            print(f"MQTT: Disconnect error: {e}")
+                self._connected.clear()
+                logger.info("Disconnected")
+        except (OSError, RuntimeError) as e:
+            # RuntimeError: the asyncio loop driving connect_async() is already closed
+            logger.error("Disconnect error: %s", e)
     
-    def subscribe(self, topic: str, handler: Callable[[Dict[str, Any]], None]):
+    def subscribe(self, topic: str, handler: Callable[[Dict[str, Any]], None]) -> None:
         """
         Subscribe to a topic with a message handler
         
@@ -231,57 +652,62 @@ class MQTTManager:
             handler: Function to call when message received
         """
         try:
+            topic = sys.intern(topic)
             self.message_handlers[topic] = handler
+            if '+' in topic or '#' in topic:
+                self._wildcard_handlers.append((self._compile_wildcard(topic), handler))
             if self.is_connected:
                 result = self.client.subscribe(topic)
                 if result[0] == mqtt.MQTT_ERR_SUCCESS:
-                    print(f"MQTT: Subscribed to {topic}")
+                    logger.info("Subscribed to %s", topic)
                 else:
-                    print(f"MQTT: Failed to subscribe to {topic}")
+                    logger.warning("Failed to subscribe to %s", topic)
             else:
-                print(f"MQTT: Not connected, will subscribe when connected")
-        except Exception as e:
-            print(f"MQTT: Subscribe error: {e}")
+                logger.info("Not connected, will subscribe when connected")
+        except (OSError, ValueError) as e:
+            logger.error("Subscribe error: %s", e)
     
-    def publish(self, topic: str, data: Dict[str, Any], qos: int = 1) -> bool:
+    def publish(self, topic: str, data: Union[Dict[str, Any], Tuple, bytes, bytearray, memoryview],
+                qos: int = 1) -> bool:
         """
         Publish message to a topic
         
         Args:
             topic: MQTT topic to publish to
-            data: Data to publish (will be converted to JSON)
+            data: Data to publish. Dicts are encoded as JSON or msgpack; bytes-like
+                payloads are sent as-is; a tuple of (key, value) pairs is encoded
+                once and cached, for messages such as heartbeats that repeat unchanged
             qos: Quality of service level
             
         Returns:
             True if message sent or queued
         """
         try:
-            payload = json.dumps(data, ensure_ascii=False)
+            payload = self._encode_payload(data)
             
             if self.is_connected:
                 result = self.client.publish(topic, payload, qos=qos)
                 if result.rc == mqtt.MQTT_ERR_SUCCESS:
-                    print(f"MQTT: Published to {topic}: {payload}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Published to %s: %r", topic, payload)
                     return True
                 else:
-                    print(f"MQTT: Failed to publish to {topic}")
+                    logger.warning("Failed to publish to %s", topic)
                     return False
             else:
                 # Queue message for later
                 self._queue_message(topic, payload, qos)
-                print(f"MQTT: Message queued for {topic} (offline)")
+                logger.debug("Message queued for %s (offline)", topic)
                 return True
                 
-        except Exception as e:
-            print(f"MQTT: Publish error: {e}")
+        except (OSError, TypeError, ValueError) as e:
+            # TypeError/ValueError: unserializable data, bad topic/qos or an
+            # oversize message for the disk queue
+            logger.error("Publish error: %s", e)
             return False
     
-    def _queue_message(self, topic: str, payload: str, qos: int):
+    def _queue_message(self, topic: str, payload: Union[str, bytes], qos: int) -> None:
         """Queue message for later transmission"""
-        if len(self.message_queue) >= self.max_queue_size:
-            # Remove oldest message
-            self.message_queue.pop(0)
-        
         self.message_queue.append({
             'topic': topic,
             'payload': payload,
@@ -289,27 +715,34 @@ class MQTTManager:
             'timestamp': time.time()
         })
     
-    def _process_message_queue(self):
+    def _process_message_queue(self) -> None:
         """Process queued messages when connection is restored"""
         if not self.message_queue:
             return
         
-        print(f"MQTT: Processing {len(self.message_queue)} queued messages...")
+        logger.info("Processing %d queued messages...", len(self.message_queue))
         
-        # Process messages in order
+        # Process messages in order, in batches that share a single socket write.
+        # This runs from _on_connect on paho's network thread, so flushing with
+        # loop_write() here does not race the background loop.
         while self.message_queue:
-            msg = self.message_queue[0]
-            
+            sent = 0
             try:
-                result = self.client.publish(msg['topic'], msg['payload'], qos=msg['qos'])
-                if result.rc == mqtt.MQTT_ERR_SUCCESS:
-                    self.message_queue.pop(0)
-                    print(f"MQTT: Queued message sent to {msg['topic']}")
-                else:
-                    # Stop processing if we can't send
-                    break
-            except Exception as e:
-                print(f"MQTT: Error processing queued message: {e}")
+                while self.message_queue and sent < QUEUE_FLUSH_BATCH:
+                    msg = self.message_queue[0]
+                    result = self.client.publish(msg['topic'], msg['payload'], qos=msg['qos'])
+                    if result.rc != mqtt.MQTT_ERR_SUCCESS:
+                        break
+                    self.message_queue.popleft()
+                    sent += 1
+                    logger.debug("Queued message sent to %s", msg['topic'])
+            except (OSError, ValueError) as e:
+                logger.error("Error processing queued message: %s", e)
+            
+            if sent:
+                self.client.loop_write()
+            if sent < QUEUE_FLUSH_BATCH:
+                # Stop processing if we can't send
                 break
     
     def is_broker_available(self) -> bool:
@@ -320,37 +753,36 @@ class MQTTManager:
             True if broker is reachable
         """
         try:
-            import socket
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(5)
             result = sock.connect_ex((self.broker_host, self.broker_port))
             sock.close()
             return result == 0
-        except Exception:
+        except OSError:
             return False
     
-    def get_status(self) -> Dict[str, Any]:
+    def get_status(self) -> MQTTStatus:
         """
         Get current MQTT status
         
+        The same MQTTStatus instance is refreshed and returned on every call.
+        The broker is only probed with a TCP connect while disconnected.
+        
         Returns:
-            Dictionary with connection status and queue information
+            MQTTStatus with connection status and queue information
         """
-        return {
-            'connected': self.is_connected,
-            'broker_host': self.broker_host,
-            'broker_port': self.broker_port,
-            'client_id': self.client_id,
-            'queued_messages': len(self.message_queue),
-            'broker_available': self.is_broker_available()
-        }
-    
-    def cleanup(self):
+        status = self._status
+        status.connected = self.is_connected
+        status.queued_messages = len(self.message_queue)
+        status.broker_available = status.connected or self.is_broker_available()
+        return status
+    
+    def cleanup(self) -> None:
         """Clean up MQTT resources"""
-        try:
-            self.disconnect()
-        except Exception as e:
-            print(f"MQTT: Cleanup error: {e}")
+        self.disconnect()
+        self._handler_pool.shutdown(wait=False, cancel_futures=True)
+        if isinstance(self.message_queue, DiskMessageQueue):
+            self.message_queue.close()
     
     def __enter__(self):
         """Context manager entry"""
@@ -15,72 +15,265 @@ Decision Points:
 - Can evacuate mid-phase, abort early, escalate priority, or transition phases
 """
 
-from typing import Dict, Optional, List, TYPE_CHECKING
+from typing import Dict, Mapping, Optional, List, Tuple, TYPE_CHECKING
 import time
 import json
 import uuid
+import itertools
 import os
-from datetime import datetime, timezone
+import re
+import threading
+import copy
+import difflib
+import hashlib
+import sqlite3
+import bisect
+import io
+from collections import OrderedDict, deque
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from dataclasses import dataclass
+import numpy as np
+import msgpack
+import paho.mqtt.client as mqtt
+from queue import Queue, Full
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is the fallback alert encoder
+    orjson = None
+from helpers.mqtt_bus import MQTTBus
+from helpers.action_decision_builder import build_static_prefix, build_dynamic_suffix
+from helpers.rescue_logger import logger
 
+# Agents arrive already constructed, so their modules are only needed for type hints
 if TYPE_CHECKING:
     from helpers.mqtt_manager import MQTTManager
+    from agents.assessment_agent import AssessmentAgent
+    from agents.dialog_agent import DialogueAgent
+    from agents.comfort_agent import ComfortAgent
+    from agents.comfort_assessment_agent import ComfortAssessmentAgent
+    from agents.triage_agent import TriageAgent
+    from agents.action_agent import ActionAgent
+    from agents.victim_agent import VictimAgent
 
-from typing import Dict, Optional, List, Tuple
-import time
-import paho.mqtt.client as mqtt
-import asyncio
-from queue import Queue
-from agents.assessment_agent import AssessmentAgent
-from agents.dialog_agent import DialogueAgent
-from agents.comfort_agent import ComfortAgent
-from agents.comfort_assessment_agent import ComfortAssessmentAgent
-from agents.triage_agent import TriageAgent
-from agents.action_agent import ActionAgent
-from agents.victim_agent import VictimAgent
+# Max number of Action Agent decisions remembered per controller
+ACTION_DECISION_CACHE_SIZE = 512
+# A turn that adds nothing to the assessment reuses the previous decision,
+# but the Action Agent is still consulted at least every this many turns
+ACTION_REFRESH_TURNS = 3
+# Phase 1 turns needed to establish a baseline before moving on to Phase 2
+PHASE_1_MIN_TURNS = 3
+# Answer "continue" without the Action Agent on uneventful early Phase 1 turns
+# (ACTION_FAST_PATH=0 always consults the agent)
+ACTION_FAST_PATH = os.getenv('ACTION_FAST_PATH', '1') != '0'
+_FAST_PATH_DECISION = {
+    "primary_action": "continue_conversation",
+    "alert_command_center": False,
+    "urgency_level": "routine",
+    "reasoning": "Early Phase 1 turn with no new information or danger - continuing assessment",
+    "next_phase": None,
+    "specialized_equipment_needed": [],
+    "send_message_to_cc": False,
+    "action": "Continue gathering information"
+}
+# On-disk tier of the decision cache, shared by every session on this robot.
+# Off unless a path is given (e.g. ~/.docker_vm/cache/action.db)
+ACTION_CACHE_PATH = os.getenv('ACTION_CACHE_PATH', '') or None
+# Phase turn numbers at which the action prompt's turn-count rules change
+# ("at least 3 turns", "turn number >= 4", "turn number > 8"); decisions are
+# only shared between turns on the same side of each of these
+_DECISION_TURN_BOUNDS = (3, 4, 9)
+# Persisted decisions never reused again are dropped after this many seconds
+ACTION_CACHE_MAX_AGE = 30 * 24 * 3600
+# Decisions at these urgency levels are never served from the cache or reused:
+# a safety-critical call must always reflect a fresh look at the situation
+_UNCACHEABLE_URGENCY = frozenset({"critical", "emergency"})
+# Plan cache: quantized (phase, assessments) state -> the action last decided on it,
+# shared by every rescue in the process. When it predicts a workflow-ending action,
+# the final triage starts while the Action Agent is still deciding
+PLAN_CACHE_SIZE = 512
+_plan_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+_plan_cache_lock = threading.Lock()
+# Actions per phase after which the workflow goes straight to the final triage
+_TERMINAL_ACTIONS = {
+    1: frozenset({"evacuate_immediately", "abort_and_alert"}),
+    2: frozenset({"evacuate_immediately", "abort_and_alert", "complete"})
+}
+# Command center alerts waiting for the background publisher, and how long
+# close() waits for it to drain them
+ALERT_QUEUE_SIZE = 256
+ALERT_DRAIN_TIMEOUT = 5.0
+ALERT_TOPIC = "rescue/robot/command_center/alert"
+# Outcomes of the action decision handlers: should_exit, exit_reason and,
+# for Phase 1, next_phase. Shared read-only instances
+_CONTINUE = MappingProxyType({"should_exit": False, "exit_reason": None})
+_TRANSITION_TO_PHASE_2 = MappingProxyType({"should_exit": True, "exit_reason": "transition_to_phase_2", "next_phase": 2})
+_ABORT_AND_ALERT = MappingProxyType({"should_exit": True, "exit_reason": "abort_and_alert", "next_phase": None})
+_IMMEDIATE_EVACUATION = MappingProxyType({"should_exit": True, "exit_reason": "immediate_evacuation", "next_phase": None})
+_EMERGENCY_DETECTED = MappingProxyType({"should_exit": True, "exit_reason": "emergency_detected"})
+_EVACUATION_READY = MappingProxyType({"should_exit": True, "exit_reason": "evacuation_ready"})
+_PHASE_2_COMPLETE = MappingProxyType({"should_exit": True, "exit_reason": "phase_2_complete"})
+# Header msg_ids: a random per-process prefix plus a counter, unique without
+# a uuid4() per message
+_MSG_ID_PREFIX = uuid.uuid4().hex[:16]
+_msg_counter = itertools.count()
+# Assessment sections of an alert, serialized once and reused while unchanged
+_ALERT_ASSESSMENT_KEYS = ("assessment", "comfort_assessment")
+# Upper bound on waiting for a retry prompt to leave the socket before listening again
+RETRY_PUBLISH_TIMEOUT = 0.25
+# Hazards that make an abort stand (one regex pass instead of a scan per keyword).
+# Plain substrings, like the checks they replace: "wildfire" still counts as fire.
+_ACTIVE_DANGER_RE = re.compile(
+    r"fire|burning|collapsing|collapse now|smoke filling|gas leak|flooding|rising water|electrical|sparks",
+    re.IGNORECASE
+)
+_UNSTABLE_RE = re.compile(r"unstable", re.IGNORECASE)
+# Phase 2 decisions are made on the previous turn's comfort assessment while the
+# new reply is analyzed; an update to any of these fields forces a fresh decision
+_PHASE_2_RECHECK_FIELDS = frozenset({"emergency_medication", "allergies", "pregnant"})
+
+# Victim reply assumed when generating the next Phase 1 question during the STT wait,
+# and how close the real reply must be for the speculative question to be reused
+SPECULATIVE_VICTIM_RESPONSE = "yes"
+SPECULATIVE_MATCH_RATIO = 0.85
+
+# Leading answer word of an assessment value -> polarity code (3 = free text)
+_POLARITY_CODES = {"unknown": 0, "yes": 1, "no": 2}
+# Fields where a yes/no answer is all the Action Agent acts on; the detail after it is dropped
+_POLARITY_ONLY_FIELDS = frozenset({"can_walk", "stuck_trapped", "people_in_surroundings"})
+# Words that never change the meaning of an assessment value
+_FILLER_WORDS = frozenset({"a", "an", "the", "and", "of", "is", "are", "has", "have", "victim"})
+
+# Agents whose calls are timed
+TIMED_AGENTS = (
+    'dialogue_agent',
+    'assessment_agent',
+    'comfort_agent',
+    'comfort_assessment_agent',
+    'action_agent',
+    'victim_agent'
+)
+
+# Separator printed around each turn header, and around phase banners
+_TURN_RULE = '─' * 80
+_BANNER_RULE = '=' * 80
+
+# Primary action -> next step reported by handle_action_decision
+_NEXT_STEPS = {
+    "continue_conversation": "CONTINUE_PHASE",
+    "transition_to_phase_2": "TRANSITION_PHASE_2",
+    "evacuate_immediately": "EVACUATE_NOW",
+    "abort_and_alert": "ABORT_AND_ALERT",
+    "maintain_and_monitor": "MAINTAIN_MONITOR",
+    "emergency_alert": "EMERGENCY_ALERT",
+    "complete": "COMPLETE"
+}
+# Console color of a command center alert by urgency level
+_URGENCY_COLORS = {
+    "routine": "\033[94m",  # Blue
+    "priority": "\033[93m",  # Yellow
+    "critical": "\033[91m",  # Red
+    "emergency": "\033[91m\033[1m"  # Bold Red
+}
+_ANSI_RESET = "\033[0m"
+
+# Per-entry sections of the rescue report
+_REPORT_FIELD = "- **{label}**: {value}\n"
+_REPORT_DECISION = (
+    "### Decision {i} (Turn {turn}, Phase {phase})\n"
+    "- **Action**: {primary_action}\n"
+    "- **Alert Command Center**: {alert_command_center}\n"
+    "- **Urgency Level**: {urgency_level}\n"
+    "- **Reasoning**: {reasoning}\n"
+)
+_REPORT_TIMING = (
+    "### {agent}\n"
+    "- Total calls: {calls}\n"
+    "- Total time: {total:.2f}s\n"
+    "- Average time: {mean:.2f}s\n"
+    "- Median / p95 / max: {p50:.2f}s / {p95:.2f}s / {max:.2f}s\n\n"
+)
+_REPORT_TRANSCRIPT = "**{i}. {role}** (Phase {phase}, Turn {turn}, {timing:.2f}s):\n> {content}\n\n"
 
-#BROKER = "mqtt01.carma"
-BROKER = os.getenv('MQTT_BROKER', 'mosquitto')
-PORT = int(os.getenv('MQTT_PORT', 1883))
-USERNAME = os.getenv('USERNAME', 'inesc')
-PASSWORD = os.getenv('PASSWORD', 'inesc')
+# Per-agent timing columns (struct of arrays); phase 0 means no phase was active
+_TIMING_COLUMNS = (('turn', np.int32), ('duration', np.float64), ('phase', np.int8))
 
+
+def _new_timing_columns(capacity: int = 64) -> Dict:
+    """Empty timing columns for one agent; 'n' counts the filled rows"""
+    columns = {name: np.empty(capacity, dtype=dtype) for name, dtype in _TIMING_COLUMNS}
+    columns['n'] = 0
+    return columns
+
+
+def _next_msg_id() -> str:
+    """Process-unique message id for outgoing headers"""
+    return f"{_MSG_ID_PREFIX}-{next(_msg_counter)}"
+
+
+def _json_bytes(data) -> bytes:
+    """Compact UTF-8 JSON, via orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+@lru_cache(maxsize=1024)
+def _canonical_value(field: str, value: str) -> Tuple[int, Tuple[str, ...]]:
+    """
+    Quantize an assessment value to (polarity code, sorted content words)
+    
+    Values that differ only in case, punctuation, word order or filler words
+    ("Yes - broken leg." / "yes, leg broken") map to the same key.
+    """
+    words = re.findall(r"[a-z0-9]+", value.lower())
+    if not words:
+        return 0, ()
+    code = _POLARITY_CODES.get(words[0], 3)
+    if code != 3:
+        words = words[1:]
+        if field in _POLARITY_ONLY_FIELDS:
+            return code, ()
+    return code, tuple(sorted(set(words) - _FILLER_WORDS))
+
+
+def _canonical_assessment(assessment: Dict[str, str]) -> Tuple:
+    """Quantize a whole assessment dict into a hashable, order-independent tuple"""
+    return tuple(sorted((field, _canonical_value(field, str(value))) for field, value in assessment.items()))
+
+
+@dataclass(slots=True, frozen=True)
 class ActionDecision:
     """
     Structured representation of an Action Agent decision
     """
-    def __init__(self, raw_decision: Dict):
-        self.raw = raw_decision
-        self.primary_action = raw_decision.get("primary_action", "continue_conversation")
-        self.alert_command_center = raw_decision.get("alert_command_center", False)
-        self.urgency_level = raw_decision.get("urgency_level", "routine")
-        self.reasoning = raw_decision.get("reasoning", "")
-        self.next_phase = raw_decision.get("next_phase", None)
-        self.specialized_equipment = raw_decision.get("specialized_equipment_needed", [])
-        
-    def should_continue_phase(self) -> bool:
-        """Check if should continue current phase"""
-        return self.primary_action == "continue_conversation"
-    
-    def should_transition_phase_2(self) -> bool:
-        """Check if should transition to Phase 2"""
-        return self.primary_action == "transition_to_phase_2"
-    
-    def should_evacuate(self) -> bool:
-        """Check if should evacuate immediately"""
-        return self.primary_action == "evacuate_immediately"
-    
-    def should_abort(self) -> bool:
-        """Check if should abort and alert command center"""
-        return self.primary_action == "abort_and_alert"
+    raw: Dict
+    primary_action: str
+    alert_command_center: bool
+    urgency_level: str
+    reasoning: str
+    next_phase: Optional[int]
+    specialized_equipment: List[str]
+    emergency: bool  # urgency_level is critical/emergency; fixed at construction
     
-    def should_complete(self) -> bool:
-        """Check if interaction should complete"""
-        return self.primary_action == "complete"
+    @classmethod
+    def from_raw(cls, raw_decision: Dict) -> 'ActionDecision':
+        """Build a decision from the Action Agent's dict, filling in defaults"""
+        urgency_level = raw_decision.get("urgency_level", "routine")
+        return cls(
+            raw=raw_decision,
+            primary_action=raw_decision.get("primary_action", "continue_conversation"),
+            alert_command_center=raw_decision.get("alert_command_center", False),
+            urgency_level=urgency_level,
+            reasoning=raw_decision.get("reasoning", ""),
+            next_phase=raw_decision.get("next_phase", None),
+            specialized_equipment=raw_decision.get("specialized_equipment_needed", []),
+            emergency=urgency_level in _UNCACHEABLE_URGENCY
+        )
     
     def is_emergency(self) -> bool:
         """Check if this is an emergency situation"""
-        return self.urgency_level in ["critical", "emergency"]
+        return self.emergency
 
 
 class PhaseController:
@@ -89,24 +282,37 @@ class PhaseController:
     
     This controller orchestrates the interaction between all agents and implements the
     turn-by-turn action evaluation architecture specified in the system design.
+    
+    A workflow runs synchronously on one thread. Agent calls that do not depend
+    on each other overlap on a small thread pool:
+    - Phase 1: the next question is generated while the Action Agent decides,
+      and a draft of it while the victim is still answering
+    - Phase 2: the comfort assessment update and next comfort message run
+      while the Action Agent decides on the previous assessment
+    - the final triage starts during a decision the plan cache expects to end
+      the workflow
     """
     
+    # Phase 1 fields that must be known to skip straight to Phase 2
+    _CRITICAL_FIELDS = frozenset({"injuries", "breathing", "can_walk", "immediate_danger", "consciousness"})
+    
     def __init__(
         self,
-        assessment_agent: AssessmentAgent,
-        dialog_agent: DialogueAgent,
-        comfort_agent: ComfortAgent,
-        comfort_assessment_agent: ComfortAssessmentAgent,
-        triage_agent: TriageAgent,
-        action_agent: ActionAgent,
+        assessment_agent: 'AssessmentAgent',
+        dialog_agent: 'DialogueAgent',
+        comfort_agent: 'ComfortAgent',
+        comfort_assessment_agent: 'ComfortAssessmentAgent',
+        triage_agent: 'TriageAgent',
+        action_agent: 'ActionAgent',
         report_queue,
         loop,
         event,
         robotname,
-        victim_agent: Optional[VictimAgent] = None,
+        victim_agent: Optional['VictimAgent'] = None,
         mqtt_manager: Optional['MQTTManager'] = None,
         verbose: bool = True,
         local: bool = True,
+        decision_cache_path: Optional[str] = ACTION_CACHE_PATH,
     ):
         """
         Initialize Phase Controller with all required agents.
@@ -121,6 +327,9 @@ class PhaseController:
             victim_agent: Optional victim simulation agent for testing
             mqtt_manager: Optional MQTT manager for command center communication
             verbose: Whether to print detailed progress information
+            decision_cache_path: SQLite file persisting Action Agent decisions across
+                sessions, or None (the default unless ACTION_CACHE_PATH is set)
+                to keep the decision cache in memory only
         """
         self.assessment_agent = assessment_agent
         self.dialog_agent = dialog_agent
@@ -130,6 +339,18 @@ class PhaseController:
         self.action_agent = action_agent
         self.victim_agent = victim_agent
         self.mqtt_manager = mqtt_manager
+        # Alerts are published from a background thread so the broker never
+        # holds up a conversation turn
+        self._alert_queue: "Queue[Optional[Dict]]" = Queue(maxsize=ALERT_QUEUE_SIZE)
+        self._alert_worker = None
+        # Owned by the alert thread: JSON fragments reused between alerts
+        self._alert_prefix: Tuple[Optional[str], bytes] = (None, b"")
+        self._alert_sections: Dict[str, Tuple[Dict, bytes]] = {}
+        if mqtt_manager is not None:
+            self._alert_worker = threading.Thread(
+                target=self._drain_alert_queue, name="cc-alerts", daemon=True
+            )
+            self._alert_worker.start()
         self.verbose = verbose
         self.local = local
         self.report_queue = report_queue
@@ -140,84 +361,181 @@ class PhaseController:
         # State tracking
         self.current_phase = None  # 1, 2, or None
         self.conversation_history = []
+        self._report_blocks = []  # Transcript section of the report, one block per log entry
+        self._recent_exchanges = deque(maxlen=6)  # Last 6 log entries (3 turns) for the Action Agent
         self.action_decisions = []  # Audit trail of all decisions
+        self._last_decision: Optional[ActionDecision] = None  # Reused on uneventful turns
+        self.decision_cache = OrderedDict()  # LRU of state hash -> raw Action Agent decision
+        self._reused_decisions = 0  # Consecutive turns that reused the previous decision
+        self._speculative_triage = None  # (phase 1, phase 2 assessment, future) started early
+        self._decision_db = self._open_decision_db(decision_cache_path) if decision_cache_path else None
+        
+        # primary_action -> handler; actions not listed fall back to _unknown_action
+        self._phase_1_handlers = {
+            "continue_conversation": self._continue_phase,
+            "transition_to_phase_2": self._phase_1_transition,
+            "evacuate_immediately": self._phase_1_evacuate,
+            "abort_and_alert": self._phase_1_abort
+        }
+        self._phase_2_handlers = {
+            "continue_conversation": self._phase_2_continue,
+            "evacuate_immediately": self._phase_2_evacuate,
+            "abort_and_alert": self._phase_2_emergency,
+            "complete": self._phase_2_complete
+        }
+        # Runs next-message generation alongside the Action Agent decision and the STT wait
+        self._agent_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="phase-agent")
         self.turn_count = 0
         self.phase_1_turns = 0
         self.phase_2_turns = 0
         
-        # Timing data for performance analysis
-        self.timing_data = {
-            'dialogue_agent': [],
-            'assessment_agent': [],
-            'comfort_agent': [],
-            'comfort_assessment_agent': [],
-            'action_agent': [],
-            'victim_agent': []
-        }
+        # Timing data for performance analysis, grown by doubling.
+        # Recorded from both the controller thread and the agent pool.
+        self._timings = {agent: _new_timing_columns() for agent in TIMED_AGENTS}
+        self._timing_lock = threading.Lock()
 
         if not self.local:
             self.stt_queue = Queue()
-            self.dialog_client = mqtt.Client(userdata=self.robotname)
-            self.dialog_client.will_set("victim/dialogmanager2/lwt", "offline")
-            self.dialog_client.on_connect = self.on_connect
-            self.dialog_client.on_message = self.on_stt_message
-            self.dialog_client.username_pw_set(USERNAME,PASSWORD)
-            self.dialog_client.connect(BROKER, PORT)
-            self.dialog_client.loop_start()
+            # All controllers share one broker connection and network thread
+            self._bus = MQTTBus.instance()
+            self.dialog_client = self._bus.client
+            self._stt_topic = f"victim/text2speech2text/stt-{self.robotname}"
+            self._bus.subscribe(self._stt_topic, self.on_stt_message)
             self.first_message = True
         self.victim_id = ""
+        # Set once the workflow starts; agent prompt prefixes must not change after that
+        self._prompt_prefix_frozen = False
+        self._ctx_caps = None  # Which agents accept a situation context, probed once
+        self._situation_context = ""  # Snapshot taken when the prompt prefix is frozen
+        self._situation_digest = ""  # Hash of that snapshot, part of every decision cache key
 
+        # TTS goes to our own speech module only, so it is msgpack-encoded;
+        # command center traffic stays JSON
+        self._tts_topic = f"victim/text2speech2text/tts-{self.robotname}"
+        self._timestamp_second = None
+        self._timestamp_text = ""
 
-    def on_connect(self, client, userdata, flags, rc):
-        if rc == 0:
-            print("✅ Connected to broker")
-            self.dialog_client.subscribe("victim/text2speech2text/lwt")
-            self.dialog_client.subscribe(f"victim/text2speech2text/stt-{userdata}")                
-            self.dialog_client.publish("victim/dialogmanager2/lwt", "online")
-        else:
-            print("❌ Bad connection. Returned code=", rc)    
 
+    def on_stt_message(self, msg: mqtt.MQTTMessage):
+        """Bus handler for this robot's STT topic; keeps to the victim this controller is serving"""
+        if msg.payload:
+            try:
+                data = json.loads(msg.payload)["data"]
+                victim_id = data["victim_id"]
+            except (ValueError, KeyError, TypeError) as e:
+                # ValueError covers undecodable bytes as well as invalid JSON
+                logger.warning("⚠️  Ignoring malformed STT message on %s: %s", msg.topic, e)
+                return
+            if self.victim_id and victim_id != self.victim_id:
+                return
+            self.victim_id = victim_id
+            #print(f"VICTIM: {message}")
+
+            self.stt_queue.put(data)
 
-    def on_stt_message(self, client, userdata, msg):
-        if msg.payload.decode() != "":
-            msg_topic = msg.topic
-            if msg_topic == "victim/text2speech2text/lwt":
-                print(f"Text2speech2Text status update: {msg.payload.decode()}")         
-            else:    
-                response = json.loads(msg.payload.decode())
-                data = response["data"]
-                self.victim_id = data["victim_id"]
-                #print(f"VICTIM: {message}")
+            if self.first_message:
+                self.first_message = False
+                self.dialog_client.publish(self._stt_topic, payload="", qos=1, retain=True)
 
-                self.stt_queue.put(data)
+    def close(self):
+        """
+        Detach from the shared MQTT bus (the connection itself stays up for other
+        rescues) and let pending command center alerts go out
+        """
+        if not self.local:
+            self._bus.unsubscribe(self._stt_topic, self.on_stt_message)
+        if self._alert_worker is not None:
+            try:
+                self._alert_queue.put(None, timeout=ALERT_DRAIN_TIMEOUT)
+            except Full:
+                pass
+            self._alert_worker.join(timeout=ALERT_DRAIN_TIMEOUT)
+            if self._alert_worker.is_alive():
+                logger.warning("⚠️  %d command center alerts not published before shutdown",
+                               self._alert_queue.qsize())
+            self._alert_worker = None
+        # Drop queued drafts; a running agent call is left to finish on its own
+        self._agent_pool.shutdown(wait=False, cancel_futures=True)
+        if self._decision_db is not None:
+            self._decision_db.close()
+            self._decision_db = None
+    
+    def _drain_alert_queue(self):
+        """Alert publisher thread: hands queued alerts to the MQTT manager in order"""
+        while True:
+            alert_data = self._alert_queue.get()
+            if alert_data is None:
+                return
+            try:
+                payload = self._encode_alert(alert_data) if self.mqtt_manager.encoding == "json" else alert_data
+                if not self.mqtt_manager.publish(topic=ALERT_TOPIC, data=payload, qos=1):  # At least once delivery
+                    logger.warning("⚠️  MQTT send failed for %s alert", alert_data["urgency_level"])
+            except Exception as e:
+                logger.warning("⚠️  MQTT send failed: %s", e)
+    
+    def _encode_alert(self, alert_data: Dict) -> bytes:
+        """
+        Serialize an alert as JSON, re-encoding only what changed since the last one.
 
-                if self.first_message:
-                    self.first_message = False
-                    self.dialog_client.publish(f"victim/text2speech2text/stt-{userdata}", payload="", qos=1, retain=True)        
+        The robot/victim identification is encoded once per victim and each
+        assessment section is reused as long as it compares equal to the
+        previous alert's; only the per-turn fields are encoded every time.
+        """
+        if self._alert_prefix[0] != self.victim_id:
+            ids = _json_bytes({"robot_id": self.robotname, "victim_id": self.victim_id})
+            self._alert_prefix = (self.victim_id, ids[:-1] + b",")
+        parts = [self._alert_prefix[1]]
+        
+        turn_fields = {k: v for k, v in alert_data.items() if k not in _ALERT_ASSESSMENT_KEYS}
+        parts.append(_json_bytes(turn_fields)[1:-1])
+        
+        for key in _ALERT_ASSESSMENT_KEYS:
+            section = alert_data[key]
+            cached = self._alert_sections.get(key)
+            if cached is None or cached[0] != section:
+                cached = (section, _json_bytes(section))
+                self._alert_sections[key] = cached
+            parts.append(b',"%s":%s' % (key.encode(), cached[1]))
+        parts.append(b"}")
+        return b"".join(parts)
     
     def change_to_backup_system(self,victim_response):
         if self.loop is not None:
+            # report_queue belongs to the dialog manager's event loop, while this
+            # controller runs in a worker thread (asyncio.to_thread)
             self.loop.call_soon_threadsafe(
-                asyncio.create_task, self.report_queue.put({"info": "fail", "data": victim_response})
-        ) 
+                self.report_queue.put_nowait, {"info": "fail", "data": victim_response}
+            )
+        # Set directly: run_conversation checks it on this thread right after we return
         self.event.set()
 
     def set_victim_agent(self, victim_agent):
         """Set or update the victim agent for testing scenarios"""
         self.victim_agent = victim_agent
         if self.verbose:
-            print(f"✓ Victim agent configured for testing mode")
+            logger.info("✓ Victim agent configured for testing mode")
     
     def set_situation_context(self, context: str):
         """Set the disaster situation context for all agents"""
-        if hasattr(self.dialog_agent, 'set_situation_context'):
+        if self._prompt_prefix_frozen:
+            if self.verbose:
+                logger.info("ℹ️  Situation context is fixed once the workflow has started - ignoring update")
+            return
+        if self._ctx_caps is None:
+            self._ctx_caps = (
+                callable(getattr(self.dialog_agent, 'set_situation_context', None)),
+                hasattr(self.dialog_agent, 'situation_context'),
+                callable(getattr(self.comfort_agent, 'set_situation_context', None)),
+            )
+        dialog_setter, dialog_attr, comfort_setter = self._ctx_caps
+        if dialog_setter:
             self.dialog_agent.set_situation_context(context)
-        if hasattr(self.dialog_agent, 'situation_context'):
+        if dialog_attr:
             self.dialog_agent.situation_context = context
-        if hasattr(self.comfort_agent, 'set_situation_context'):
+        if comfort_setter:
             self.comfort_agent.set_situation_context(context)
         if self.verbose:
-            print(f"ℹ️  Situation context set: {context}")
+            logger.info("ℹ️  Situation context set: %s", context)
         
     def determine_entry_point(self, prior_assessment: Optional[Dict] = None) -> int:
         """
@@ -231,20 +549,16 @@ class PhaseController:
         """
         if prior_assessment and self._is_assessment_sufficient(prior_assessment):
             if self.verbose:
-                print("\n🔄 Prior assessment detected - Starting at Phase 2 (Comfort)")
+                logger.info("\n🔄 Prior assessment detected - Starting at Phase 2 (Comfort)")
             return 2
         else:
             if self.verbose:
-                print("\n🔄 No prior assessment - Starting at Phase 1 (Initial Assessment)")
+                logger.info("\n🔄 No prior assessment - Starting at Phase 1 (Initial Assessment)")
             return 1
     
     def _is_assessment_sufficient(self, assessment: Dict) -> bool:
         """Check if prior assessment has sufficient information to skip Phase 1"""
-        critical_fields = ["injuries", "breathing", "can_walk", "immediate_danger", "consciousness"]
-        for field in critical_fields:
-            if assessment.get(field, "unknown") == "unknown":
-                return False
-        return True
+        return not any(assessment.get(field, "unknown") == "unknown" for field in self._CRITICAL_FIELDS)
     
     def execute_full_workflow(
         self,
@@ -266,14 +580,18 @@ class PhaseController:
             Dictionary with complete results including assessments, triage, and action log
         """
         if self.verbose:
-            print("\n" + "="*80)
-            print("🚁 RESCUE ROBOT WORKFLOW - CONTINUOUS ACTION DECISION ARCHITECTURE")
-            print("="*80)
+            logger.info("\n%s\n🚁 RESCUE ROBOT WORKFLOW - CONTINUOUS ACTION DECISION ARCHITECTURE\n%s",
+                        _BANNER_RULE, _BANNER_RULE)
         
         # Set situation context
         if situation_context:
             self.dialog_agent.set_situation_context(situation_context)
         
+        # From here on only conversation turns are appended to agent prompts
+        self._prompt_prefix_frozen = True
+        self._situation_context = getattr(self.dialog_agent, 'situation_context', '')
+        self._situation_digest = hashlib.sha1(self._situation_context.encode('utf-8')).hexdigest()
+        
         # Determine entry point
         entry_phase = self.determine_entry_point(prior_assessment)
         
@@ -345,35 +663,37 @@ class PhaseController:
             return results,self.victim_id
             
         except Exception as e:
-            print(f"\n❌ ERROR in workflow execution: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("\n❌ ERROR in workflow execution: %s", e)
             results["exit_reason"] = f"ERROR: {str(e)}"
             return results,self.victim_id
         
-    def _robot_speak(self,question):
+    def _robot_speak(self,question) -> mqtt.MQTTMessageInfo:
         #if self.local:
         #    self.audio_manager.text_to_speech(question)
         #else:
 
-        
-        json_msg = {
-            "header":{
-                    "sender": "dialogManager",
-                    "msg_id": str(uuid.uuid4()),
-                    "utc_timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-                    "msg_type": "UGV's message",
-                    "msg_content": f"victim/text2speech2text/tts-{self.robotname}"},
-            "data":{
+        tts_msg = {
+            "header": {
+                "sender": "dialogManager",
+                "msg_id": _next_msg_id(),
+                "utc_timestamp": self._utc_timestamp(),
+                "msg_type": "UGV's message",
+                "msg_content": self._tts_topic},
+            "data": {
                 "message": question,
                 "victim_id": self.victim_id,
+                "last_message": False}
             }
-        }  
 
-        json_msg["data"]["last_message"] = False
-        json_msg = json.dumps(json_msg)
-
-        self.dialog_client.publish(f"victim/text2speech2text/tts-{self.robotname}",str(json_msg))   
+        return self._bus.publish(self._tts_topic, msgpack.packb(tts_msg, use_bin_type=True), qos=0, retain=False, alias=True)
+    
+    def _utc_timestamp(self) -> str:
+        """UTC header timestamp, formatted at most once per second"""
+        second = int(time.time())
+        if second != self._timestamp_second:
+            self._timestamp_second = second
+            self._timestamp_text = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+        return self._timestamp_text
     
     def execute_phase_1(self, max_turns: int = 15) -> Dict:
         """
@@ -393,26 +713,21 @@ class PhaseController:
         self.current_phase = 1
         
         if self.verbose:
-            print("\n" + "="*80)
-            print("📋 PHASE 1: INITIAL ASSESSMENT")
-            print("="*80)
-            print("Goal: Extract critical safety and injury information")
-            print("Decision Point: After EVERY turn - Action Agent evaluates next move")
-            print("="*80 + "\n")
+            logger.info(
+                "\n%s\n📋 PHASE 1: INITIAL ASSESSMENT\n%s\n"
+                "Goal: Extract critical safety and injury information\n"
+                "Decision Point: After EVERY turn - Action Agent evaluates next move\n%s\n",
+                _BANNER_RULE, _BANNER_RULE, _BANNER_RULE
+            )
         
         # Generate initial greeting
         start_time = time.time()
         robot_question = self.dialog_agent.get_initial_response()
         elapsed = time.time() - start_time
-        self.timing_data['dialogue_agent'].append({
-            'turn': 0,
-            'duration': elapsed,
-            'phase': 1
-        })
+        self._record_timing('dialogue_agent', 0, elapsed, 1)
         
         if self.verbose:
-            print(f"🤖 Robot: {robot_question}")
-            print(f"⏱️  Dialogue Agent: {elapsed:.2f}s\n")
+            logger.info("🤖 Robot: %s\n⏱️  Dialogue Agent: %.2fs\n", robot_question, elapsed)
         
         self._add_to_conversation_log(1, 0, "robot", robot_question, elapsed)
         
@@ -423,16 +738,21 @@ class PhaseController:
 
             self._robot_speak(robot_question)
 
+            # Use the time the victim is speaking to draft the next question,
+            # assuming a short affirmative answer to the current one
+            draft_cancel = threading.Event()
+            speculation = self._agent_pool.submit(self._speculate_next_phase_1_question, draft_cancel)
+
             if self.verbose:
-                print(f"\n{'─'*80}")
-                print(f"🔄 PHASE 1 - TURN {self.phase_1_turns}")
-                print(f"{'─'*80}")
+                logger.info("\n%s\n🔄 PHASE 1 - TURN %d\n%s", _TURN_RULE, self.phase_1_turns, _TURN_RULE)
             
             # Get victim response
             victim_response = self._get_victim_response(robot_question)
+            # A draft still generating is aborted so it does not hold up the assessment
+            draft_cancel.set()
             if not victim_response:
                 if self.verbose:
-                    print("⚠️  No response from victim - ending Phase 1")
+                    logger.warning("⚠️  No response from victim - ending Phase 1")
                 return {
                     "assessment": self.assessment_agent.get_assessment(),
                     "exit_reason": "no_victim_response",
@@ -445,14 +765,16 @@ class PhaseController:
             if assessment_updates == False:
                 return "LLM FAIL"
             
+            # One copy of the updated assessment serves the whole turn
+            assessment_snapshot = self.assessment_agent.get_assessment()
+
             topic = f"dialogmanager/ugv/{self.robotname}"
-            data = self.assessment_agent.get_assessment()
-            data["victim_id"] = self.victim_id
+            data = dict(assessment_snapshot, victim_id=self.victim_id)
             status_report_msg = {
                 "header": {
                     "sender": "dialogManager",
-                    "msg_id": str(uuid.uuid4()),
-                    "utc_timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "msg_id": _next_msg_id(),
+                    "utc_timestamp": self._utc_timestamp(),
                     "msg_type": "Creation",
                     "msg_content": topic},
                 "data": data
@@ -460,60 +782,78 @@ class PhaseController:
 
             json_msg = json.dumps(status_report_msg)
 
-            result = self.dialog_client.publish(topic, json_msg, retain=True)
-            result.wait_for_publish()   # ✅ wait until actually sent
+            # No wait_for_publish(): paho's network thread drains its outgoing
+            # queue in order, so this goes out ahead of the next TTS publish
+            self.dialog_client.publish(topic, json_msg, retain=True)
             
             if self.loop is not None:
-                self.loop.call_soon_threadsafe(
-                    asyncio.create_task, self.report_queue.put(assessment_updates)
-                )
+                self.loop.call_soon_threadsafe(self.report_queue.put_nowait, assessment_updates)
+
+            speculative_question = self._take_speculative_question(speculation, victim_response)
+
+            # The next question only depends on the updated assessment, so it is
+            # generated speculatively while the Action Agent decides
+            next_question = self._agent_pool.submit(self._generate_next_phase_1_question, speculative_question)
 
             # CRITICAL: Action Agent Decision Point
-            action_decision = self._evaluate_action_decision()
+            action_decision = self._evaluate_action_decision(
+                assessment_changed=bool(assessment_updates),
+                assessment=assessment_snapshot
+            )
 
             if action_decision == None:
+                next_question.cancel()
                 self.change_to_backup_system(victim_response)
                 return "LLM FAIL"
             
+            self.action_decisions[-1]['speculative_question'] = "hit" if speculative_question else "miss"
+            
             # Send command center alert if requested
             if action_decision.alert_command_center:
                 self._alert_command_center(action_decision.raw)
             
             # Handle action decision
-            decision_handler_result = self._handle_phase_1_action_decision(action_decision)
+            decision_handler_result = self._handle_phase_1_action_decision(action_decision, assessment_snapshot)
             
             if decision_handler_result["should_exit"]:
+                # Speculative question is discarded
+                next_question.cancel()
                 return {
-                    "assessment": self.assessment_agent.get_assessment(),
+                    "assessment": assessment_snapshot,
                     "exit_reason": decision_handler_result["exit_reason"],
                     "next_phase": decision_handler_result.get("next_phase", None)
                 }
             
-            # Continue conversation - generate next question
-            robot_question = self._generate_next_phase_1_question()
+            # Continue conversation - use the question generated alongside the decision
+            robot_question, elapsed = next_question.result()
 
             if robot_question == None:
                 self.change_to_backup_system(victim_response)
                 return "LLM FAIL"
             
+            if robot_question:
+                # Only a question that is going to be spoken enters the dialogue history
+                self.dialog_agent.add_to_history("robot", robot_question)
+                self.dialog_agent.last_robot_question = robot_question
+                self._log_robot_message(1, self.phase_1_turns, robot_question, elapsed)
             
             if not robot_question:  # Assessment complete
                 if self.verbose:
-                    print("\n✅ Phase 1 Assessment Complete")
+                    logger.info("\n✅ Phase 1 Assessment Complete")
                 
                 # Final action decision for phase completion
-                final_decision = self._evaluate_action_decision()
-                final_handler_result = self._handle_phase_1_action_decision(final_decision)
+                final_decision = self._evaluate_action_decision(assessment=assessment_snapshot)
+                final_handler_result = self._handle_phase_1_action_decision(final_decision, assessment_snapshot)
                 
                 return {
-                    "assessment": self.assessment_agent.get_assessment(),
+                    "assessment": assessment_snapshot,
                     "exit_reason": final_handler_result["exit_reason"],
                     "next_phase": final_handler_result.get("next_phase", 2)
                 }
         
         # Max turns reached
         if self.verbose:
-            print(f"\n⚠️  Phase 1 max turns ({max_turns}) reached")
+            logger.warning("\n⚠️  Phase 1 max turns (%d) reached", max_turns)
         
         return {
             "assessment": self.assessment_agent.get_assessment(),
@@ -526,9 +866,10 @@ class PhaseController:
         Execute Phase 2: Comfort & Special Needs with continuous action decision-making.
         
         After each victim response:
-        1. Update comfort assessment
-        2. Evaluate action decision (can escalate priority, detect deterioration, abort early)
-        3. Handle decision
+        1. Update comfort assessment and, in parallel, evaluate the action decision on
+           the previous assessment plus the new reply (can escalate priority, detect
+           deterioration, abort early); re-evaluate if a critical medical field changed
+        2. Handle decision
         
         Args:
             max_turns: Maximum conversation turns for Phase 2
@@ -539,29 +880,27 @@ class PhaseController:
         self.current_phase = 2
         
         if self.verbose:
-            print("\n" + "="*80)
-            print("💬 PHASE 2: COMFORT & SPECIAL NEEDS")
-            print("="*80)
-            print("Goal: Provide emotional support and gather detailed medical information")
-            print("Decision Point: After EVERY turn - Action Agent monitors for critical needs")
-            print("="*80 + "\n")
+            logger.info(
+                "\n%s\n💬 PHASE 2: COMFORT & SPECIAL NEEDS\n%s\n"
+                "Goal: Provide emotional support and gather detailed medical information\n"
+                "Decision Point: After EVERY turn - Action Agent monitors for critical needs\n%s\n",
+                _BANNER_RULE, _BANNER_RULE, _BANNER_RULE
+            )
         
         # Generate initial comfort message
         start_time = time.time()
         robot_message = self.comfort_agent.get_initial_message()
         elapsed = time.time() - start_time
-        self.timing_data['comfort_agent'].append({
-            'turn': 0,
-            'duration': elapsed,
-            'phase': 2
-        })
+        self._record_timing('comfort_agent', 0, elapsed, 2)
         
         if self.verbose:
-            print(f"🤖 Robot: {robot_message}")
-            print(f"⏱️  Comfort Agent: {elapsed:.2f}s\n")
+            logger.info("🤖 Robot: %s\n⏱️  Comfort Agent: %.2fs\n", robot_message, elapsed)
         
         self._add_to_conversation_log(2, 0, "robot", robot_message, elapsed)
         
+        # Whether the comfort assessment changed since the last decision was made
+        snapshot_changed = True
+        
         # Main comfort loop with action decision points
         while self.phase_2_turns < max_turns:
             self.phase_2_turns += 1
@@ -570,25 +909,49 @@ class PhaseController:
             self._robot_speak(robot_message)
             
             if self.verbose:
-                print(f"\n{'─'*80}")
-                print(f"🔄 PHASE 2 - TURN {self.phase_2_turns}")
-                print(f"{'─'*80}")
+                logger.info("\n%s\n🔄 PHASE 2 - TURN %d\n%s", _TURN_RULE, self.phase_2_turns, _TURN_RULE)
             
             # Get victim response
             victim_response = self._get_victim_response(robot_message)
             if not victim_response:
                 if self.verbose:
-                    print("⚠️  No response from victim - ending Phase 2")
+                    logger.warning("⚠️  No response from victim - ending Phase 2")
                 return {
                     "comfort_assessment": self.comfort_assessment_agent.get_assessment(),
                     "exit_reason": "no_victim_response"
                 }
             
-            # Update comfort assessment
-            comfort_updates = self._update_comfort_assessment(robot_message, victim_response)
+            # The comfort update (and the next message, which depends on it) runs
+            # alongside the Action Agent. The decision sees the victim's new reply in
+            # the recent conversation, but the comfort assessment as of last turn.
+            comfort_snapshot = self.comfort_assessment_agent.get_assessment()
+            skip_message = threading.Event()
+            turn_work = self._agent_pool.submit(
+                self._update_comfort_and_generate, robot_message, victim_response, skip_message
+            )
             
             # CRITICAL: Action Agent Decision Point (with Phase 1 + Phase 2 data)
-            action_decision = self._evaluate_action_decision()
+            action_decision = self._evaluate_action_decision(
+                assessment_changed=snapshot_changed, comfort_assessment=comfort_snapshot
+            )
+            if self._phase_2_decision_exits(action_decision):
+                skip_message.set()
+            
+            comfort_updates, (robot_message, elapsed) = turn_work.result()
+            snapshot_changed = bool(comfort_updates)
+            
+            # A reused or cached decision never looked at this turn's reply, so
+            # once that reply has updated the assessment it is decided afresh
+            decided_on_stale_turn = (
+                self.action_decisions[-1].get('reused_previous')
+                or self.action_decisions[-1].get('cache_hit')
+            )
+            if comfort_updates and (decided_on_stale_turn
+                                    or not _PHASE_2_RECHECK_FIELDS.isdisjoint(comfort_updates)):
+                if self.verbose:
+                    logger.info("🔁 Comfort assessment updated - re-evaluating action decision")
+                action_decision = self._evaluate_action_decision()
+                snapshot_changed = False
             
             # Send command center alert if requested
             if action_decision.alert_command_center:
@@ -598,17 +961,22 @@ class PhaseController:
             decision_handler_result = self._handle_phase_2_action_decision(action_decision)
             
             if decision_handler_result["should_exit"]:
+                # The message generated alongside the decision is discarded
                 return {
                     "comfort_assessment": self.comfort_assessment_agent.get_assessment(),
                     "exit_reason": decision_handler_result["exit_reason"]
                 }
             
-            # Continue conversation - generate next comfort message
-            robot_message = self._generate_next_phase_2_message()
+            if skip_message.is_set():
+                # The re-evaluated decision overturned an exit: generate the message now
+                robot_message, elapsed = self._generate_next_phase_2_message()
+            
+            if robot_message:
+                self._log_robot_message(2, self.phase_2_turns, robot_message, elapsed)
             
             if not robot_message:  # Comfort assessment complete
                 if self.verbose:
-                    print("\n✅ Phase 2 Comfort Assessment Complete")
+                    logger.info("\n✅ Phase 2 Comfort Assessment Complete")
                 
                 return {
                     "comfort_assessment": self.comfort_assessment_agent.get_assessment(),
@@ -617,7 +985,7 @@ class PhaseController:
         
         # Max turns reached
         if self.verbose:
-            print(f"\n⚠️  Phase 2 max turns ({max_turns}) reached")
+            logger.warning("\n⚠️  Phase 2 max turns (%d) reached", max_turns)
         
         return {
             "comfort_assessment": self.comfort_assessment_agent.get_assessment(),
@@ -627,9 +995,9 @@ class PhaseController:
     # ===== Internal Helper Methods =====
 
     def wait_for_victim(self):
-        print("Waiting for victim...")
+        logger.info("Waiting for victim...")
         data = self.stt_queue.get()
-        print("Victim Found -> ", data["victim_id"])
+        logger.info("Victim Found ->  %s", data["victim_id"])
         
     
     def _get_victim_response(self, robot_question: str) -> str:
@@ -641,7 +1009,7 @@ class PhaseController:
             victim_response = self.victim_agent.generate_response(robot_question)
         else:
             for attempt in range(max_retries):
-                print(f"\n--- Listening Attempt {attempt + 1}/{max_retries} ---")
+                logger.info("\n--- Listening Attempt %d/%d ---", attempt + 1, max_retries)
                 #if self.local:
                     #victim_response = self.audio_manager.speech_to_text(max_duration=12)
                 #else:
@@ -658,23 +1026,12 @@ class PhaseController:
                         #if self.local:
                             #self.audio_manager.text_to_speech(retry_message)
                         #else:
-                        json_msg = {
-                            "header":{
-                                    "sender": "dialogManager",
-                                    "msg_id": str(uuid.uuid4()),
-                                    "utc_timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-                                    "msg_type": "UGV's message",
-                                    "msg_content": f"victim/text2speech2text/tts-{self.robotname}"},
-                            "data":{
-                                "message": retry_message,
-                                "victim_id": self.victim_id,
-                                "last_message": False,
-                            }
-                        }
-                        json_msg = json.dumps(json_msg)
-
-                        self.dialog_client.publish(f"victim/text2speech2text/tts-{self.robotname}",str(json_msg))
-                        time.sleep(1)
+                        # Start listening as soon as the prompt is on the wire
+                        # (paho signals QoS 0 publishes once written), not after a fixed pause
+                        try:
+                            self._robot_speak(retry_message).wait_for_publish(timeout=RETRY_PUBLISH_TIMEOUT)
+                        except (ValueError, RuntimeError) as e:
+                            logger.warning("⚠️  Retry prompt not published: %s", e)
                             
             # Production mode - would get from audio/text input
             # For now, return empty to signal need for implementation
@@ -683,16 +1040,12 @@ class PhaseController:
         elapsed = time.time() - start_time
         
         if self.victim_agent:
-            self.timing_data['victim_agent'].append({
-                'turn': self.turn_count,
-                'duration': elapsed,
-                'phase': self.current_phase
-            })
+            self._record_timing('victim_agent', self.turn_count, elapsed, self.current_phase)
         
         if self.verbose and victim_response:
-            print(f"👤 Victim: {victim_response}")
+            logger.info("👤 Victim: %s", victim_response)
             if self.victim_agent:
-                print(f"⏱️  Victim Agent: {elapsed:.2f}s")
+                logger.info("⏱️  Victim Agent: %.2fs", elapsed)
         
         if victim_response and self.current_phase is not None:
             self._add_to_conversation_log(
@@ -724,17 +1077,13 @@ class PhaseController:
         elif updates:
             self.assessment_agent.update_assessment(updates)
             if self.verbose:
-                print(f"✅ Assessment updated: {list(updates.keys())}")
+                logger.info("✅ Assessment updated: %s", list(updates))
         
         elapsed = time.time() - start_time
-        self.timing_data['assessment_agent'].append({
-            'turn': self.turn_count,
-            'duration': elapsed,
-            'phase': 1
-        })
+        self._record_timing('assessment_agent', self.turn_count, elapsed, 1)
         
         if self.verbose:
-            print(f"⏱️  Assessment Agent: {elapsed:.2f}s")
+            logger.info("⏱️  Assessment Agent: %.2fs", elapsed)
         
         return updates
     
@@ -746,290 +1095,561 @@ class PhaseController:
         if updates:
             self.comfort_assessment_agent.update_assessment(updates)
             if self.verbose:
-                print(f"✅ Comfort assessment updated: {list(updates.keys())}")
+                logger.info("✅ Comfort assessment updated: %s", list(updates))
         
         elapsed = time.time() - start_time
-        self.timing_data['comfort_assessment_agent'].append({
-            'turn': self.turn_count,
-            'duration': elapsed,
-            'phase': 2
-        })
+        self._record_timing('comfort_assessment_agent', self.turn_count, elapsed, 2)
         
         if self.verbose:
-            print(f"⏱️  Comfort Assessment Agent: {elapsed:.2f}s")
+            logger.info("⏱️  Comfort Assessment Agent: %.2fs", elapsed)
         
         return updates
     
-    def _evaluate_action_decision(self) -> ActionDecision:
+    def _evaluate_action_decision(self, assessment_changed: bool = True,
+                                  comfort_assessment: Optional[Dict] = None,
+                                  assessment: Optional[Dict] = None) -> ActionDecision:
         """
         Evaluate what action should be taken based on current state.
         This is called after EVERY turn in both phases.
+        
+        Args:
+            assessment_changed: False when the turn produced no assessment updates;
+                the previous decision of this phase is then reused, up to
+                ACTION_REFRESH_TURNS - 1 turns in a row, unless the victim's
+                newest reply mentions danger
+            comfort_assessment: Phase 2 snapshot to decide on, for when the live
+                comfort assessment is being updated concurrently
+            assessment: The turn's Phase 1 assessment snapshot, if the caller
+                already took one
         """
         start_time = time.time()
         
-        # Build comprehensive prompt with all context
-        from helpers.action_decision_builder import build_action_decision_prompt
-        
         # Safety check - should never be called with current_phase as None
         if self.current_phase is None:
             raise ValueError("_evaluate_action_decision called but current_phase is None")
         
-        print("Taking action")
-        
-        prompt = build_action_decision_prompt(
-            phase=self.current_phase,
-            assessment=self.assessment_agent.get_assessment(),
-            comfort_assessment=self.comfort_assessment_agent.get_assessment() if self.current_phase == 2 else None,
-            conversation_history=self.conversation_history[-6:],  # Last 6 exchanges (3 turns)
-            turn_number=self.turn_count,
-            phase_turn_number=self.phase_1_turns if self.current_phase == 1 else self.phase_2_turns,
-            situation_context=getattr(self.dialog_agent, 'situation_context', '')
+        logger.debug("Taking action")
+        
+        previous = self.action_decisions[-1] if self.action_decisions else None
+        fast_path = self._can_short_circuit_continue(assessment_changed, previous)
+        reused_previous = (
+            not fast_path
+            and not assessment_changed
+            and previous is not None
+            and previous['phase'] == self.current_phase
+            and previous['urgency_level'] not in _UNCACHEABLE_URGENCY
+            and self._reused_decisions < ACTION_REFRESH_TURNS - 1
+            and not self._last_reply_mentions_danger()
         )
+        cache_hit = False
         
-        # Get decision from Action Agent
-        raw_decision = self.action_agent.decide_next_action(prompt)
-        if raw_decision == False:
-            return None
+        if fast_path:
+            raw_decision = dict(_FAST_PATH_DECISION)
+        elif reused_previous:
+            self._reused_decisions += 1
+            raw_decision = self._last_decision.raw
+        else:
+            self._reused_decisions = 0
+            # Same phase, assessment and last exchange as an earlier turn -> reuse its decision
+            if assessment is None:
+                assessment = self.assessment_agent.get_assessment()
+            if self.current_phase == 2 and comfort_assessment is None:
+                comfort_assessment = self.comfort_assessment_agent.get_assessment()
+            cache_key = self._decision_cache_key(assessment, comfort_assessment)
+            raw_decision = self._cached_decision(cache_key)
+            cache_hit = raw_decision is not None
+            plan_state = (
+                self.current_phase,
+                _canonical_assessment(assessment),
+                _canonical_assessment(comfort_assessment) if self.current_phase == 2 else ()
+            )
+            
+            if not cache_hit:
+                self._speculate_final_triage(plan_state, assessment, comfort_assessment)
+                
+                # Instructions and situation context are identical every turn of a phase,
+                # so they go first where the model server can reuse their cached prefix
+                prefix = build_static_prefix(
+                    self.current_phase,
+                    self._situation_context
+                )
+                prompt = build_dynamic_suffix(
+                    phase=self.current_phase,
+                    assessment=assessment,
+                    comfort_assessment=comfort_assessment if self.current_phase == 2 else None,
+                    conversation_history=list(self._recent_exchanges),
+                    turn_number=self.turn_count,
+                    phase_turn_number=self.phase_1_turns if self.current_phase == 1 else self.phase_2_turns
+                )
+                
+                # Get decision from Action Agent
+                raw_decision = self.action_agent.decide_next_action(prompt, prefix=prefix)
+                if raw_decision == False:
+                    return None
+                
+                self._store_decision(cache_key, raw_decision)
+            
+            with _plan_cache_lock:
+                _plan_cache[plan_state] = raw_decision.get("primary_action", "continue_conversation")
+                _plan_cache.move_to_end(plan_state)
+                if len(_plan_cache) > PLAN_CACHE_SIZE:
+                    _plan_cache.popitem(last=False)
         
-        decision = ActionDecision(raw_decision)
+        decision = ActionDecision.from_raw(raw_decision)
         
         elapsed = time.time() - start_time
-        self.timing_data['action_agent'].append({
-            'turn': self.turn_count,
-            'duration': elapsed,
-            'phase': self.current_phase
-        })
+        self._record_timing('action_agent', self.turn_count, elapsed, self.current_phase)
         
         # Log decision for audit trail
-        self.action_decisions.append({
-            'turn': self.turn_count,
-            'phase': self.current_phase,
-            'decision': decision.raw,
-            'timing': elapsed
-        })
+        self._log_decision(decision, timing=elapsed, cache_hit=cache_hit,
+                           reused_previous=reused_previous, fast_path=fast_path)
         
         if self.verbose:
-            print(f"\n🎯 ACTION DECISION:")
-            print(f"   • Action: {decision.primary_action}")
-            print(f"   • Alert CC: {decision.alert_command_center}")
-            print(f"   • Urgency: {decision.urgency_level}")
-            print(f"   • Reasoning: {decision.reasoning}")
+            logger.info(
+                "\n🎯 ACTION DECISION:\n   • Action: %s\n   • Alert CC: %s\n   • Urgency: %s\n   • Reasoning: %s",
+                decision.primary_action, decision.alert_command_center,
+                decision.urgency_level, decision.reasoning
+            )
             if decision.specialized_equipment:
-                print(f"   • Equipment Needed: {', '.join(decision.specialized_equipment)}")
-            print(f"⏱️  Action Agent: {elapsed:.2f}s")
+                logger.info("   • Equipment Needed: %s", ', '.join(decision.specialized_equipment))
+            source = (" (fast path)" if fast_path else " (previous decision)" if reused_previous
+                      else " (cached)" if cache_hit else "")
+            logger.info("⏱️  Action Agent: %.2fs%s", elapsed, source)
         
         return decision
     
-    def _handle_phase_1_action_decision(self, decision: ActionDecision) -> Dict:
+    def _open_decision_db(self, path: str) -> Optional[sqlite3.Connection]:
+        """Open (creating if needed) the persistent decision cache and prune stale entries"""
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            # Opened on the dialog manager thread, used from the to_thread worker
+            db = sqlite3.connect(path, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS action_cache ("
+                "key TEXT PRIMARY KEY, decision_json TEXT NOT NULL, "
+                "ts INTEGER NOT NULL, hits INTEGER NOT NULL DEFAULT 0)"
+            )
+            db.execute(
+                "DELETE FROM action_cache WHERE hits < 2 AND ts < ?",
+                (int(time.time()) - ACTION_CACHE_MAX_AGE,)
+            )
+            db.commit()
+            return db
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("⚠️  Decision cache at %s unavailable, keeping it in memory only: %s", path, e)
+            return None
+    
+    def _cached_decision(self, cache_key: str) -> Optional[Dict]:
+        """Look a decision up in memory, then on disk; returns a copy or None"""
+        raw_decision = self.decision_cache.get(cache_key)
+        if raw_decision is not None:
+            self.decision_cache.move_to_end(cache_key)
+            return dict(raw_decision)
+        if self._decision_db is None:
+            return None
+        try:
+            row = self._decision_db.execute(
+                "SELECT decision_json FROM action_cache WHERE key = ?", (cache_key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._decision_db.execute(
+                "UPDATE action_cache SET hits = hits + 1, ts = ? WHERE key = ?",
+                (int(time.time()), cache_key)
+            )
+            self._decision_db.commit()
+            raw_decision = json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning("⚠️  Decision cache lookup failed: %s", e)
+            return None
+        self._remember_decision(cache_key, raw_decision)
+        return dict(raw_decision)
+    
+    def _store_decision(self, cache_key: str, raw_decision: Dict):
+        """Remember a fresh Action Agent decision in memory and on disk"""
+        if raw_decision.get("urgency_level") in _UNCACHEABLE_URGENCY:
+            return
+        self._remember_decision(cache_key, raw_decision)
+        if self._decision_db is None:
+            return
+        try:
+            self._decision_db.execute(
+                "INSERT OR REPLACE INTO action_cache (key, decision_json, ts, hits) VALUES (?, ?, ?, 0)",
+                (cache_key, json.dumps(raw_decision), int(time.time()))
+            )
+            self._decision_db.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning("⚠️  Decision cache write failed: %s", e)
+    
+    def _remember_decision(self, cache_key: str, raw_decision: Dict):
+        """Add a decision to the in-memory LRU tier"""
+        self.decision_cache[cache_key] = dict(raw_decision)
+        if len(self.decision_cache) > ACTION_DECISION_CACHE_SIZE:
+            self.decision_cache.popitem(last=False)
+    
+    def _speculate_final_triage(self, plan_state: Tuple, assessment: Dict,
+                                comfort_assessment: Optional[Dict]):
+        """
+        Start the final triage on the agent pool if the plan cache predicts that
+        this turn's decision ends the workflow
+        
+        _perform_final_triage only uses the result if the assessments it ends up
+        triaging are the ones speculated on; otherwise it is discarded.
+        """
+        with _plan_cache_lock:
+            predicted = _plan_cache.get(plan_state)
+        if predicted not in _TERMINAL_ACTIONS[self.current_phase]:
+            return
+        if comfort_assessment is None:
+            comfort_assessment = self.comfort_assessment_agent.get_assessment()
+        if self._speculative_triage is not None:
+            self._speculative_triage[2].cancel()
+        self._speculative_triage = (
+            assessment,
+            comfort_assessment,
+            self._agent_pool.submit(self.triage_agent.assign_triage_priority, assessment, comfort_assessment)
+        )
+    
+    def _log_decision(self, decision: ActionDecision, **details):
+        """
+        Append a decision to the audit trail
+        
+        Entries hold the decision's fields as plain values; the Action Agent's
+        raw dict is only kept (under 'decision') in verbose mode.
+        """
+        entry = {
+            'turn': self.turn_count,
+            'phase': self.current_phase,
+            'primary_action': decision.primary_action,
+            'alert_command_center': decision.alert_command_center,
+            'urgency_level': decision.urgency_level,
+            'reasoning': decision.reasoning,
+            'specialized_equipment': tuple(decision.specialized_equipment or ()),
+            **details
+        }
+        if self.verbose:
+            entry['decision'] = decision.raw
+        self.action_decisions.append(entry)
+        self._last_decision = decision
+    
+    def _can_short_circuit_continue(self, assessment_changed: bool, previous: Optional[Dict]) -> bool:
+        """
+        Whether this turn's decision is "continue" without asking the Action Agent
+        
+        Only during the first PHASE_1_MIN_TURNS turns of Phase 1 (when the
+        transition guard would block leaving anyway), after a turn that added
+        nothing to the assessment, with no danger mentioned in the victim's reply
+        and no safety-critical decision outstanding.
+        """
+        if not ACTION_FAST_PATH or self.current_phase != 1 or assessment_changed:
+            return False
+        if self.phase_1_turns >= PHASE_1_MIN_TURNS:
+            return False
+        if previous is not None and previous['urgency_level'] in _UNCACHEABLE_URGENCY:
+            return False
+        return not self._last_reply_mentions_danger()
+    
+    def _last_reply_mentions_danger(self) -> bool:
+        """
+        Whether the victim's newest reply names an active or unstable hazard
+        
+        Checked before answering a turn without the Action Agent, since the
+        assessment extraction may have missed what the reply says.
+        """
+        last_reply = self._last_victim_reply()
+        return bool(_ACTIVE_DANGER_RE.search(last_reply) or _UNSTABLE_RE.search(last_reply))
+    
+    def _last_victim_reply(self) -> str:
+        """The victim's most recent reply among the recent exchanges, or "" """
+        for entry in reversed(self._recent_exchanges):
+            if entry['type'] == "victim":
+                return entry['content']
+        return ""
+    
+    def _decision_cache_key(self, assessment: Dict, comfort_assessment: Optional[Dict] = None) -> str:
+        """
+        Hash the state the Action Agent decides on: situation context, phase,
+        phase turn bucket, quantized assessments and the victim's last reply
+        
+        The robot's question is left out since it is freshly generated every turn
+        and never repeats; what the victim said is reduced to its content words.
+        """
+        last_reply = self._last_victim_reply()
+        phase_turn = self.phase_1_turns if self.current_phase == 1 else self.phase_2_turns
+        state = (
+            self._situation_digest,
+            self.current_phase,
+            bisect.bisect_right(_DECISION_TURN_BOUNDS, phase_turn),
+            _canonical_assessment(assessment),
+            _canonical_assessment(comfort_assessment) if self.current_phase == 2 else (),
+            _canonical_value("", last_reply)
+        )
+        return hashlib.sha1(repr(state).encode('utf-8')).hexdigest()
+    
+    def _handle_phase_1_action_decision(self, decision: ActionDecision,
+                                        assessment: Optional[Dict] = None) -> Mapping:
         """
         Handle action decision during Phase 1.
         
+        Args:
+            decision: The Action Agent's decision for this turn
+            assessment: The turn's assessment snapshot; taken from the agent if omitted
+        
         Returns:
-            Dict with should_exit (bool), exit_reason (str), and optional next_phase (int)
+            Read-only mapping with should_exit (bool), exit_reason (str), and optional next_phase (int)
         """
-        # Emergency abort - ONLY for active immediate danger when victim is immobile
+        if assessment is None:
+            assessment = self.assessment_agent.get_assessment()
+        handler = self._phase_1_handlers.get(decision.primary_action, self._unknown_action)
+        return handler(decision, assessment)
+    
+    def _phase_1_abort(self, decision: ActionDecision, assessment: Dict) -> Mapping:
+        """Emergency abort - ONLY for active immediate danger when victim is immobile"""
         # Examples: fire spreading NOW, ceiling collapsing NOW, smoke filling room NOW
         # NOT for: unstable furniture, cracks in walls, settled debris
-        if decision.should_abort():
-            assessment = self.assessment_agent.get_assessment()
-            immediate_danger = assessment.get('immediate_danger', 'unknown')
-            
-            # Check if this is truly ACTIVE immediate danger requiring robot to leave
-            is_active_danger = any(keyword in str(immediate_danger).lower() for keyword in [
-                'fire', 'burning', 'collapsing', 'collapse now', 'smoke filling',
-                'gas leak', 'flooding', 'rising water', 'electrical', 'sparks'
-            ])
-            
-            if not is_active_danger and 'unstable' in str(immediate_danger).lower():
-                # Unstable structure but not actively collapsing - override abort to Phase 2
-                if self.verbose:
-                    print("\n⚠️  ABORT OVERRIDDEN: Potential danger detected but not active/immediate")
-                    print(f"   Danger: {immediate_danger}")
-                    print("   → Robot can safely remain to gather medical information")
-                    print("   → Transitioning to Phase 2 instead of aborting")
-                
-                return {
-                    "should_exit": True,
-                    "exit_reason": "transition_to_phase_2",
-                    "next_phase": 2
-                }
-            
-            # True active danger - abort
-            if self.verbose:
-                print("\n🚨 ABORTING Phase 1: " + decision.reasoning)
-                print("   Robot will leave area and alert command center for specialized rescue")
-            return {
-                "should_exit": True,
-                "exit_reason": "abort_and_alert",
-                "next_phase": None
-            }
+        immediate_danger = assessment.get('immediate_danger', 'unknown')
         
-        # Immediate evacuation - ambulatory victim, safe to move
-        if decision.should_evacuate():
-            if self.verbose:
-                print("\n🏃 EVACUATING IMMEDIATELY: " + decision.reasoning)
-                print("   Skipping Phase 2 - guiding victim to safe zone")
-            return {
-                "should_exit": True,
-                "exit_reason": "immediate_evacuation",
-                "next_phase": None
-            }
+        # Check if this is truly ACTIVE immediate danger requiring robot to leave
+        is_active_danger = _ACTIVE_DANGER_RE.search(str(immediate_danger)) is not None
         
-        # Transition to Phase 2 - SAFETY GUARD
-        if decision.should_transition_phase_2():
-            # Deterministic safety check: block early transitions unless we have critical info
-            assessment = self.assessment_agent.get_assessment()
-            
-            # Allow transition only if:
-            # 1. Immediate danger is detected (must abort or evacuate - should not reach here)
-            # 2. Victim mobility is confirmed (can_walk OR stuck_trapped is known)
-            # 3. We've gathered enough turns (minimum 3 turns to establish baseline)
-            
-            mobility_known = (
-                assessment.get('can_walk', 'unknown') != 'unknown' or
-                assessment.get('stuck_trapped', 'unknown') != 'unknown'
-            )
-            
-            min_turns_met = self.phase_1_turns >= 3
-            
-            if not mobility_known or not min_turns_met:
-                # Override transition - continue Phase 1 assessment
-                if self.verbose:
-                    print("\n⚠️  TRANSITION BLOCKED: Insufficient safety data")
-                    print(f"   • Mobility known: {mobility_known}")
-                    print(f"   • Min turns (3): {min_turns_met} (current: {self.phase_1_turns})")
-                    print("   • Continuing Phase 1 assessment to gather critical safety information")
-                
-                return {
-                    "should_exit": False,
-                    "exit_reason": None
-                }
-            
-            # Safety check passed - allow transition
+        if not is_active_danger and _UNSTABLE_RE.search(str(immediate_danger)):
+            # Unstable structure but not actively collapsing - override abort to Phase 2
             if self.verbose:
-                print("\n➡️  TRANSITIONING TO PHASE 2: " + decision.reasoning)
-                print("   ✓ Safety criteria met:")
-                print(f"     • Mobility status: known")
-                print(f"     • Assessment turns: {self.phase_1_turns}")
-            return {
-                "should_exit": True,
-                "exit_reason": "transition_to_phase_2",
-                "next_phase": 2
-            }
+                logger.info(
+                    "\n⚠️  ABORT OVERRIDDEN: Potential danger detected but not active/immediate\n"
+                    "   Danger: %s\n"
+                    "   → Robot can safely remain to gather medical information\n"
+                    "   → Transitioning to Phase 2 instead of aborting",
+                    immediate_danger
+                )
+            
+            return _TRANSITION_TO_PHASE_2
         
-        # Continue Phase 1 conversation
-        if decision.should_continue_phase():
-            return {
-                "should_exit": False,
-                "exit_reason": None
-            }
+        # True active danger - abort
+        if self.verbose:
+            logger.info("\n🚨 ABORTING Phase 1: %s\n"
+                        "   Robot will leave area and alert command center for specialized rescue",
+                        decision.reasoning)
+        return _ABORT_AND_ALERT
+    
+    def _phase_1_evacuate(self, decision: ActionDecision, assessment: Dict) -> Mapping:
+        """Immediate evacuation - ambulatory victim, safe to move"""
+        if self.verbose:
+            logger.info("\n🏃 EVACUATING IMMEDIATELY: %s\n   Skipping Phase 2 - guiding victim to safe zone",
+                        decision.reasoning)
+        return _IMMEDIATE_EVACUATION
+    
+    def _phase_1_transition(self, decision: ActionDecision, assessment: Dict) -> Mapping:
+        """Transition to Phase 2 - SAFETY GUARD"""
+        # Deterministic safety check: block early transitions unless we have critical info
+        # Allow transition only if:
+        # 1. Immediate danger is detected (must abort or evacuate - should not reach here)
+        # 2. Victim mobility is confirmed (can_walk OR stuck_trapped is known)
+        # 3. We've gathered enough turns (PHASE_1_MIN_TURNS to establish baseline)
+        
+        mobility_known = (
+            assessment.get('can_walk', 'unknown') != 'unknown' or
+            assessment.get('stuck_trapped', 'unknown') != 'unknown'
+        )
+        
+        min_turns_met = self.phase_1_turns >= PHASE_1_MIN_TURNS
+        
+        if not mobility_known or not min_turns_met:
+            # Override transition - continue Phase 1 assessment
+            if self.verbose:
+                logger.info(
+                    "\n⚠️  TRANSITION BLOCKED: Insufficient safety data\n"
+                    "   • Mobility known: %s\n"
+                    "   • Min turns (%d): %s (current: %d)\n"
+                    "   • Continuing Phase 1 assessment to gather critical safety information",
+                    mobility_known, PHASE_1_MIN_TURNS, min_turns_met, self.phase_1_turns
+                )
+            
+            return _CONTINUE
         
-        # Unknown action - default to continue
+        # Safety check passed - allow transition
         if self.verbose:
-            print(f"\n⚠️  Unknown action: {decision.primary_action} - defaulting to continue")
-        return {
-            "should_exit": False,
-            "exit_reason": None
-        }
+            logger.info(
+                "\n➡️  TRANSITIONING TO PHASE 2: %s\n"
+                "   ✓ Safety criteria met:\n"
+                "     • Mobility status: known\n"
+                "     • Assessment turns: %d",
+                decision.reasoning, self.phase_1_turns
+            )
+        return _TRANSITION_TO_PHASE_2
+    
+    def _continue_phase(self, decision: ActionDecision, assessment: Optional[Dict] = None) -> Mapping:
+        """Continue the current phase's conversation"""
+        return _CONTINUE
+    
+    def _unknown_action(self, decision: ActionDecision, assessment: Optional[Dict] = None) -> Mapping:
+        """Unknown action - default to continue"""
+        if self.verbose:
+            logger.warning("\n⚠️  Unknown action: %s - defaulting to continue", decision.primary_action)
+        return _CONTINUE
     
-    def _handle_phase_2_action_decision(self, decision: ActionDecision) -> Dict:
+    def _handle_phase_2_action_decision(self, decision: ActionDecision) -> Mapping:
         """
         Handle action decision during Phase 2.
         
         Returns:
-            Dict with should_exit (bool) and exit_reason (str)
+            Read-only mapping with should_exit (bool) and exit_reason (str)
         """
-        # Emergency situation detected
-        if decision.should_abort() or decision.is_emergency():
-            if self.verbose:
-                print("\n🚨 EMERGENCY DETECTED: " + decision.reasoning)
-                print(f"   Urgency Level: {decision.urgency_level}")
-            return {
-                "should_exit": True,
-                "exit_reason": "emergency_detected"
-            }
-        
-        # Immediate evacuation (for ambulatory victims with sufficient info)
-        if decision.should_evacuate():
+        # Emergency urgency overrides whatever action was chosen
+        if decision.is_emergency():
+            return self._phase_2_emergency(decision)
+        handler = self._phase_2_handlers.get(decision.primary_action, self._unknown_action)
+        return handler(decision)
+    
+    def _phase_2_decision_exits(self, decision: ActionDecision) -> bool:
+        """Whether _handle_phase_2_action_decision would end Phase 2, without acting on it"""
+        if decision.is_emergency():
+            return True
+        return self._phase_2_handlers.get(decision.primary_action) not in (self._phase_2_continue, None)
+    
+    def _phase_2_emergency(self, decision: ActionDecision) -> Mapping:
+        """Emergency situation detected"""
+        if self.verbose:
+            logger.info("\n🚨 EMERGENCY DETECTED: %s\n   Urgency Level: %s",
+                        decision.reasoning, decision.urgency_level)
+        return _EMERGENCY_DETECTED
+    
+    def _phase_2_evacuate(self, decision: ActionDecision) -> Mapping:
+        """Immediate evacuation (for ambulatory victims with sufficient info)"""
+        if self.verbose:
+            logger.info("\n🏃 EVACUATING NOW: %s\n"
+                        "   Sufficient medical information gathered - proceeding to safe zone",
+                        decision.reasoning)
+        return _EVACUATION_READY
+    
+    def _phase_2_complete(self, decision: ActionDecision) -> Mapping:
+        """Phase 2 complete"""
+        if self.verbose:
+            logger.info("\n✅ PHASE 2 COMPLETE: %s", decision.reasoning)
+        return _PHASE_2_COMPLETE
+    
+    def _phase_2_continue(self, decision: ActionDecision) -> Mapping:
+        """Continue Phase 2 conversation"""
+        # Check for priority escalation even if continuing
+        if decision.alert_command_center and decision.urgency_level in ["priority", "critical"]:
             if self.verbose:
-                print("\n🏃 EVACUATING NOW: " + decision.reasoning)
-                print("   Sufficient medical information gathered - proceeding to safe zone")
-            return {
-                "should_exit": True,
-                "exit_reason": "evacuation_ready"
-            }
+                logger.info("\n⚠️  PRIORITY ESCALATION: %s\n"
+                            "   Continuing Phase 2 but alerting command center (%s)",
+                            decision.reasoning, decision.urgency_level)
+        return _CONTINUE
+    
+    def _speculate_next_phase_1_question(self, cancel: threading.Event) -> Tuple[str, str]:
+        """
+        Draft the question that would follow SPECULATIVE_VICTIM_RESPONSE
         
-        # Phase 2 complete
-        if decision.should_complete():
-            if self.verbose:
-                print("\n✅ PHASE 2 COMPLETE: " + decision.reasoning)
-            return {
-                "should_exit": True,
-                "exit_reason": "phase_2_complete"
-            }
+        Runs on the agent pool while waiting for the victim. The field being
+        asked is assumed answered, so the draft targets the one after it.
+        The LLM call is abandoned when cancel is set.
         
-        # Continue Phase 2 conversation
-        if decision.should_continue_phase():
-            # Check for priority escalation even if continuing
-            if decision.alert_command_center and decision.urgency_level in ["priority", "critical"]:
-                if self.verbose:
-                    print(f"\n⚠️  PRIORITY ESCALATION: {decision.reasoning}")
-                    print(f"   Continuing Phase 2 but alerting command center ({decision.urgency_level})")
-            return {
-                "should_exit": False,
-                "exit_reason": None
-            }
+        Returns:
+            (field, question) - both empty if there is nothing to draft
+        """
+        remaining = self.assessment_agent.get_incomplete_categories()
+        if len(remaining) < 2:
+            return "", ""
+        next_field = remaining[1]
+        
+        # Build the prompt on a shallow copy so the real dialogue history is untouched
+        agent = copy.copy(self.dialog_agent)
+        agent.conversation_history = self.dialog_agent.conversation_history + [
+            {"role": "victim", "content": SPECULATIVE_VICTIM_RESPONSE}
+        ]
+        prompt = agent.build_prompt(self.assessment_agent.get_assessment(), next_field)
+        question = self.dialog_agent.get_llm_response(prompt, cancel=cancel)
+        return next_field, question or ""
+    
+    def _take_speculative_question(self, speculation, victim_response: str) -> str:
+        """
+        Return the drafted question if the victim's reply matched the assumed one
         
-        # Unknown action - default to continue
-        if self.verbose:
-            print(f"\n⚠️  Unknown action: {decision.primary_action} - defaulting to continue")
-        return {
-            "should_exit": False,
-            "exit_reason": None
-        }
+        Must be called after the assessment update, so the next priority field
+        can be compared with the field the draft was written for.
+        """
+        if not speculation.done():
+            speculation.cancel()
+            return ""
+        field, question = speculation.result()
+        if not question or field != self.assessment_agent.get_next_priority_field():
+            return ""
+        ratio = difflib.SequenceMatcher(
+            None, victim_response.strip().lower().rstrip('.!'), SPECULATIVE_VICTIM_RESPONSE
+        ).ratio()
+        return question if ratio >= SPECULATIVE_MATCH_RATIO else ""
     
-    def _generate_next_phase_1_question(self) -> str:
-        """Generate next Phase 1 assessment question"""
+    def _generate_next_phase_1_question(self, speculative_question: str = "") -> Tuple[Optional[str], float]:
+        """
+        Generate next Phase 1 assessment question
+        
+        Runs on the agent pool, so it touches neither the conversation log nor
+        the dialogue history; the caller records the question once the Action
+        Agent lets the phase continue.
+        
+        Args:
+            speculative_question: Question drafted during the STT wait, used
+                instead of a new LLM call when given
+        
+        Returns:
+            (question, elapsed) - question is "" when the assessment is complete
+            and None when the Dialogue Agent failed
+        """
         assessment = self.assessment_agent.get_assessment()
         is_complete = self.assessment_agent.is_assessment_complete()
         next_field = self.assessment_agent.get_next_priority_field()
         
         if not next_field or is_complete:
-            return ""  # Assessment complete
+            return "", 0.0  # Assessment complete
         
         start_time = time.time()
-        robot_question = self.dialog_agent.get_next_response(
-            assessment,
-            is_complete,
-            next_field
-        )
+        if speculative_question:
+            robot_question = speculative_question
+        else:
+            # What get_next_response does for an incomplete assessment, minus the history update
+            prompt = self.dialog_agent.build_prompt(assessment, next_field)
+            robot_question = self.dialog_agent.get_llm_response(prompt)
         elapsed = time.time() - start_time
         
-        if robot_question == False:
-            return None
+        if not robot_question:
+            return None, elapsed
 
 
-        self.timing_data['dialogue_agent'].append({
-            'turn': self.phase_1_turns,
-            'duration': elapsed,
-            'phase': 1
-        })
+        self._record_timing('dialogue_agent', self.phase_1_turns, elapsed, 1)
         
-        if self.verbose:
-            print(f"\n🤖 Robot: {robot_question}")
-            print(f"⏱️  Dialogue Agent: {elapsed:.2f}s")
-        
-        self._add_to_conversation_log(1, self.phase_1_turns, "robot", robot_question, elapsed)
+        return robot_question, elapsed
+    
+    def _update_comfort_and_generate(self, robot_message: str, victim_response: str,
+                                     skip_message: threading.Event) -> Tuple[Dict, Tuple[str, float]]:
+        """
+        Pool task for a Phase 2 turn: update the comfort assessment, then generate
+        the next comfort message from it unless the turn is already known to end.
         
-        return robot_question
+        Returns:
+            (comfort_updates, (message, elapsed))
+        """
+        updates = self._update_comfort_assessment(robot_message, victim_response)
+        if skip_message.is_set():
+            return updates, ("", 0.0)
+        return updates, self._generate_next_phase_2_message()
     
-    def _generate_next_phase_2_message(self) -> str:
-        """Generate next Phase 2 comfort message"""
+    def _generate_next_phase_2_message(self) -> Tuple[str, float]:
+        """
+        Generate next Phase 2 comfort message
+        
+        Like _generate_next_phase_1_question, logging is left to the caller.
+        
+        Returns:
+            (message, elapsed) - message is "" when the comfort assessment is complete
+        """
         is_complete = self.comfort_assessment_agent.is_assessment_complete()
         next_field = self.comfort_assessment_agent.get_next_priority_field()
         
         if not next_field or is_complete:
-            return ""  # Comfort assessment complete
+            return "", 0.0  # Comfort assessment complete
         
         start_time = time.time()
         robot_message = self.comfort_agent.get_next_response(
@@ -1039,67 +1659,147 @@ class PhaseController:
         )
         elapsed = time.time() - start_time
         
-        self.timing_data['comfort_agent'].append({
-            'turn': self.phase_2_turns,
-            'duration': elapsed,
-            'phase': 2
-        })
+        self._record_timing('comfort_agent', self.phase_2_turns, elapsed, 2)
         
+        return robot_message, elapsed
+    
+    def _log_robot_message(self, phase: int, turn: int, message: str, elapsed: float):
+        """Print and log a generated robot message once it is going to be spoken"""
         if self.verbose:
-            print(f"\n🤖 Robot: {robot_message}")
-            print(f"⏱️  Comfort Agent: {elapsed:.2f}s")
+            agent_name = "Dialogue Agent" if phase == 1 else "Comfort Agent"
+            logger.info("\n🤖 Robot: %s\n⏱️  %s: %.2fs", message, agent_name, elapsed)
         
-        self._add_to_conversation_log(2, self.phase_2_turns, "robot", robot_message, elapsed)
-        
-        return robot_message
+        self._add_to_conversation_log(phase, turn, "robot", message, elapsed)
     
     def _perform_final_triage(self) -> str:
         """Perform final triage assessment"""
         if self.verbose:
-            print("\n" + "="*80)
-            print("🏥 FINAL TRIAGE ASSESSMENT")
-            print("="*80)
+            logger.info("\n%s\n🏥 FINAL TRIAGE ASSESSMENT\n%s", _BANNER_RULE, _BANNER_RULE)
         
         start_time = time.time()
         
         phase_1 = self.assessment_agent.get_assessment()
         phase_2 = self.comfort_assessment_agent.get_assessment()
         
-        priority = self.triage_agent.assign_triage_priority(phase_1, phase_2)
+        speculative, self._speculative_triage = self._speculative_triage, None
+        if speculative is not None and speculative[0] == phase_1 and speculative[1] == phase_2:
+            priority = speculative[2].result()
+        else:
+            if speculative is not None:
+                speculative[2].cancel()
+            priority = self.triage_agent.assign_triage_priority(phase_1, phase_2)
         
         elapsed = time.time() - start_time
         
         if self.verbose:
-            print(f"Priority: {priority}")
-            print(f"⏱️  Triage Agent: {elapsed:.2f}s")
+            logger.info("Priority: %s\n⏱️  Triage Agent: %.2fs", priority, elapsed)
         
         return priority
     
+    def _record_timing(self, agent: str, turn: int, duration: float, phase: Optional[int]):
+        """Append one timed agent call to that agent's timing columns"""
+        with self._timing_lock:
+            columns = self._timings[agent]
+            n = columns['n']
+            if n == len(columns['duration']):
+                for name, dtype in _TIMING_COLUMNS:
+                    grown = np.empty(2 * n, dtype=dtype)
+                    grown[:n] = columns[name]
+                    columns[name] = grown
+            columns['turn'][n] = turn
+            columns['duration'][n] = duration
+            columns['phase'][n] = phase or 0
+            columns['n'] = n + 1
+    
+    @property
+    def timing_data(self) -> Dict[str, List[Dict]]:
+        """Timing entries per agent as {'turn', 'duration', 'phase'} dicts, built on demand"""
+        timing_data = {}
+        with self._timing_lock:
+            for agent, columns in self._timings.items():
+                n = columns['n']
+                timing_data[agent] = [
+                    {'turn': turn, 'duration': duration, 'phase': phase or None}
+                    for turn, duration, phase in zip(
+                        columns['turn'][:n].tolist(),
+                        columns['duration'][:n].tolist(),
+                        columns['phase'][:n].tolist()
+                    )
+                ]
+        return timing_data
+    
+    def _timing_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-agent call count, total, mean and p50/p95/max durations from the timing columns"""
+        with self._timing_lock:
+            all_durations = {
+                agent: columns['duration'][:columns['n']].copy()
+                for agent, columns in self._timings.items()
+            }
+        stats = {}
+        for agent, durations in all_durations.items():
+            if not durations.size:
+                continue
+            p50, p95, slowest = np.percentile(durations, [50, 95, 100])
+            stats[agent] = {
+                'calls': int(durations.size),
+                'total': float(durations.sum()),
+                'mean': float(durations.mean()),
+                'p50': float(p50),
+                'p95': float(p95),
+                'max': float(slowest)
+            }
+        return stats
+    
     def _add_to_conversation_log(self, phase: int, turn: int, role: str, content: str, timing: float):
         """Add entry to conversation log"""
-        self.conversation_history.append({
+        entry = {
             'phase': phase,
             'turn': turn,
             'type': role,
             'content': content,
             'timing': timing
-        })
+        }
+        self.conversation_history.append(entry)
+        self._recent_exchanges.append(entry)
+        
+        # Formatted now so the report only has to join the transcript
+        role_label = "🤖 Robot" if role == 'robot' else "👤 Victim"
+        self._report_blocks.append(_REPORT_TRANSCRIPT.format(
+            i=len(self.conversation_history), role=role_label, phase=phase, turn=turn,
+            content=content, timing=timing
+        ))
+    
+    def _speculation_hits(self) -> Tuple[int, int]:
+        """(drafted Phase 1 questions that were spoken, Phase 1 turns a draft was checked on)"""
+        outcomes = [entry['speculative_question'] for entry in self.action_decisions
+                    if 'speculative_question' in entry]
+        return outcomes.count("hit"), len(outcomes)
     
     def _print_final_summary(self, results: Dict):
         """Print final summary of workflow execution"""
-        print("\n" + "="*80)
-        print("📊 WORKFLOW SUMMARY")
-        print("="*80)
-        print(f"Entry Phase: {results['entry_phase']}")
-        print(f"Phase 1 Executed: {results['phase_1_executed']}")
-        print(f"Phase 2 Executed: {results['phase_2_executed']}")
-        print(f"Total Turns: {self.turn_count}")
-        print(f"Phase 1 Turns: {self.phase_1_turns}")
-        print(f"Phase 2 Turns: {self.phase_2_turns}")
-        print(f"Action Decisions Made: {len(self.action_decisions)}")
-        print(f"Triage Priority: {results['triage_priority']}")
-        print(f"Exit Reason: {results['exit_reason']}")
-        print("="*80 + "\n")
+        lines = [
+            "\n" + _BANNER_RULE,
+            "📊 WORKFLOW SUMMARY",
+            _BANNER_RULE,
+            f"Entry Phase: {results['entry_phase']}",
+            f"Phase 1 Executed: {results['phase_1_executed']}",
+            f"Phase 2 Executed: {results['phase_2_executed']}",
+            f"Total Turns: {self.turn_count}",
+            f"Phase 1 Turns: {self.phase_1_turns}",
+            f"Phase 2 Turns: {self.phase_2_turns}",
+            f"Action Decisions Made: {len(self.action_decisions)}"
+        ]
+        hits, drafts = self._speculation_hits()
+        if drafts:
+            lines.append(f"Speculative Questions Used: {hits}/{drafts} ({hits / drafts:.0%})")
+        lines.append(f"Triage Priority: {results['triage_priority']}")
+        lines.append(f"Exit Reason: {results['exit_reason']}")
+        for agent, stats in self._timing_stats().items():
+            lines.append(f"⏱️  {agent}: {stats['calls']} calls, p50 {stats['p50']:.2f}s, "
+                         f"p95 {stats['p95']:.2f}s, max {stats['max']:.2f}s")
+        lines.append(_BANNER_RULE + "\n")
+        # Once per workflow, so it is formatted here and logged as one record
+        logger.info("\n".join(lines))
     
     def handle_action_decision(self, decision: Dict) -> str:
         """
@@ -1115,24 +1815,10 @@ class PhaseController:
         action = decision.get("primary_action", "continue_conversation")
         
         # Log the decision
-        self.action_decisions.append({
-            'turn': self.turn_count,
-            'phase': self.current_phase,
-            'decision': decision
-        })
+        self._log_decision(ActionDecision.from_raw(decision))
         
         # Map actions to next steps
-        action_map = {
-            "continue_conversation": "CONTINUE_PHASE",
-            "transition_to_phase_2": "TRANSITION_PHASE_2",
-            "evacuate_immediately": "EVACUATE_NOW",
-            "abort_and_alert": "ABORT_AND_ALERT",
-            "maintain_and_monitor": "MAINTAIN_MONITOR",
-            "emergency_alert": "EMERGENCY_ALERT",
-            "complete": "COMPLETE"
-        }
-        
-        next_step = action_map.get(action, "CONTINUE_PHASE")
+        next_step = _NEXT_STEPS.get(action, "CONTINUE_PHASE")
         
         # Handle command center alerts
         if decision.get("alert_command_center", False):
@@ -1147,8 +1833,6 @@ class PhaseController:
         Args:
             decision: Action decision with alert details
         """
-        import time
-        
         urgency = decision.get("urgency_level", "routine")
         reasoning = decision.get("reasoning", "No reason provided")
         equipment = decision.get("specialized_equipment_needed", [])
@@ -1165,40 +1849,32 @@ class PhaseController:
             "comfort_assessment": self.comfort_assessment_agent.get_assessment() if self.current_phase == 2 else {}
         }
         
-        # Send via MQTT if available
-        mqtt_sent = False
-        if hasattr(self, 'mqtt_manager') and self.mqtt_manager is not None:
+        # Hand over to the alert publisher if MQTT is available
+        alert_queued = False
+        if self.mqtt_manager is not None:
             try:
-                mqtt_sent = self.mqtt_manager.publish(
-                    topic="rescue/robot/command_center/alert",
-                    data=alert_data,
-                    qos=1  # At least once delivery
-                )
-            except Exception as e:
-                if self.verbose:
-                    print(f"⚠️  MQTT send failed: {e}")
+                self._alert_queue.put_nowait(alert_data)
+                alert_queued = True
+            except Full:
+                logger.warning("⚠️  Command center alert queue full - %s alert dropped", urgency)
         
         # Console output for debugging/development
         if self.verbose:
-            urgency_colors = {
-                "routine": "\033[94m",  # Blue
-                "priority": "\033[93m",  # Yellow
-                "critical": "\033[91m",  # Red
-                "emergency": "\033[91m\033[1m"  # Bold Red
-            }
-            color = urgency_colors.get(urgency, "\033[94m")
-            reset = "\033[0m"
+            color = _URGENCY_COLORS.get(urgency, _URGENCY_COLORS["routine"])
             
-            status_icon = "✅" if mqtt_sent else "📡"
-            print(f"\n{color}{status_icon} COMMAND CENTER ALERT{reset}")
-            print(f"{color}Urgency: {urgency.upper()}{reset}")
-            print(f"Reason: {reasoning}")
+            status_icon = "✅" if alert_queued else "📡"
+            lines = [
+                f"\n{color}{status_icon} COMMAND CENTER ALERT{_ANSI_RESET}",
+                f"{color}Urgency: {urgency.upper()}{_ANSI_RESET}",
+                f"Reason: {reasoning}"
+            ]
             if equipment:
-                print(f"Equipment Needed: {', '.join(equipment)}")
-            if mqtt_sent:
-                print(f"Status: Sent via MQTT")
-            elif hasattr(self, 'mqtt_manager'):
-                print(f"Status: Queued for MQTT (offline)")
+                lines.append(f"Equipment Needed: {', '.join(equipment)}")
+            if alert_queued:
+                lines.append("Status: Queued for MQTT publish")
+            elif self.mqtt_manager is not None:
+                lines.append("Status: Dropped (alert queue full)")
+            logger.info("\n".join(lines))
     
     def generate_rescue_report(self) -> str:
         """
@@ -1207,84 +1883,60 @@ class PhaseController:
         Returns:
             Formatted markdown report string
         """
-        report_lines = []
-        report_lines.append("# RESCUE ROBOT MISSION REPORT")
-        report_lines.append("")
-        report_lines.append("=" * 80)
-        report_lines.append("")
+        buf = io.StringIO()
+        write = buf.write
+        write("# RESCUE ROBOT MISSION REPORT\n\n")
+        write("=" * 80)
+        write("\n\n")
         
         # Mission Overview
-        report_lines.append("## MISSION OVERVIEW")
-        report_lines.append("")
-        report_lines.append(f"- **Total Turns**: {self.turn_count}")
-        report_lines.append(f"- **Phase 1 Turns**: {self.phase_1_turns}")
-        report_lines.append(f"- **Phase 2 Turns**: {self.phase_2_turns}")
-        report_lines.append(f"- **Action Decisions Made**: {len(self.action_decisions)}")
-        report_lines.append("")
+        write("## MISSION OVERVIEW\n\n")
+        write(f"- **Total Turns**: {self.turn_count}\n")
+        write(f"- **Phase 1 Turns**: {self.phase_1_turns}\n")
+        write(f"- **Phase 2 Turns**: {self.phase_2_turns}\n")
+        write(f"- **Action Decisions Made**: {len(self.action_decisions)}\n")
+        hits, drafts = self._speculation_hits()
+        write(f"- **Speculative Questions Used**: {hits}/{drafts}\n\n")
         
         # Victim Assessment
-        report_lines.append("## VICTIM ASSESSMENT (Phase 1)")
-        report_lines.append("")
+        write("## VICTIM ASSESSMENT (Phase 1)\n\n")
         assessment = self.assessment_agent.get_assessment()
         for key, value in assessment.items():
-            report_lines.append(f"- **{key.replace('_', ' ').title()}**: {value}")
-        report_lines.append("")
+            write(_REPORT_FIELD.format(label=key.replace('_', ' ').title(), value=value))
+        write("\n")
         
         # Comfort Assessment (if Phase 2 executed)
         if self.phase_2_turns > 0:
-            report_lines.append("## COMFORT & SPECIAL NEEDS (Phase 2)")
-            report_lines.append("")
+            write("## COMFORT & SPECIAL NEEDS (Phase 2)\n\n")
             comfort = self.comfort_assessment_agent.get_assessment()
             for key, value in comfort.items():
-                report_lines.append(f"- **{key.replace('_', ' ').title()}**: {value}")
-            report_lines.append("")
+                write(_REPORT_FIELD.format(label=key.replace('_', ' ').title(), value=value))
+            write("\n")
         
         # Triage Priority
         triage_priority = self.assessment_agent.assessment.get("priority", "Not assessed")
-        report_lines.append("## TRIAGE PRIORITY")
-        report_lines.append("")
-        report_lines.append(f"**{triage_priority}**")
-        report_lines.append("")
+        write(f"## TRIAGE PRIORITY\n\n**{triage_priority}**\n\n")
         
         # Action Decisions Summary
-        report_lines.append("## ACTION DECISIONS LOG")
-        report_lines.append("")
+        write("## ACTION DECISIONS LOG\n\n")
         for i, decision_entry in enumerate(self.action_decisions, 1):
-            decision = decision_entry['decision']
-            report_lines.append(f"### Decision {i} (Turn {decision_entry['turn']}, Phase {decision_entry['phase']})")
-            report_lines.append(f"- **Action**: {decision['primary_action']}")
-            report_lines.append(f"- **Alert Command Center**: {decision['alert_command_center']}")
-            report_lines.append(f"- **Urgency Level**: {decision['urgency_level']}")
-            report_lines.append(f"- **Reasoning**: {decision['reasoning']}")
-            if decision.get('specialized_equipment_needed'):
-                report_lines.append(f"- **Equipment Needed**: {', '.join(decision['specialized_equipment_needed'])}")
-            report_lines.append("")
+            write(_REPORT_DECISION.format(i=i, **decision_entry))
+            if decision_entry['specialized_equipment']:
+                write(f"- **Equipment Needed**: {', '.join(decision_entry['specialized_equipment'])}\n")
+            write("\n")
         
         # Timing Analysis
-        report_lines.append("## PERFORMANCE METRICS")
-        report_lines.append("")
-        for agent, timings in self.timing_data.items():
-            if timings:
-                total_time = sum(t['duration'] for t in timings)
-                avg_time = total_time / len(timings)
-                report_lines.append(f"### {agent}")
-                report_lines.append(f"- Total calls: {len(timings)}")
-                report_lines.append(f"- Total time: {total_time:.2f}s")
-                report_lines.append(f"- Average time: {avg_time:.2f}s")
-                report_lines.append("")
+        write("## PERFORMANCE METRICS\n\n")
+        for agent, stats in self._timing_stats().items():
+            write(_REPORT_TIMING.format(agent=agent, **stats))
         
         # Conversation Summary
-        report_lines.append("## CONVERSATION TRANSCRIPT")
-        report_lines.append("")
-        for i, entry in enumerate(self.conversation_history, 1):
-            role = "🤖 Robot" if entry['type'] == 'robot' else "👤 Victim"
-            report_lines.append(f"**{i}. {role}** (Phase {entry['phase']}, Turn {entry['turn']}, {entry['timing']:.2f}s):")
-            report_lines.append(f"> {entry['content']}")
-            report_lines.append("")
-        
-        report_lines.append("=" * 80)
-        report_lines.append("END OF REPORT")
-        
-        return "\n".join(report_lines)
+        write("## CONVERSATION TRANSCRIPT\n\n")
+        write("".join(self._report_blocks))
+        
+        write("=" * 80)
+        write("\nEND OF REPORT")
+        
+        return buf.getvalue()
 
 
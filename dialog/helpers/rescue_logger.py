@@ -0,0 +1,27 @@
+"""
+Rescue Logger Module
+Queue-backed "rescue" logger shared by the PhaseController and the agents
+"""
+import atexit
+import logging
+import logging.handlers
+import sys
+from queue import Queue
+
+
+# Per-turn progress goes through a queue: %-formatting and console I/O happen on
+# the listener thread instead of in the conversation loop. The agents log to
+# children of this logger ("rescue.agents.*") and share the queue
+logger = logging.getLogger("rescue")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+_log_queue: "Queue[logging.LogRecord]" = Queue(-1)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+
+# stdout, where the rest of the dialog manager's console output goes
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _console_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
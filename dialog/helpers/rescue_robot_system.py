@@ -2,10 +2,15 @@
 Rescue Robot System - Main System Class
 Coordinates all components of the rescue robot system
 """
+import hashlib
+import json
+import requests
+from functools import cached_property
 from typing import Dict, Optional
 from helpers.audio_manager import AudioManager
 from helpers.conversation_manager import ConversationManager
 from helpers.config_manager import ConfigManager
+import helpers.rescue_logger  # Console handler for the agents' "rescue.*" loggers
 from agents.assessment_agent import AssessmentAgent
 from agents.dialog_agent import DialogueAgent
 from agents.triage_agent import TriageAgent
@@ -30,44 +35,15 @@ class RescueRobotSystem:
         self.local = local
         self.event = event
         self.use_phase_controller = use_phase_controller
+        self.report_queue = report_queue
+        self.loop = loop
         
-        # Initialize agents
-        model_config = config.get_model_config_dict()
-        self.assessment_agent = AssessmentAgent(
-            model_config['model_name'],
-            model_config['assessment_prompt_path'],
-            model_config['ollama_base_url']
-        )
-        self.dialogue_agent = DialogueAgent(
-            model_config['model_name'],
-            model_config['dialogue_prompt_path'],
-            config.audio_config.empathy_level,
-            model_config['ollama_base_url'],
-            model_config['language']
-        )
-        self.triage_agent = TriageAgent(
-            model_config['model_name'],
-            model_config['triage_prompt_path'],
-            model_config['ollama_base_url']
-        )
-        self.action_agent = ActionAgent(
-            model_config['model_name'],
-            model_config['ollama_base_url']
-        )
-        # Initialize comfort agents if using phase controller
-        if use_phase_controller:
-            self.comfort_agent = ComfortAgent(
-                model_config['model_name'],
-                model_config.get('comfort_prompt_path', 'prompts/comfort_prompt.txt'),
-                model_config['ollama_base_url'],
-                model_config['language']
-            )
-            
-            self.comfort_assessment_agent = ComfortAssessmentAgent(
-                model_config['model_name'],
-                model_config.get('comfort_assessment_prompt_path', 'prompts/comfort_assessment_prompt.txt'),
-                model_config['ollama_base_url']
-            )
+        # Agents are created on first use (see the properties below)
+        self._model_config = config.get_model_config_dict()
+        # One HTTP session for every agent, so Ollama calls reuse kept-alive connections
+        self._http = requests.Session()
+        # Triage priorities by assessment digest: an unchanged assessment is not re-triaged
+        self._triage_cache: Dict[str, str] = {}
         if local:
             # Initialize audio manager
             audio_config = config.get_audio_config_dict()
@@ -77,22 +53,11 @@ class RescueRobotSystem:
 
         print(f"Using PhaseController: {self.use_phase_controller}\n")
         
+        # The PhaseController, and with it every agent, is only built once the
+        # conversation starts (see run_conversation); the speech module's retained
+        # handshake is still there when it subscribes
+        self.phase_controller = None
         if use_phase_controller:
-            from helpers.phase_controller import PhaseController
-            self.phase_controller = PhaseController(
-                dialog_agent=self.dialogue_agent,
-                assessment_agent=self.assessment_agent,
-                comfort_agent=self.comfort_agent,
-                comfort_assessment_agent=self.comfort_assessment_agent,
-                action_agent=self.action_agent,
-                triage_agent=self.triage_agent,
-                report_queue=report_queue,
-                loop=loop,
-                event=event,
-                robotname=self.config.conversation_config.robot_name,
-                verbose=True, # Enable verbose output for debugging
-                local=self.local,
-            )
             self.conversation_manager = None
         else:
             self.conversation_manager = ConversationManager(
@@ -105,7 +70,6 @@ class RescueRobotSystem:
                 loop,
                 event
             )
-            self.phase_controller = None
         
         # Set default location
         #self.update_gps_location(
@@ -114,6 +78,86 @@ class RescueRobotSystem:
         #    config.location_config.description
         #)
     
+    @cached_property
+    def assessment_agent(self) -> AssessmentAgent:
+        model_config = self._model_config
+        return AssessmentAgent(
+            model_config['model_name'],
+            model_config['assessment_prompt_path'],
+            model_config['ollama_base_url'],
+            session=self._http
+        )
+    
+    @cached_property
+    def dialogue_agent(self) -> DialogueAgent:
+        model_config = self._model_config
+        return DialogueAgent(
+            model_config['model_name'],
+            model_config['dialogue_prompt_path'],
+            self.config.audio_config.empathy_level,
+            model_config['ollama_base_url'],
+            model_config['language'],
+            session=self._http
+        )
+    
+    @cached_property
+    def triage_agent(self) -> TriageAgent:
+        model_config = self._model_config
+        return TriageAgent(
+            model_config['model_name'],
+            model_config['triage_prompt_path'],
+            model_config['ollama_base_url'],
+            session=self._http
+        )
+    
+    @cached_property
+    def action_agent(self) -> ActionAgent:
+        model_config = self._model_config
+        return ActionAgent(
+            model_config['model_name'],
+            model_config['ollama_base_url'],
+            session=self._http
+        )
+    
+    @cached_property
+    def comfort_agent(self) -> ComfortAgent:
+        model_config = self._model_config
+        return ComfortAgent(
+            model_config['model_name'],
+            model_config.get('comfort_prompt_path', 'prompts/comfort_prompt.txt'),
+            model_config['ollama_base_url'],
+            model_config['language'],
+            session=self._http
+        )
+    
+    @cached_property
+    def comfort_assessment_agent(self) -> ComfortAssessmentAgent:
+        model_config = self._model_config
+        return ComfortAssessmentAgent(
+            model_config['model_name'],
+            model_config.get('comfort_assessment_prompt_path', 'prompts/comfort_assessment_prompt.txt'),
+            model_config['ollama_base_url'],
+            session=self._http
+        )
+    
+    def _create_phase_controller(self):
+        """Build the PhaseController around this system's agents"""
+        from helpers.phase_controller import PhaseController
+        return PhaseController(
+            dialog_agent=self.dialogue_agent,
+            assessment_agent=self.assessment_agent,
+            comfort_agent=self.comfort_agent,
+            comfort_assessment_agent=self.comfort_assessment_agent,
+            action_agent=self.action_agent,
+            triage_agent=self.triage_agent,
+            report_queue=self.report_queue,
+            loop=self.loop,
+            event=self.event,
+            robotname=self.config.conversation_config.robot_name,
+            verbose=True, # Enable verbose output for debugging
+            local=self.local,
+        )
+    
     def update_gps_location(self, latitude: float, longitude: float, description: str = ""):
         """
         Update the location from the robot's GPS system
@@ -124,6 +168,7 @@ class RescueRobotSystem:
             description: Human-readable location description
         """
         self.assessment_agent.update_gps_location(latitude, longitude, description)
+        self._triage_cache.clear()
         print(f"Location updated: {description} ({latitude}, {longitude})")
     
     def perform_triage_assessment(self) -> str:
@@ -133,7 +178,16 @@ class RescueRobotSystem:
         Returns:
             Triage priority (Red, Yellow, Green, or Black)
         """
-        priority = self.triage_agent.assign_triage_priority(self.assessment_agent.assessment)
+        assessment = self.assessment_agent.assessment
+        # The priority written below is the output, not an input of the triage
+        inputs = {key: value for key, value in assessment.items() if key != "priority"}
+        digest = hashlib.blake2b(json.dumps(inputs, sort_keys=True).encode('utf-8'), digest_size=16).hexdigest()
+        priority = self._triage_cache.get(digest)
+        if priority is None:
+            priority = self.triage_agent.assign_triage_priority(assessment)
+            # The default is also the agent's fallback on LLM errors, so it is not kept
+            if priority != self.triage_agent.default_priority:
+                self._triage_cache[digest] = priority
         
         # Update the assessment with the triage priority
         self.assessment_agent.assessment["priority"] = priority
@@ -192,6 +246,8 @@ class RescueRobotSystem:
         try:
             if self.use_phase_controller:
                 # New PhaseController approach with continuous action decisions
+                if self.phase_controller is None:
+                    self.phase_controller = self._create_phase_controller()
                 if situation_context:
                     self.phase_controller.set_situation_context(situation_context)
                 
@@ -309,6 +365,9 @@ class RescueRobotSystem:
         try:
             if self.audio_manager:
                 self.audio_manager.cleanup()
+            if self.phase_controller:
+                self.phase_controller.close()
+            self._http.close()
             print("System cleanup completed")
         except Exception as e:
             print(f"Cleanup warning: {e}")
@@ -2,12 +2,21 @@ import argparse
 import paho.mqtt.client as mqtt
 import time
 import json
+import msgpack
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is the fallback encoder
+    orjson = None
 import queue
+import re
+import threading
+from collections import deque
 import uuid
-import whisper
+import itertools
 import os
-from helpers.audio_manager import AudioManager
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from helpers.audio_manager import AudioManager, WHISPER_COMPUTE_TYPES
 
 
 # ---------------- MQTT CONFIG ---------------- #
@@ -18,21 +27,18 @@ PORT = int(os.getenv('MQTT_PORT', 1883))
 USERNAME = os.getenv('USERNAME', 'inesc')
 PASSWORD = os.getenv('PASSWORD', 'inesc')
 
+# Header msg_ids: a random per-process prefix plus a counter, unique without
+# a uuid4() per message
+_MSG_ID_PREFIX = uuid.uuid4().hex[:16]
+_msg_counter = itertools.count()
 
-def transcribe_wav_file(file_path):
-    # 2. Define the path to your WAV file
-    wav_file_path = file_path
+# Word that opens a dialog in wait_for_help(), per language
+HELP_KEYWORDS = {
+    "en": re.compile(r"\bhelp\b", re.IGNORECASE),
+    "es": re.compile(r"\bayuda\b", re.IGNORECASE),
+    "fr": re.compile(r"\bbonjour\b", re.IGNORECASE),
+}
 
-    try:
-        # 3. Transcribe the audio
-        result = model.transcribe(wav_file_path, fp16=False) # fp16=False is for CPU usage
-        time.sleep(2)
-        return result['text'].strip()
-
-    except FileNotFoundError:
-        print(f"Error: File not found at {wav_file_path}. Please check the path.")
-    except Exception as e:
-        print(f"An error occurred during transcription: {e}")
 
 # ------------------ Argument Parser ------------------ #
 def parse_args():
@@ -43,6 +49,12 @@ def parse_args():
         default="base",
         help="Whisper model to use (default: base)"
     )
+    parser.add_argument(
+        "-q", "--quant",
+        choices=WHISPER_COMPUTE_TYPES,
+        default=None,
+        help="Whisper weight precision with faster-whisper (default: int8 on CPU, float16 on CUDA)"
+    )
     parser.add_argument(
         "-l", "--language",
         choices=["en", "es", "fr"],
@@ -56,12 +68,68 @@ def parse_args():
     )
     return parser.parse_args()
 
+def _loads(payload):
+    """Parse a JSON MQTT payload straight from bytes, via orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+def decode_payload(payload):
+    """The PhaseController sends msgpack, the legacy managers JSON text"""
+    if payload[:1] in (b"{", b"["):
+        return _loads(payload)
+    return msgpack.unpackb(payload, raw=False)
+
+@lru_cache(maxsize=None)
+def stt_topic(robotname):
+    return f"victim/text2speech2text/stt-{robotname}"
+
+def _dumps(obj):
+    """Compact JSON bytes, via orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+_timestamp = [None, ""]  # [second, formatted]
+
+def _utc_timestamp():
+    """UTC header timestamp, formatted at most once per second"""
+    second = int(time.time())
+    if second != _timestamp[0]:
+        _timestamp[:] = [second, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))]
+    return _timestamp[1]
+
+@lru_cache(maxsize=None)
+def _stt_envelope(robotname):
+    """The serialized STT message up to the msg_id value; these header fields never change"""
+    static = _dumps({"sender": "speechModule", "msg_type": "Victim's message", "msg_content": stt_topic(robotname)})
+    return b'{"header":' + static[:-1] + b',"msg_id":"'
+
+def make_stt_payload(robotname, victim_id, message):
+    """Encode a transcribed victim message for the robot's STT topic"""
+    # Only the ids, the timestamp and the data are serialized per message; the
+    # msg_id and timestamp never contain characters JSON needs to escape
+    header_tail = f'{_MSG_ID_PREFIX}-{next(_msg_counter)}","utc_timestamp":"{_utc_timestamp()}"}},"data":'
+    data = _dumps({"victim_id": victim_id, "message": message})
+    return b"".join((_stt_envelope(robotname), header_tail.encode(), data, b"}"))
+
+def load_audio_manager(whisper_model, language, compute_type=None):
+    """Build the AudioManager and, unless SKIP_WARMUP is set, warm up its Whisper model"""
+    audio_manager = AudioManager(whisper_model=whisper_model, language=language, local=False,
+                                 compute_type=compute_type)
+    if not os.getenv('SKIP_WARMUP'):
+        audio_manager.warm_up()
+    return audio_manager
+
 # ------------------ Queues ------------------ #
-tts_queue = queue.Queue()
+# TTS payloads: a single producer (the MQTT thread) and consumer (the main loop),
+# so a deque (atomic append/popleft) plus a wake-up event replaces a locked Queue
+tts_queue = deque(maxlen=512)
+tts_event = threading.Event()
 victim_id_queue = queue.Queue()
 
-def on_connect(client, userdata, flags, rc):
-    if rc == 0:
+def on_connect(client, userdata, flags, reason_code, properties):
+    if reason_code == 0:
         print("✅ Connected to broker")
         # Subscribe to TTS topic
         speech_client.subscribe(f"victim/text2speech2text/tts-{userdata}")
@@ -69,78 +137,47 @@ def on_connect(client, userdata, flags, rc):
         speech_client.subscribe("victim/dialogmanager2/lwt")
         speech_client.publish("victim/text2speech2text/lwt", "online")    
     else:
-        print("❌ Bad connection. Returned code=", rc)
+        print("❌ Bad connection. Returned code=", reason_code)
 
 # ------------------ MQTT CALLBACK ------------------ #
 def on_tts_message(client, userdata, msg):
-    """Receive TTS message from Dialog Manager and add to queue"""
+    """
+    Receive TTS message from Dialog Manager and add to queue
+
+    TTS payloads are queued undecoded; the main loop decodes them, keeping
+    the network thread's work per message minimal
+    """
     msg_topic = msg.topic
     if msg_topic == "victim/dialogmanager2/lwt":
         print(f"Dialog Manager status update: {msg.payload.decode()}")
     elif msg_topic == f"dialogmanager/victim_id/{userdata}":
-        loaded_msg = json.loads(msg.payload.decode())
+        loaded_msg = _loads(msg.payload)
         data = loaded_msg["data"]
         victim_id = data["victim_id"]
         victim_id_queue.put(victim_id)
         print("victim_id: ", victim_id)
     else:
-        try:
-            loaded_msg = json.loads(msg.payload.decode())
-            data = loaded_msg["data"]
-            message = data["message"]
-            print(f"\nUGV: {message}\n")
-            tts_queue.put(data)
-        except Exception as e:
-            print(f"Error in MQTT callback: {e}")
+        tts_queue.append(msg.payload)
+        tts_event.set()
 
 def wait_for_help(audio_manager,speech_client,robotname):
+    keyword = HELP_KEYWORDS[language]
     while True:
         # After speaking, record speech from user
-        if language == "en":
-            keyword = "help"
-        elif language == "es":
-            keyword = "ayuda"
-        elif language == "fr":
-            keyword = "bonjour"    
-                
         new_msg = audio_manager.speech_to_text(max_duration=8)
-        if keyword in new_msg.lower():
-            # Prepare JSON message and publish STT result
+        if keyword.search(new_msg):
+            # Publish STT result. This opens the dialog: retained (the dialog manager
+            # clears it once read) and QoS 1, unlike the per-turn messages
             victim_id = str(uuid.uuid4())
-            json_msg = {
-                "header": {
-                    "sender": "speechModule",
-                    "msg_id": str(uuid.uuid4()),
-                    "utc_timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-                    "msg_type": "Victim's message",
-                    "msg_content": f"victim/text2speech2text/stt-{robotname}"
-                },
-                "data": {
-                    "victim_id": victim_id,
-                    "message": new_msg,
-                }
-            }
-            speech_client.publish(f"victim/text2speech2text/stt-{robotname}", json.dumps(json_msg), retain=True)
+            speech_client.publish(stt_topic(robotname), make_stt_payload(robotname, victim_id, new_msg), qos=1, retain=True)
             print(f"\nVICTIM: {new_msg}")
             break
 
 def wait_for_c2():
     print("waiting for victim_id from the C2")
     victim_id = victim_id_queue.get()
-    json_msg = {
-                "header": {
-                    "sender": "speechModule",
-                    "msg_id": str(uuid.uuid4()),
-                    "utc_timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-                    "msg_type": "Victim's message",
-                    "msg_content": f"victim/text2speech2text/stt-{robotname}"
-                },
-                "data": {
-                    "victim_id": victim_id,
-                    "message": "Help",
-                }
-    }
-    speech_client.publish(f"victim/text2speech2text/stt-{robotname}", json.dumps(json_msg), retain=True)
+    # Opens the dialog: retained (the dialog manager clears it once read) and QoS 1
+    speech_client.publish(stt_topic(robotname), make_stt_payload(robotname, victim_id, "Help"), qos=1, retain=True)
     return victim_id
 
 # ------------------ MAIN SCRIPT ------------------ #
@@ -151,31 +188,59 @@ if __name__ == "__main__":
     robotname = args.robotname
     print(f"[Speech Module] Using Whisper model: {whisper_model}")
 
-    # Initialize AudioManager (loads Whisper model, configures TTS & recording)
-    audio_manager = AudioManager(whisper_model=whisper_model,language=language,local=False)
+    # Initialize AudioManager (loads and warms up the Whisper model, configures TTS
+    # & recording) in the background, so this happens while we connect and wait for the C2
+    loader = ThreadPoolExecutor(max_workers=1)
+    audio_manager_future = loader.submit(load_audio_manager, whisper_model, language, args.quant)
+    loader.shutdown(wait=False)
 
     # Initialize MQTT client
-    speech_client = mqtt.Client(userdata=robotname)
+    # MQTT 5 like the dialog manager's bus: shorter fixed headers on the per-turn traffic
+    speech_client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, userdata=robotname, protocol=mqtt.MQTTv5)
     speech_client.will_set("victim/text2speech2text/lwt", "offline")
     speech_client.on_connect = on_connect
     speech_client.on_message = on_tts_message
     speech_client.username_pw_set(USERNAME,PASSWORD)
-    speech_client.connect(BROKER, PORT)
-    speech_client.loop_start()
+    # Dropped connections are retried with a 1-16 s backoff, including the first one
+    # (the broker may still be starting); keepalive detects a dead broker within ~45 s
+    speech_client.reconnect_delay_set(min_delay=1, max_delay=16)
+    speech_client.connect_async(BROKER, PORT, keepalive=30)
+    mqtt_thread = threading.Thread(target=speech_client.loop_forever, kwargs={"retry_first_connection": True},
+                                   name="mqtt-io", daemon=True)
+    mqtt_thread.start()
 
     
     #wait_for_help(audio_manager,speech_client,robotname)
     print("-----------------------:", robotname)
     victim_id = wait_for_c2()
     print("Its not waiting")
+    audio_manager = audio_manager_future.result()
     n = 0
     while True:
         try:
-            # Check if there is a new TTS message
-            data = tts_queue.get_nowait()
-            tts_text = data["message"]
+            # Wait for the next TTS message; the MQTT callback wakes us as soon as it arrives
+            if not tts_queue:
+                tts_event.clear()
+                # Re-checked after clear() so a message appended in between is not missed
+                if not tts_queue:
+                    tts_event.wait(1.0)
+                continue
+            payload = tts_queue.popleft()
+            data = decode_payload(payload)["data"]
+            messages = [data["message"]]
+            # Messages that queued up back to back are spoken as one utterance,
+            # paying for a single Piper start; the last one decides what follows
+            while tts_queue and not data["last_message"]:
+                data = decode_payload(tts_queue.popleft())["data"]
+                messages.append(data["message"])
+            tts_text = " ".join(messages)
+            print(f"\nUGV: {tts_text}\n")
             last_message = data["last_message"]
             
+            if not last_message:
+                # Connect the microphone while the robot is still speaking
+                audio_manager.prepare_stt_stream()
+            
             # Speak the message (blocking is OK in main thread)
             audio_manager.text_to_speech(tts_text, blocking=True)
 
@@ -184,29 +249,11 @@ if __name__ == "__main__":
                 # After speaking, record speech from user
 
                 new_msg = audio_manager.speech_to_text(max_duration=8)
-                # Prepare JSON message and publish STT result
-                json_msg = {
-                    "header": {
-                        "sender": "speechModule",
-                        "msg_id": str(uuid.uuid4()),
-                        "utc_timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-                        "msg_type": "Victim's message",
-                        "msg_content": f"victim/text2speech2text/stt-{robotname}"
-                    },
-                    "data": {
-                        "victim_id": victim_id,
-                        "message": new_msg
-                        
-
-                    }
-                }
-                speech_client.publish(f"victim/text2speech2text/stt-{robotname}", json.dumps(json_msg))
+                # Publish STT result; a lost turn is re-asked, so QoS 0 and never retained
+                speech_client.publish(stt_topic(robotname), make_stt_payload(robotname, victim_id, new_msg), qos=0, retain=False)
                 print(f"\nVICTIM: {new_msg}")
             else:
                 break    
 
-        except queue.Empty:
-            # No TTS messages pending, just sleep briefly
-            time.sleep(0.1)
         except Exception as e:
             print(f"Error in main loop: {e}")